@@ -3,18 +3,33 @@
 .. include:: ../../README.md
 """  # noqa: RST499
 # stdlib
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any
 
-# local
-from pyspry.base import Settings
-from pyspry.nested_dict import NestedDict
+if TYPE_CHECKING:  # pragma: no cover
+    # local
+    from pyspry.base import Settings
+    from pyspry.nested_dict import NestedDict
 
 __all__ = ["__version__", "NestedDict", "Settings"]
 
 __version__ = "0.0.0"
 
 _logger = logging.getLogger(__name__)
-_logger.debug(
-    "the following classes are exposed for this package's public API: %s",
-    ",".join([Settings.__name__, NestedDict.__name__]),
-)
+
+# note: the public classes are imported on first access, so that importing a submodule (such as
+# `pyspry.settings` in lazy mode) doesn't also import `yaml` and the rest of `pyspry.base`
+_LAZY_ATTRIBUTES = {"NestedDict": "pyspry.nested_dict", "Settings": "pyspry.base"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the classes exposed for this package's public API on first access."""
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError as e:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from e
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    _logger.debug("exposed '%s' from '%s' for this package's public API", name, module_name)
+    return value
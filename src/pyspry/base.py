@@ -3,28 +3,106 @@
 from __future__ import annotations
 
 # stdlib
+import contextlib
+import functools
 import importlib
 import importlib.util
 import json
 import logging
 import os
 import sys
+import threading
 import types
 from importlib.machinery import ModuleSpec
 from io import TextIOWrapper
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, NamedTuple
 
 # third party
 import yaml
+from yaml.composer import Composer, ComposerError
+from yaml.events import (
+    CollectionEndEvent,
+    CollectionStartEvent,
+    Event,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    StreamEndEvent,
+)
+from yaml.nodes import Node, ScalarNode
 
 # local
-from pyspry.nested_dict import NestedDict
-
-__all__ = ["Settings", "ConfigLoader", "SettingsContainer"]
+from pyspry.nested_dict import NestedChange, NestedDict, ReadOnlyMapping, ReadOnlySequence
+from pyspry.stats import LoadStats, has_hooks, timed
+from pyspry.subscriptions import Callback, Subscription, SubscriptionIndex
+
+if TYPE_CHECKING:  # pragma: no cover
+    # stdlib
+    from concurrent.futures import Executor
+
+    # local
+    from pyspry.watch import SettingsWatcher
+
+__all__ = [
+    "CacheInfo",
+    "Settings",
+    "ConfigLoader",
+    "SettingsContainer",
+    "bootstrap_module",
+    "create_module",
+    "get_parser",
+    "parser_name",
+    "register_parser",
+]
 
 logger = logging.getLogger(__name__)
 
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""Prefer the `libyaml` bindings for parsing YAML, falling back to the pure-Python loader."""
+
+_MISSING = object()
+"""Mark missing entries of the attribute cache, since `None` is a valid value."""
+
+
+class _Serialized:
+    """Cache a serialized nested setting, handing out a new copy of it on every read.
+
+    Copying the plain `dict` and `list` objects is much cheaper than serializing the `NestedDict`
+    again, and callers may still modify what they receive.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:  # noqa: D107
+        self.value = value
+
+    def copy(self) -> Any:
+        """Copy the containers of the serialized setting, sharing the scalars."""
+        return self.__copy(self.value)
+
+    @classmethod
+    def unwrap(cls, resolved: Any) -> Any:
+        """Copy a cached `_Serialized` setting for the caller, returning other values as they are."""
+        return resolved.copy() if type(resolved) is cls else resolved
+
+    @classmethod
+    def __copy(cls, value: Any) -> Any:
+        if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+            return {key: cls.__copy(item) for key, item in value.items()}
+        if type(value) is list:  # pylint: disable=unidiomatic-typecheck
+            return [cls.__copy(item) for item in value]
+        return value
+
+
+class CacheInfo(NamedTuple):
+    """Report the statistics of a `Settings` attribute cache (like `functools.lru_cache`)."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
 
 class Settings:
     """Store settings from environment variables and a config file.
@@ -67,49 +145,177 @@ class Settings:
     >>> dir(settings)
     ['ATTR_A', 'ATTR_A_0', 'ATTR_A_1', 'ATTR_A_2', 'ATTR_B', 'ATTR_B_K', 'EXAMPLE_PARAM']
 
+    ## Caching
+
+    Resolved attributes are memoized, so repeated reads skip resolving the name again:
+
+    >>> settings.cache_clear()
+    >>> settings.ATTR_B_K == settings.ATTR_B_K
+    True
+    >>> settings.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=None, currsize=1)
+
+    Nested settings are serialized once, and every read returns a new copy of the cached result,
+    since the caller may modify it:
+
+    >>> settings.ATTR_B["K"] = 1
+    >>> settings.ATTR_B, settings.cache_info().hits
+    ({'K': 0}, 2)
+
+    To avoid the copies, enable `Settings.read_only`: the read-only views of nested settings are
+    cached instead.
+
+    The statistics are counted per thread, and the default (unbounded) cache is read and written
+    without locking. Bounding the cache (see `Settings.cache_size`) serializes its LRU bookkeeping.
+
+    ## Snapshots
+
+    `Settings` objects are immutable snapshots: the internal `NestedDict` is frozen once it's
+    built, so any number of threads can read the same object without locking. Merging creates a
+    new snapshot and leaves its inputs untouched:
+
+    >>> old = Settings({"A": {"B": 1}}, {}, "")
+    >>> new = old | Settings({"A_C": 2}, {}, "")
+    >>> old.A, new.A
+    ({'B': 1}, {'B': 1, 'C': 2})
+
+    To publish a new snapshot to the readers of a module, see `SettingsContainer.update`.
+
+    ## Read-Only Views
+
+    With `read_only=True`, nested settings and `Settings.config` are returned as lazy, read-only
+    views of the internal `NestedDict` instead of copies:
+
+    >>> settings = Settings.load(config_path, prefix="APP_NAME", read_only=True)
+    >>> settings.ATTR_B
+    ReadOnlyMapping({'K': 0})
+    >>> settings.ATTR_A[-1]
+    6
+
     """  # noqa: F821
 
+    __cache: dict[str, Any]
+    """Map attribute names to their resolved values, least recently used first if bounded."""
+
+    __cache_lock: threading.Lock
+    """Serialize the LRU bookkeeping of bounded caches, and registering `__counters`."""
+
+    __counters: list[list[int]]
+    """The cache hits and misses of each thread, which only that thread increments."""
+
+    __stats: threading.local
+    """Hold the entry of `__counters` for the current thread."""
+
     __config: NestedDict
     """Store the config file contents as a `NestedDict` object."""
 
+    __names: tuple[NestedDict, frozenset[str]] | None
+    """Cache the names returned by `Settings.__dir__` for the current `__config`."""
+
+    __pending: dict[str, str]
+    """Map the names of large, JSON-encoded environment variables to their undecoded values."""
+
+    __pending_lock: threading.Lock
+    """Serialize decoding the deferred environment variables."""
+
+    cache_size: int | None = None
+    """Bound the number of cached attributes, evicting the least recently used; `None` means
+    unbounded and `0` disables caching."""
+
     prefix: str
     """Only load settings whose names start with this prefix."""
 
+    read_only: bool = False
+    """Return lazy, read-only views of nested settings instead of serialized copies."""
+
+    lazy_decode_size: int | None = 4096
+    """Defer decoding JSON objects / arrays from environment variables at least this long until the
+    setting is first accessed; `None` decodes every value during initialization."""
+
+    load_stats: LoadStats | None = None
+    """The cost of each phase of loading these settings, if instrumented (see `pyspry.stats`)."""
+
     def __init__(
-        self, config: dict[str, Any] | list[Any], environ: dict[str, str], prefix: str
+        self,
+        config: Mapping[str, Any] | list[Any],
+        environ: dict[str, str],
+        prefix: str,
+        cache_size: int | None = None,
+        read_only: bool | None = None,
+        lazy_decode_size: int | None = None,
+        load_stats: LoadStats | None = None,
     ) -> None:
         """Deserialize all JSON-encoded environment variables during initialization.
 
         Args:
-            config (builtins.dict[builtins.str, typing.Any]): the values loaded from a JSON/YAML
-                file
+            config (typing.Mapping[builtins.str, typing.Any] | builtins.list[typing.Any]): the
+                values loaded from a JSON/YAML file
             environ (builtins.dict[builtins.str, builtins.str]): override config settings with these
                 environment variables
             prefix (builtins.str): insert / strip this prefix when needed
+            cache_size (typing.Optional[builtins.int]): if provided, bound the attribute cache to
+                this many entries
+            read_only (typing.Optional[builtins.bool]): if provided, override
+                `Settings.read_only`
+            lazy_decode_size (typing.Optional[builtins.int]): if provided, override
+                `Settings.lazy_decode_size`
+            load_stats (typing.Optional[pyspry.stats.LoadStats]): if provided, record the phases
+                of initialization in these statistics, and store them as `Settings.load_stats`
 
         The `prefix` is automatically added when accessing attributes:
 
         >>> settings = Settings({"APP_NAME_EXAMPLE_PARAM": 0}, {}, prefix="APP_NAME")
         >>> settings.APP_NAME_EXAMPLE_PARAM == settings.EXAMPLE_PARAM == 0
         True
-        """  # noqa: RST203
-        self.__config = NestedDict(config)
-        env: dict[str, Any] = {}
-        for key, value in environ.items():
-            try:
-                parsed = json.loads(value)
-            except json.JSONDecodeError:
-                # the value must just be a simple string
-                parsed = value
-
-            if isinstance(parsed, (dict, list)):
-                env[key] = NestedDict(parsed)  # pyright: ignore
-            else:
-                env[key] = parsed
 
-        self.__config |= NestedDict(env)
+        Large JSON values (see `Settings.lazy_decode_size`) are only decoded when the setting is
+        first accessed:
+
+        >>> settings = Settings({"APP_A": [0]}, {"APP_A": "[1, 2]"}, "APP", lazy_decode_size=4)
+        >>> settings.A
+        [1, 2]
+        """  # noqa: RST203
+        with timed(load_stats, "build"):
+            self.__config = NestedDict(config)
+        self.__pending = {}
+        if lazy_decode_size is not None:
+            self.lazy_decode_size = lazy_decode_size
+        self.__apply_env(environ, load_stats)
         self.prefix = prefix
 
+        if load_stats is not None:
+            load_stats.keys, load_stats.depth = self.__config.shape()
+            self.load_stats = load_stats
+
+        if cache_size is not None:
+            self.cache_size = cache_size
+        if read_only is not None:
+            self.read_only = read_only
+        self.__config.freeze()
+        self.__pending_lock = threading.Lock()
+        self.__names = None
+        self.__cache = {}
+        self.__cache_lock = threading.Lock()
+        self.__counters = []
+        self.__stats = threading.local()
+
+    def __apply_env(self, environ: dict[str, str], load_stats: LoadStats | None) -> None:
+        """Merge the environment variables into the config, deferring the large JSON values."""
+        environ = self.__defer_env(environ)
+        if environ:
+            # note: `NestedDict` copies the decoded containers, so the cached values aren't shared
+            with timed(load_stats, "json_decode"):
+                overrides = NestedDict(decode_env(environ))
+            with timed(load_stats, "merge"):
+                self.__config |= overrides
+
+    def __defer_env(self, environ: dict[str, str]) -> dict[str, str]:
+        """Store the variables selected by `defer_env` as pending, and return the others."""
+        if self.lazy_decode_size is None or self.__config.is_list:
+            return environ
+        self.__pending = defer_env(environ, self.lazy_decode_size)
+        return {key: value for key, value in environ.items() if key not in self.__pending}
+
     def __contains__(self, obj: Any) -> bool:
         """Check the merged `NestedDict` config for a setting with the given name.
 
@@ -123,13 +329,27 @@ class Settings:
         """
         if not isinstance(obj, str):
             return False
-        return self.maybe_add_prefix(obj) in self.__config
+        name = self.maybe_add_prefix(obj)
+        self.__decode_pending(name)
+        return name in self.__config
 
     def __dir__(self) -> Iterable[str]:
-        """Return a set of the names of all settings provided by this object."""
-        return {self.__config.maybe_strip(self.prefix, key) for key in self.__config.keys()}.union(
-            self.__config.maybe_strip(self.prefix, key) for key in self.__config
-        )
+        """Return a set of the names of all settings provided by this object.
+
+        The names are computed once, since the config is never modified (only replaced).
+        """
+        self.__decode_pending()
+        config = self.__config
+        cached = self.__names
+        if cached is None or cached[0] is not config:
+            # note: the same as `NestedDict.maybe_strip`, without formatting the prefix for each key
+            head = f"{self.prefix}{config.sep}"
+            size = len(head)
+            names = frozenset(
+                key[size:] if key.startswith(head) else key for key in config.flat_keys()
+            )
+            cached = self.__names = (config, names)
+        return cached[1]
 
     def __getattr__(self, name: str) -> Any:
         """Retrieve the setting from `self.__config`.
@@ -146,7 +366,20 @@ class Settings:
         Returns:
             `Any`: the value of the setting
         """
+        # note: the config is frozen, so cached values never go stale; unbounded caches only use
+        # atomic `dict` operations, and bounded caches lock their LRU bookkeeping
+        resolved = self.__cached(name)
+        try:
+            counters = self.__stats.counters
+        except AttributeError:
+            counters = self.__register_counters()
+        if resolved is not _MISSING:
+            counters[0] += 1
+            return resolved.copy() if type(resolved) is _Serialized else resolved
+        counters[1] += 1
+
         attr_name = self.maybe_add_prefix(name)
+        self.__decode_pending(attr_name)
 
         try:
             attr_val = self.__config[attr_name]
@@ -155,11 +388,7 @@ class Settings:
                 f"'{self.__class__.__name__}' object has no attribute '{attr_name}'"
             ) from e
 
-        return (
-            attr_val.serialize(strip_prefix=self.prefix)
-            if isinstance(attr_val, NestedDict)
-            else attr_val
-        )
+        return self.__resolve(name, attr_val)
 
     def __getattribute__(self, name: str) -> Any:
         """Invoke the parent method, falling back to `Settings.__getattr__()` on error."""
@@ -179,46 +408,446 @@ class Settings:
             ...
             TypeError: cannot merge <pyspry.base.Settings object at ...> with {'A': {'B': 1}}
         """
-        if self.__config.is_list or isinstance(other_config := other.config, list):
+        if self.__config.is_list or not isinstance(other, Settings) or other.__config.is_list:
+            # note: lists are never combined with deferred environment variables
             raise TypeError(f"cannot merge {self} with {other}")
-        merged = self.__config | other_config
-        return Settings(
-            # note: explicitly exclude self.prefix from the following call (the prefixes are needed)
-            merged.serialize(),
+        return self.merge(self, other)
+
+    @classmethod
+    def merge(cls, *layers: Settings, load_stats: LoadStats | None = None) -> Settings:
+        """Merge any number of `Settings` objects in one pass, with later layers taking precedence.
+
+        The prefix, cache size, and read-only flag of the first layer are retained:
+
+        >>> merged = Settings.merge(
+        ...     Settings({"APP_A": {"B": 1, "C": 2}}, {}, "APP"),
+        ...     Settings({"APP_A": {"B": 2}}, {}, "APP"),
+        ...     Settings({"APP_A_C": 3}, {}, ""),
+        ... )
+        >>> merged.prefix, merged.A
+        ('APP', {'B': 2, 'C': 3})
+
+        If `load_stats` is provided, the merge is recorded in it, and it is attached to the result
+        (see `Settings.load_stats`).
+
+        Raises:
+            builtins.TypeError: any of the layers is based on a list
+        """
+        if not layers:
+            raise TypeError("at least one layer is required")
+        for layer in layers:
+            if layer.__config.is_list:
+                raise TypeError(f"cannot merge {layers[0]} with {layer}")
+            layer.__decode_pending()
+        first = layers[0]
+        with timed(load_stats, "merge"):
+            # note: the prefixes were not stripped from the configs, so keep them
+            config = NestedDict.merge(*(layer.__config for layer in layers))
+        return cls(
+            config,
             {},
-            self.prefix,
+            first.prefix,
+            first.cache_size,
+            first.read_only,
+            first.lazy_decode_size,
+            load_stats,
         )
 
+    def cache_clear(self) -> None:
+        """Discard all cached attribute values and reset the hit / miss counters.
+
+        Concurrent reads may still be counted after the reset.
+        """
+        with self.__cache_lock:
+            self.__cache.clear()
+            for counters in self.__counters:
+                counters[:] = [0, 0]
+
+    def cache_info(self) -> CacheInfo:
+        """Report the attribute cache statistics.
+
+        >>> settings = Settings({"A": {"B": 1}, "C": 2}, {}, "", cache_size=1)
+        >>> settings.A, settings.C, settings.A
+        ({'B': 1}, 2, {'B': 1})
+        >>> settings.cache_info()
+        CacheInfo(hits=0, misses=3, maxsize=1, currsize=1)
+        """
+        with self.__cache_lock:
+            hits = sum(counters[0] for counters in self.__counters)
+            misses = sum(counters[1] for counters in self.__counters)
+        return CacheInfo(hits, misses, self.cache_size, len(self.__cache))
+
     @property
-    def config(self) -> dict[str, Any] | list[Any]:
+    def config(
+        self,
+    ) -> dict[str, Any] | list[Any] | ReadOnlyMapping | ReadOnlySequence:
         """Return a copy of the serialized data structure.
 
         >>> s = Settings({"A": {"B": [1, 2, 3]}}, {}, "")
         >>> s.config
         {'A': {'B': [1, 2, 3]}}
+
+        If `Settings.read_only` is set, return a read-only view instead:
+
+        >>> s.read_only = True
+        >>> s.config
+        ReadOnlyMapping({'A': {'B': [1, 2, 3]}})
         """
-        # note: explicitly exclude self.prefix from the following call (the prefixes are needed)
-        return self.__config.serialize()
+        if self.read_only:
+            self.__decode_pending()
+            return self.__config.view()
+        return self.serialize()
+
+    def diff(self, other: Settings) -> list[NestedChange]:
+        """List the changes between these settings and `other`; see `NestedDict.diff`.
+
+        >>> old = Settings({"APP_A": {"B": 1}, "APP_C": 2}, {}, "APP")
+        >>> [change.key for change in old.diff(Settings({"APP_A": {"B": 3}, "APP_C": 2}, {}, "APP"))]
+        ['APP_A_B']
+
+        Args:
+            other (pyspry.base.Settings): the settings to compare with
+
+        Returns:
+            builtins.list[pyspry.nested_dict.NestedChange]: the changes that turn these settings
+                into `other`
+        """
+        self.__decode_pending()
+        other.__decode_pending()
+        return self.__config.diff(other.__config)
 
     @classmethod
-    def load(cls, file_path: Path | str, prefix: str | None = None) -> Settings:
+    def load(
+        cls,
+        file_path: Path | str,
+        prefix: str | None = None,
+        cache: bool | Path | str = False,
+        parser: str | None = None,
+        environ: Mapping[str, str] | None = None,
+        stats: bool | LoadStats = False,
+        **kwargs: Any,
+    ) -> Settings:
         """Load the specified configuration file and environment variables.
 
+        Set `cache` to reuse the parsed config file across processes; see `pyspry.cache` for
+        details. If `cache` is `True`, the cache file is written next to the config file:
+
+        >>> cache_dir = getfixture("tmp_path")
+        >>> Settings.load(config_path, "APP_NAME", cache=cache_dir).ATTR_B_K
+        0
+        >>> len(list(cache_dir.iterdir()))
+        1
+
+        The parser is chosen by the file extension (see `get_parser`), unless `parser` names one
+        of the registered parsers explicitly:
+
+        >>> json_path = getfixture("tmp_path") / "config.json"
+        >>> _ = json_path.write_text('{"APP_NAME_ATTR": [1, 2]}')
+        >>> Settings.load(json_path, "APP_NAME").ATTR
+        [1, 2]
+        >>> Settings.load(json_path, "APP_NAME", parser="yaml").ATTR
+        [1, 2]
+
+        Set `stats` to record the cost of each phase of loading (see `pyspry.stats`):
+
+        >>> Settings.load(json_path, "APP_NAME", stats=True).load_stats
+        LoadStats(seconds=..., keys=2, depth=2, phases=5)
+
         Args:
             file_path (pathlib.Path | builtins.str): the path to the config file to load
             prefix (typing.Optional[builtins.str]): if provided, parse all env variables containing
                 this prefix
+            cache (builtins.bool | pathlib.Path | builtins.str): if truthy, cache the parsed config
+                file next to it (`True`) or in the given directory
+            parser (typing.Optional[builtins.str]): if provided, the name of the parser to use
+                instead of inferring it from the file extension
+            environ (typing.Optional[typing.Mapping[builtins.str, builtins.str]]): if provided,
+                override config settings with these variables instead of loading them from
+                `os.environ`
+            stats (builtins.bool | pyspry.stats.LoadStats): if `True`, record the phases of
+                loading in a new `pyspry.stats.LoadStats` and report it to the registered hooks; if
+                a `pyspry.stats.LoadStats` object, record the phases in it without reporting them
+            **kwargs (typing.Any): additional keyword arguments for the `Settings` constructor
 
         Returns:
             pyspry.base.Settings: the `Settings` object loaded from file with environment variable
                 overrides
-        """  # noqa: RST301
-        with Path(file_path).open("r", encoding="UTF-8") as f:
-            config_data = load_yaml(f, prefix)
+        """  # noqa: F821,RST301
+        load_stats = stats if isinstance(stats, LoadStats) else LoadStats() if stats else None
+        settings = cls._load(file_path, prefix, cache, parser, environ, load_stats, **kwargs)
+        if load_stats is not None and load_stats is not stats:
+            load_stats.report()
+        return settings
 
-        environ = load_env(prefix)
+    @classmethod
+    def _load(
+        cls,
+        file_path: Path | str,
+        prefix: str | None,
+        cache: bool | Path | str,
+        parser: str | None,
+        environ: Mapping[str, str] | None,
+        load_stats: LoadStats | None,
+        **kwargs: Any,
+    ) -> Settings:
+        """Load the settings as `Settings.load` does, recording the phases in `load_stats`."""
+        config_data = cls._read_config(file_path, prefix, cache, parser, load_stats)
+        if environ is None:
+            with timed(load_stats, "env_scan"):
+                environ = load_env(prefix)
+        return cls(config_data, dict(environ), prefix or "", load_stats=load_stats, **kwargs)
 
-        return cls(config_data, environ, prefix or "")
+    @staticmethod
+    def _read_config(
+        file_path: Path | str,
+        prefix: str | None,
+        cache: bool | Path | str,
+        parser: str | None,
+        load_stats: LoadStats | None,
+    ) -> dict[str, Any]:
+        """Read the config file, keeping the top-level entries that start with the prefix."""
+        source = str(file_path)
+        parse = get_parser(file_path, parser)
+        if cache:
+            with timed(load_stats, "cache", source):
+                cache_path = None if cache is True else cache
+                data = importlib.import_module("pyspry.cache").load_cached(
+                    file_path, parse, cache_path, parser_name(file_path, parser)
+                )
+            with timed(load_stats, "prefix_filter", source):
+                config_data = filter_prefix(data, prefix)
+        else:
+            with timed(load_stats, "read", source):
+                raw = Path(file_path).read_bytes()
+            if parse is parse_yaml:
+                # note: the prefix is filtered while parsing
+                with timed(load_stats, "parse", source):
+                    config_data = stream_yaml(raw, prefix)
+            else:
+                with timed(load_stats, "parse", source):
+                    data = parse(raw)
+                with timed(load_stats, "prefix_filter", source):
+                    config_data = filter_prefix(data, prefix)
+
+        return config_data
+
+    @classmethod
+    async def aload(
+        cls,
+        file_path: Path | str,
+        prefix: str | None = None,
+        cache: bool | Path | str = False,
+        parser: str | None = None,
+        environ: Mapping[str, str] | None = None,
+        stats: bool | LoadStats = False,
+        executor: Executor | None = None,
+        **kwargs: Any,
+    ) -> Settings:
+        """Load the specified configuration file without blocking the running event loop.
+
+        The file is read, parsed, and merged with the environment variables by `Settings.load` in
+        `executor`, so the result is the same:
+
+        >>> import asyncio
+        >>> asyncio.run(Settings.aload(config_path, "APP_NAME")).ATTR_B_K
+        0
+
+        Args:
+            file_path (pathlib.Path | builtins.str): the path to the config file to load
+            prefix (typing.Optional[builtins.str]): if provided, parse all env variables containing
+                this prefix
+            cache (builtins.bool | pathlib.Path | builtins.str): see `Settings.load`
+            parser (typing.Optional[builtins.str]): see `Settings.load`
+            environ (typing.Optional[typing.Mapping[builtins.str, builtins.str]]): see
+                `Settings.load`
+            stats (builtins.bool | pyspry.stats.LoadStats): see `Settings.load`
+            executor (typing.Optional[concurrent.futures.Executor]): the executor to load the file
+                in; defaults to the default executor of the event loop
+            **kwargs (typing.Any): additional keyword arguments for the `Settings` constructor
+
+        Returns:
+            pyspry.base.Settings: the `Settings` object loaded from file with environment variable
+                overrides
+        """  # noqa: F821,RST301
+        # stdlib
+        import asyncio
+
+        load = functools.partial(
+            cls.load, file_path, prefix, cache, parser, environ, stats, **kwargs
+        )
+        return await asyncio.get_running_loop().run_in_executor(executor, load)
+
+    def replace(self, name: str, value: Any) -> Settings:
+        """Copy these settings, replacing the setting `name` with `value` rather than merging them.
+
+        >>> settings = Settings({"APP_A": {"B": 1, "C": 2}}, {}, "APP")
+        >>> settings.replace("A", {"B": 3}).A, settings.A
+        ({'B': 3}, {'B': 1, 'C': 2})
+
+        Args:
+            name (builtins.str): the name of the setting, with or without `Settings.prefix`
+            value (typing.Any): the new value of the setting
+
+        Returns:
+            pyspry.base.Settings: the new settings, with the same options as these
+        """
+        config = NestedDict(self.serialize())
+        key = self.maybe_add_prefix(name)
+        # note: a scalar replaces any existing value, so `value` is never merged into the old one
+        config[key] = None
+        config[key] = value
+        return Settings(
+            config, {}, self.prefix, self.cache_size, self.read_only, self.lazy_decode_size
+        )
+
+    def serialize(self) -> dict[str, Any] | list[Any]:
+        """Return a copy of the serialized data structure, regardless of `Settings.read_only`."""
+        self.__decode_pending()
+        # note: explicitly exclude self.prefix from the following call (the prefixes are needed)
+        return self.__config.serialize()
+
+    def __decode_pending(self, name: str | None = None) -> None:
+        """Merge the deferred environment variables that may affect `name` (default: all of them).
+
+        The merged config is a new, frozen `NestedDict` that replaces the current one in a single
+        assignment, so concurrent readers never see a partially merged tree.
+        """
+        if not self.__pending:
+            return
+        with self.__pending_lock:
+            pending = self.__pending
+            keys = list(pending) if name is None else [k for k in pending if _overlaps(name, k)]
+            self.__merge_pending(keys)
+
+    def __merge_pending(self, keys: list[str]) -> None:
+        """Decode and merge the given pending variables, while holding the pending lock."""
+        if not keys:
+            return
+        pending = self.__pending
+        overrides = NestedDict(decode_env({k: pending[k] for k in keys}))
+        self.__config = NestedDict.merge(self.__config, overrides).freeze()
+        self.__pending = {k: v for k, v in pending.items() if k not in keys}
+
+    def __resolve(self, name: str, value: Any) -> Any:
+        """Convert a value of the config to the form returned by `Settings.__getattr__`.
+
+        The result is stored in the attribute cache (if enabled), evicting the oldest entries.
+        Serialized copies are cached as `_Serialized` objects, and copied again for the caller.
+        """
+        if not isinstance(value, NestedDict):
+            resolved = value
+        elif self.read_only:
+            resolved = value.view(strip_prefix=self.prefix)
+        else:
+            resolved = _Serialized(value.serialize(strip_prefix=self.prefix))
+        self.__store(name, resolved)
+        return resolved.copy() if type(resolved) is _Serialized else resolved
+
+    def __cached(self, name: str) -> Any:
+        """Look up a resolved attribute in the cache, marking it as recently used if bounded."""
+        cache = self.__cache
+        if self.cache_size is None:
+            return cache.get(name, _MISSING)
+        with self.__cache_lock:
+            resolved = cache.pop(name, _MISSING)
+            if resolved is not _MISSING:
+                cache[name] = resolved
+        return resolved
+
+    def __store(self, name: str, resolved: Any) -> None:
+        """Add a resolved attribute to the cache, evicting the least recently used if bounded."""
+        if self.cache_size is None:
+            self.__cache[name] = resolved
+        elif self.cache_size != 0:
+            cache = self.__cache
+            with self.__cache_lock:
+                cache.pop(name, None)
+                cache[name] = resolved
+                while len(cache) > self.cache_size:
+                    del cache[next(iter(cache))]
+
+    def __register_counters(self) -> list[int]:
+        """Create the cache statistics of the current thread, which only this thread modifies."""
+        counters = self.__stats.counters = [0, 0]
+        with self.__cache_lock:
+            self.__counters.append(counters)
+        return counters
+
+    def get_many(self, names: Iterable[str]) -> tuple[dict[str, Any], set[str]]:
+        """Retrieve several settings at once, as `getattr()` would, but without raising errors.
+
+        Cached names are answered first, then the rest are looked up in the config in one batch:
+
+        >>> settings = Settings({"APP_A": {"B": [1, 2]}, "APP_C": 3}, {}, "APP")
+        >>> settings.get_many(["A_B", "APP_C", "D"])
+        ({'A_B': [1, 2], 'APP_C': 3}, {'D'})
+
+        Args:
+            names (typing.Iterable[builtins.str]): the names of the settings, with or without the
+                prefix
+
+        Returns:
+            builtins.tuple[builtins.dict[builtins.str, typing.Any], builtins.set[builtins.str]]:
+                the value of each name that exists, and the names that don't
+        """
+        found, lookups = self.__get_cached(names)
+        if self.__pending:
+            for _, attr_name in lookups:
+                self.__decode_pending(attr_name)
+
+        values, _ = self.__config.get_many(attr_name for _, attr_name in lookups)
+        return found, self.__resolve_many(lookups, values, found)
+
+    def __resolve_many(
+        self, lookups: list[tuple[str, str]], values: dict[str, Any], found: dict[str, Any]
+    ) -> set[str]:
+        """Add the resolved `values` of the looked up names to `found`, and return the missing."""
+        missing: set[str] = set()
+        resolve = self.__resolve
+        for name, attr_name in lookups:
+            value = values.get(attr_name, _MISSING)
+            if value is _MISSING:
+                missing.add(name)
+            else:
+                found[name] = resolve(name, value)
+        return missing
+
+    def __get_cached(self, names: Iterable[str]) -> tuple[dict[str, Any], list[tuple[str, str]]]:
+        """Answer the cached names of `Settings.get_many`, and prefix the rest for a lookup."""
+        names = list(names)
+        lru = self.cache_size is not None
+        unlocked: contextlib.AbstractContextManager[Any] = contextlib.nullcontext()
+        with self.__cache_lock if lru else unlocked:
+            found, missing = self.__collect_cached(names, lru)
+        # note: bind the attributes once, since `Settings.__getattribute__` is slow per call, and
+        # inline `Settings.maybe_add_prefix`
+        prefix, sep = self.prefix, self.__config.sep
+        lookups = [
+            (name, name if name.startswith(prefix) else f"{prefix}{sep}{name}") for name in missing
+        ]
+        try:
+            counters = self.__stats.counters
+        except AttributeError:
+            counters = self.__register_counters()
+        counters[0] += len(names) - len(missing)
+        counters[1] += len(missing)
+        return found, lookups
+
+    def __collect_cached(self, names: list[str], lru: bool) -> tuple[dict[str, Any], list[str]]:
+        """Split `names` into the cached values and the missing names (with the cache locked)."""
+        found: dict[str, Any] = {}
+        missing: list[str] = []
+        cache = self.__cache
+        get = cache.pop if lru else cache.get
+        for name in names:
+            resolved = get(name, _MISSING)
+            if resolved is _MISSING:
+                missing.append(name)
+                continue
+            found[name] = _Serialized.unwrap(resolved)
+            if lru:
+                cache[name] = resolved
+        return found, missing
 
     def maybe_add_prefix(self, name: str) -> str:
         """If the given name is missing the prefix configured for these settings, insert it.
@@ -255,15 +884,80 @@ class ConfigLoader:
     VARNAME_VAR_PREFIX = "PYSPRY_VAR_PREFIX"
     """The name of the environment variable identifying the prefix for environment variables."""
 
+    VARNAME_CONFIG_CACHE = "PYSPRY_CONFIG_CACHE"
+    """The name of the environment variable enabling the parsed-config cache (see `pyspry.cache`).
+
+    Set it to `true` to cache each config file next to itself, or to the path of a directory for
+    the cache files."""
+
+    VARNAME_CONFIG_PARSER = "PYSPRY_CONFIG_PARSER"
+    """The name of the environment variable naming the parser for all config files.
+
+    If unset, the parser is inferred from the extension of each config file (see `get_parser`)."""
+
+    VARNAME_CONFIG_WORKERS = "PYSPRY_CONFIG_WORKERS"
+    """The name of the environment variable setting the number of threads for loading config files.
+
+    If unset, multiple config files are loaded one after another."""
+
+    VARNAME_CONFIG_WATCH = "PYSPRY_CONFIG_WATCH"
+    """The name of the environment variable enabling hot reloads of bootstrapped settings.
+
+    Set it to `true` to reload the settings in the background whenever a config file changes (see
+    `SettingsContainer.watch`)."""
+
+    VARNAME_COMPILED_PATH = "PYSPRY_COMPILED_PATH"
+    """The name of the environment variable identifying the path to compiled settings.
+
+    If set, `bootstrap_module` imports the module at this path instead of loading the config files,
+    as long as it's up to date (see `pyspry.compiled`)."""
+
+    VARNAME_SHARED_PATH = "PYSPRY_SHARED_PATH"
+    """The name of the environment variable identifying the path to a shared settings snapshot.
+
+    If set, `bootstrap_module` maps the snapshot at this path (publishing it first if it's missing
+    or stale) instead of loading the config files in every process (see `pyspry.shared`)."""
+
+    VARNAME_LOAD_STATS = "PYSPRY_LOAD_STATS"
+    """The name of the environment variable enabling load instrumentation (see `pyspry.stats`).
+
+    Instrumentation is also enabled whenever a hook is registered (see
+    `pyspry.stats.register_hook`).
+    """
+
     parsed: list[str] | str
     """The parsed value of the environment variable `ConfigLoader.VARNAME_CONFIG_PATH`."""
 
     prefix: str | None
     """The parsed value of the environment variable `ConfigLoader.VARNAME_VAR_PREFIX`."""
 
-    def __init__(self, raw_env_var: str, prefix: str | None) -> None:  # noqa: D107
+    cache: bool | str
+    """The parsed value of the environment variable `ConfigLoader.VARNAME_CONFIG_CACHE`."""
+
+    parser: str | None
+    """The value of the environment variable `ConfigLoader.VARNAME_CONFIG_PARSER`."""
+
+    workers: int | None
+    """The parsed value of the environment variable `ConfigLoader.VARNAME_CONFIG_WORKERS`."""
+
+    stats: bool
+    """The parsed value of the environment variable `ConfigLoader.VARNAME_LOAD_STATS`."""
+
+    def __init__(
+        self,
+        raw_env_var: str,
+        prefix: str | None,
+        cache: bool | str = False,
+        parser: str | None = None,
+        workers: int | None = None,
+        stats: bool = False,
+    ) -> None:  # noqa: D107
         self.parsed = yaml.safe_load(raw_env_var)
         self.prefix = prefix
+        self.cache = cache
+        self.parser = parser
+        self.workers = workers
+        self.stats = stats
 
     @classmethod
     def create(cls) -> ConfigLoader:
@@ -272,41 +966,204 @@ class ConfigLoader:
         - `ConfigLoader.VARNAME_CONFIG_PATH` specifies the path to one or more config files
         - `ConfigLoader.VARNAME_VAR_PREFIX` identifies the prefix to use when parsing settings from
           environment variables and the config file
+        - `ConfigLoader.VARNAME_CONFIG_CACHE` optionally enables the parsed-config cache
+        - `ConfigLoader.VARNAME_CONFIG_PARSER` optionally overrides the parser for config files
+        - `ConfigLoader.VARNAME_CONFIG_WORKERS` optionally loads multiple config files concurrently
+        - `ConfigLoader.VARNAME_LOAD_STATS` optionally records the cost of each phase of loading
         """
         raw = os.environ.get(cls.VARNAME_CONFIG_PATH, "config.yml")
         prefix = os.environ.get(cls.VARNAME_VAR_PREFIX, None)
-        return cls(raw, prefix)
+        cache = cls._cache_option(os.environ.get(cls.VARNAME_CONFIG_CACHE, ""))
+        parser = os.environ.get(cls.VARNAME_CONFIG_PARSER) or None
+        workers = int(os.environ.get(cls.VARNAME_CONFIG_WORKERS) or 0) or None
+        stats = bool(yaml.safe_load(os.environ.get(cls.VARNAME_LOAD_STATS, "")))
+        return cls(raw, prefix, cache, parser, workers, stats)
 
     @staticmethod
-    def _from_list(paths: list[str], prefix: str | None) -> Settings:
-        all_settings = [ConfigLoader._from_str(path, prefix) for path in paths]
+    def _cache_option(raw: str) -> bool | str:
+        """Parse the value of `ConfigLoader.VARNAME_CONFIG_CACHE`: a boolean, or a directory."""
+        cache = yaml.safe_load(raw) or False
+        return cache if isinstance(cache, bool) else str(cache)
+
+    @staticmethod
+    def _from_list(
+        paths: list[str],
+        prefix: str | None,
+        cache: bool | str = False,
+        parser: str | None = None,
+        workers: int | None = None,
+        stats: LoadStats | None = None,
+    ) -> Settings:
+        def load(path: str) -> Settings:
+            # note: the environment variables are applied once, after the files are merged
+            return Settings.load(
+                Path(path), prefix, cache, parser, environ={}, stats=stats or False
+            )
+
+        if workers is not None and workers > 1 and len(paths) > 1:
+            # stdlib
+            from concurrent.futures import ThreadPoolExecutor
+
+            # note: `Executor.map()` yields the results in the order of `paths`
+            with ThreadPoolExecutor(min(workers, len(paths))) as executor:
+                all_settings = list(executor.map(load, paths))
+        else:
+            all_settings = [load(path) for path in paths]
+
+        return ConfigLoader._merge_env(all_settings, prefix, stats)
+
+    @staticmethod
+    def _merge_env(
+        all_settings: list[Settings], prefix: str | None, stats: LoadStats | None = None
+    ) -> Settings:
         if len(all_settings) < 1:  # pragma: no cover
             raise ValueError(
                 f"invalid encoding of environment variable {ConfigLoader.VARNAME_CONFIG_PATH}: "
-                + str(paths)
+                + str(all_settings)
             )
-        settings, overrides = all_settings[0], all_settings[1:]
-        for override in overrides:
-            settings |= override
-        return settings
+        with timed(stats, "env_scan"):
+            environ = load_env(prefix)
+        env_layer = Settings({}, environ, prefix or "", load_stats=stats)
+        return Settings.merge(*all_settings, env_layer, load_stats=stats)
 
     @staticmethod
-    def _from_str(path: str, prefix: str | None) -> Settings:
-        return Settings.load(Path(path), prefix)
+    def _from_str(
+        path: str,
+        prefix: str | None,
+        cache: bool | str = False,
+        parser: str | None = None,
+        workers: int | None = None,  # pylint: disable=unused-argument
+        stats: LoadStats | None = None,
+    ) -> Settings:
+        return Settings.load(Path(path), prefix, cache, parser, stats=stats or False)
+
+    @property
+    def paths(self) -> list[str]:
+        """List the paths of the config files, in the order they are merged."""
+        return [self.parsed] if isinstance(self.parsed, str) else list(self.parsed)
+
+    def read_layer(self, path: Path | str) -> Settings:
+        """Load a single config file, without environment variable overrides.
+
+        Args:
+            path (pathlib.Path | builtins.str): the path to the config file
+
+        Returns:
+            pyspry.base.Settings: the settings loaded from the file
+        """
+        return Settings.load(Path(path), self.prefix, self.cache, self.parser, environ={})
+
+    def merge_layers(self, layers: Iterable[Settings]) -> Settings:
+        """Merge the config file layers, then apply the environment variable overrides.
+
+        As with `ConfigLoader.read_settings`, the phases of the merge are recorded if
+        `ConfigLoader.stats` is set (or any `pyspry.stats` hooks are registered).
+
+        Args:
+            layers (typing.Iterable[pyspry.base.Settings]): the layers loaded by
+                `ConfigLoader.read_layer`, in the order of `ConfigLoader.paths`
+
+        Returns:
+            pyspry.base.Settings: the merged settings
+        """
+        stats = LoadStats() if self.stats or has_hooks() else None
+        settings = self._merge_env(list(layers), self.prefix, stats)
+        if stats is not None:
+            stats.report()
+        return settings
 
     def read_settings(self) -> Settings:
-        """Parse a new `Settings` object from the config file and environment variables."""
+        """Parse a new `Settings` object from the config file and environment variables.
+
+        If `ConfigLoader.workers` is greater than one, multiple config files are read and parsed
+        in a thread pool. The results are merged in the declared order, so the settings are the
+        same as when the files are loaded one after another.
+
+        If `ConfigLoader.stats` is set (or any `pyspry.stats` hooks are registered), the cost of
+        each phase is recorded in `Settings.load_stats` and reported to the hooks.
+        """
         try:
-            method: Callable[[list[str] | str, str | None], Settings] = getattr(
-                self, f"_from_{type(self.parsed).__name__}"
-            )
+            method: Callable[
+                [
+                    list[str] | str,
+                    str | None,
+                    bool | str,
+                    str | None,
+                    int | None,
+                    LoadStats | None,
+                ],
+                Settings,
+            ] = getattr(self, f"_from_{type(self.parsed).__name__}")
         except AttributeError as e:  # pragma: no cover
             raise TypeError(
                 f"invalid encoding of environment variable {self.VARNAME_CONFIG_PATH}: "
                 + str(self.parsed)
             ) from e
 
-        return method(self.parsed, self.prefix)
+        stats = LoadStats() if self.stats or has_hooks() else None
+        settings = method(self.parsed, self.prefix, self.cache, self.parser, self.workers, stats)
+        if stats is not None:
+            stats.report()
+        return settings
+
+    async def aread_settings(self, executor: Executor | None = None) -> Settings:
+        """Parse a new `Settings` object without blocking the running event loop.
+
+        Each config file is read and parsed in `executor` (see `Settings.aload`), and all of them
+        are loaded concurrently, regardless of `ConfigLoader.workers`. The layers are merged in
+        the declared order, so the settings are the same as those of `ConfigLoader.read_settings`:
+
+        >>> import asyncio
+        >>> loader = ConfigLoader.create()
+        >>> asyncio.run(loader.aread_settings()).serialize() == loader.read_settings().serialize()
+        True
+
+        Args:
+            executor (typing.Optional[concurrent.futures.Executor]): the executor to load the files
+                in; defaults to the default executor of the event loop
+
+        Returns:
+            pyspry.base.Settings: the merged settings
+        """
+        stats = LoadStats() if self.stats or has_hooks() else None
+        settings = await self.__aload_files(executor, stats)
+        if stats is not None:
+            stats.report()
+        return settings
+
+    async def __aload_files(self, executor: Executor | None, stats: LoadStats | None) -> Settings:
+        """Load the config files concurrently in `executor`, then merge them in order."""
+        # stdlib
+        import asyncio
+
+        load_stats = stats or False
+        if isinstance(self.parsed, str):
+            return await Settings.aload(
+                Path(self.parsed),
+                self.prefix,
+                self.cache,
+                self.parser,
+                stats=load_stats,
+                executor=executor,
+            )
+
+        # note: the environment variables are applied once, after the files are merged
+        layers = await asyncio.gather(
+            *(
+                Settings.aload(
+                    Path(path),
+                    self.prefix,
+                    self.cache,
+                    self.parser,
+                    environ={},
+                    stats=load_stats,
+                    executor=executor,
+                )
+                for path in self.parsed
+            )
+        )
+        merge = functools.partial(self._merge_env, list(layers), self.prefix, stats)
+        return await asyncio.get_running_loop().run_in_executor(executor, merge)
 
 
 class SettingsContainer(types.ModuleType):
@@ -319,6 +1176,20 @@ class SettingsContainer(types.ModuleType):
       - `Settings` is responsible for accessing items in its `pyspry.NestedDict`
       - `SettingsContainer` is responsible for instantiating the `Settings` object and interfacing
         with Python's import mechanisms
+
+    Readers never lock: each attribute access reads the current `Settings` snapshot, which is
+    immutable. Writers (`SettingsContainer.swap`, `SettingsContainer.update`, assignments, and hot
+    reloads) build a new snapshot and publish it with a single assignment. A lock is only held to
+    publish it: an update is built again if another writer published first, so concurrent updates
+    are never lost, and subscribers are notified after the lock is released:
+
+    >>> container = SettingsContainer("module", None, Settings({"APP_A": 1}, {}, "APP"))
+    >>> snapshot = container.snapshot()
+    >>> container.A = 2
+    >>> container.A, snapshot.A
+    (2, 1)
+
+    To read several settings consistently, read them from one `SettingsContainer.snapshot`.
     """  # pylint: disable=line-too-long
 
     __name__: str
@@ -331,14 +1202,34 @@ class SettingsContainer(types.ModuleType):
     """Store the `pyspry.Settings` object that was initialized from the config file and environment
     variables"""
 
+    __loader: ConfigLoader | None
+    """Reload the settings with this object; see `SettingsContainer.watch`."""
+
+    __lock: threading.RLock
+    """Serialize the writers publishing new snapshots."""
+
+    __subscriptions: SubscriptionIndex
+    """Notify these subscribers when settings are swapped; see `SettingsContainer.subscribe`."""
+
+    __watcher: SettingsWatcher | None
+    """The background thread reloading the settings, if `SettingsContainer.watch` was called."""
+
     def __init__(
-        self, module_name: str, spec: ModuleSpec | None, settings: Settings
+        self,
+        module_name: str,
+        spec: ModuleSpec | None,
+        settings: Settings,
+        loader: ConfigLoader | None = None,
     ) -> None:  # noqa: D107
         # these properties are used by `importlib.reload()`:
         self.__name__ = module_name
         self.__spec__ = spec
 
         self.__settings = settings
+        self.__loader = loader
+        self.__lock = threading.RLock()
+        self.__subscriptions = SubscriptionIndex()
+        self.__watcher = None
 
     def __contains__(self, obj: Any) -> bool:
         """Thin wrapper around the `Settings` method."""
@@ -368,40 +1259,397 @@ class SettingsContainer(types.ModuleType):
             f"'{self.__name__}', {self.__spec__}, {repr(self.__settings)})"
         )
 
-    def __setattr__(self, name: str, value: Any) -> None:  # noqa: D105
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Publish a new snapshot with the given setting (or `Settings` option) replaced."""
         if name in self.__class__.__annotations__:
             super().__setattr__(name, value)
-        else:
-            setattr(self.__settings, name, value)
+            return
+
+        if not (hasattr(Settings, name) or name in Settings.__annotations__):
+            self.__commit(lambda current: current.replace(name, value))
+            return
+
+        with self.__lock:
+            # note: copy the snapshot, then change the option before publishing the copy; options
+            # don't change any setting, so there's nothing to dispatch
+            updated = Settings.merge(self.__settings)
+            setattr(updated, name, value)
+            self.__settings = updated
 
     def __str__(self) -> str:  # noqa: D105
-        return yaml.dump(self.__settings.config, indent=2)
+        return yaml.dump(self.__settings.serialize(), indent=2)
 
     @classmethod
     def bootstrap(cls, module_name: str) -> SettingsContainer:
         """Store the named module object, replacing it with `self` to bootstrap the import mechanic.
 
-        This object will replace the named module in `sys.modules`.
+        This object will replace the named module in `sys.modules`. To use a shared snapshot or
+        compiled settings instead, when they're configured, see `bootstrap_module`.
 
         Args:
             module_name (builtins.str): the name of the module to replace
 
         Returns:
-            typing.Optional[types.ModuleType]: the module object that was replaced, or `None` if the
-                module wasn't already in `sys.modules`
+            pyspry.base.SettingsContainer: the container installed in `sys.modules`
         """
         if sys.modules.get(module_name):
             logger.info("replacing module '%s' with settings object", module_name)
             del sys.modules[module_name]
 
-        spec = importlib.util.find_spec(module_name)
-        settings = ConfigLoader.create().read_settings()
-
-        container = cls(module_name, spec, settings)
+        container = cls.create(module_name, importlib.util.find_spec(module_name))
         sys.modules[module_name] = container
 
         return container
 
+    @classmethod
+    def create(
+        cls, module_name: str, spec: ModuleSpec | None, loader: ConfigLoader | None = None
+    ) -> SettingsContainer:
+        """Load the settings with `ConfigLoader`, without installing the container in `sys.modules`.
+
+        If the environment variable `ConfigLoader.VARNAME_CONFIG_WATCH` is set, the settings are
+        also watched for changes (see `SettingsContainer.watch`).
+
+        Args:
+            module_name (builtins.str): the name of the module the container stands in for
+            spec (typing.Optional[importlib.machinery.ModuleSpec]): the spec of that module
+            loader (typing.Optional[pyspry.base.ConfigLoader]): the loader to use; defaults to
+                `ConfigLoader.create()`
+
+        Returns:
+            pyspry.base.SettingsContainer: the new container
+        """
+        if loader is None:
+            loader = ConfigLoader.create()
+        container = cls(module_name, spec, loader.read_settings(), loader)
+        if yaml.safe_load(os.environ.get(ConfigLoader.VARNAME_CONFIG_WATCH, "")):
+            container.watch()
+        return container
+
+    def subscribe(self, prefix: str, callback: Callback) -> Subscription:
+        """Call `callback` whenever settings starting with `prefix` change.
+
+        The prefix of the settings is inserted if it's missing, as for attribute access. The
+        callback receives the list of changes (see `pyspry.nested_dict.NestedChange`) after the new
+        settings have been swapped in, e.g. by `SettingsContainer.update` or a reload:
+
+        >>> container = SettingsContainer("module", None, Settings({"APP_DB_HOST": "a"}, {}, "APP"))
+        >>> _ = container.subscribe("DB_", lambda changes: print(changes))
+        >>> _ = container.update(Settings({"APP_DB_HOST": "b", "APP_OTHER": 1}, {}, "APP"))
+        [NestedChange(op='change', path=('APP_DB_HOST',), value='b')]
+
+        Args:
+            prefix (builtins.str): the prefix of the settings to watch
+            callback (pyspry.subscriptions.Callback): the function to call with the changes
+
+        Returns:
+            pyspry.subscriptions.Subscription: pass this to `SettingsContainer.unsubscribe` to stop
+                the notifications
+        """
+        return self.__subscriptions.subscribe(self.__settings.maybe_add_prefix(prefix), callback)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscription created by `SettingsContainer.subscribe`."""
+        self.__subscriptions.unsubscribe(subscription)
+
+    def swap(self, settings: Settings, changes: list[NestedChange] | None = None) -> Settings:
+        """Replace the proxied `Settings` object, returning the previous one.
+
+        The replacement is a single reference assignment, so concurrent readers see either the old
+        or the new settings. Afterwards, the subscribers are notified of the changes; the changes are
+        computed, and the subscribers called, after releasing the lock that serializes writers.
+
+        Args:
+            settings (pyspry.base.Settings): the new settings
+            changes (typing.Optional[builtins.list[pyspry.nested_dict.NestedChange]]): if already
+                known, the changes from the previous settings (see `Settings.diff`)
+
+        Returns:
+            pyspry.base.Settings: the settings that were replaced
+        """
+        with self.__lock:
+            previous = self.__settings
+            self.__settings = settings
+        if self.__subscriptions:
+            self.__subscriptions.dispatch(previous.diff(settings) if changes is None else changes)
+        return previous
+
+    def publish(self, settings: Settings) -> list[NestedChange]:
+        """Replace the proxied `Settings` object, unless `settings` don't change anything.
+
+        Unlike `SettingsContainer.swap`, the changes are computed against the settings that are
+        actually replaced, even if another writer published settings in the meantime.
+
+        Args:
+            settings (pyspry.base.Settings): the new settings
+
+        Returns:
+            builtins.list[pyspry.nested_dict.NestedChange]: the resulting changes
+        """
+        return self.__commit(lambda _: settings)
+
+    def snapshot(self) -> Settings:
+        """Return the current `Settings` object, which never changes; see `SettingsContainer`."""
+        return self.__settings
+
+    def update(self, *layers: Settings) -> list[NestedChange]:
+        """Merge the given layers over the current settings, and swap in the result.
+
+        Args:
+            *layers (pyspry.base.Settings): the settings to merge, with later layers taking
+                precedence
+
+        Returns:
+            builtins.list[pyspry.nested_dict.NestedChange]: the resulting changes
+        """  # noqa: RST213
+        return self.__commit(lambda current: Settings.merge(current, *layers))
+
+    def __commit(self, build: Callable[[Settings], Settings]) -> list[NestedChange]:
+        """Publish `build(current)` unless it changes nothing, and notify the subscribers.
+
+        The new settings are built and compared outside the lock, then published only if no other
+        writer published first; otherwise they're built again from the newer settings.
+        """
+        while True:
+            previous = self.__settings
+            settings = build(previous)
+            changes = previous.diff(settings)
+            if self.__compare_and_set(previous, settings if changes else previous):
+                break
+        if self.__subscriptions:
+            self.__subscriptions.dispatch(changes)
+        return changes
+
+    def __compare_and_set(self, expected: Settings, settings: Settings) -> bool:
+        """Publish `settings` if the current settings are still `expected`."""
+        with self.__lock:
+            if self.__settings is not expected:
+                return False
+            self.__settings = settings
+        return True
+
+    def watch(
+        self, poll_interval: float = 1.0, debounce: float = 0.1, min_interval: float = 1.0
+    ) -> SettingsWatcher:
+        """Start reloading the settings in the background whenever their config files change.
+
+        Any watcher started earlier is stopped. See `pyspry.watch` for details.
+
+        Args:
+            poll_interval (builtins.float): see `pyspry.watch.SettingsWatcher.poll_interval`
+            debounce (builtins.float): see `pyspry.watch.SettingsWatcher.debounce`
+            min_interval (builtins.float): see `pyspry.watch.SettingsWatcher.min_interval`
+
+        Returns:
+            pyspry.watch.SettingsWatcher: the started watcher; call its `stop()` method to stop it
+        """
+        if self.__watcher is not None:
+            self.__watcher.stop()
+        if self.__loader is None:
+            self.__loader = ConfigLoader.create()
+        watcher: SettingsWatcher = importlib.import_module("pyspry.watch").SettingsWatcher(
+            self.__loader, self.publish, poll_interval, debounce, min_interval
+        )
+        watcher.start()
+        self.__watcher = watcher
+        return watcher
+
+
+def bootstrap_module(module_name: str) -> types.ModuleType:
+    """Replace the named module in `sys.modules` with the settings, as `pyspry.settings` does.
+
+    This is the same as `SettingsContainer.bootstrap`, except that the settings may be read from a
+    shared snapshot or a compiled module instead; see `create_module`.
+
+    Args:
+        module_name (builtins.str): the name of the module to replace
+
+    Returns:
+        types.ModuleType: the container (or snapshot or compiled module) installed in `sys.modules`
+    """
+    if sys.modules.get(module_name):
+        logger.info("replacing module '%s' with settings object", module_name)
+        del sys.modules[module_name]
+
+    module = create_module(module_name, importlib.util.find_spec(module_name))
+    sys.modules[module_name] = module
+
+    return module
+
+
+def create_module(module_name: str, spec: ModuleSpec | None) -> types.ModuleType:
+    """Create the module standing in for `module_name`, without installing it in `sys.modules`.
+
+    If the environment variable `ConfigLoader.VARNAME_SHARED_PATH` names a settings snapshot (see
+    `pyspry.shared`), or `ConfigLoader.VARNAME_COMPILED_PATH` names an up-to-date compiled module
+    (see `pyspry.compiled`), a module reading from it is returned, unless the settings are watched
+    for changes. Otherwise, the settings are loaded by `SettingsContainer.create`.
+
+    Args:
+        module_name (builtins.str): the name of the module to stand in for
+        spec (typing.Optional[importlib.machinery.ModuleSpec]): the spec of that module
+
+    Returns:
+        types.ModuleType: the snapshot module, the compiled module, or a new `SettingsContainer`
+    """
+    loader = ConfigLoader.create()
+    module: types.ModuleType | None = None
+    if not yaml.safe_load(os.environ.get(ConfigLoader.VARNAME_CONFIG_WATCH, "")):
+        module = _load_snapshot(module_name, spec, loader)
+    if module is None:
+        module = SettingsContainer.create(module_name, spec, loader)
+    return module
+
+
+def _load_snapshot(
+    module_name: str, spec: ModuleSpec | None, loader: ConfigLoader
+) -> types.ModuleType | None:
+    """Load the shared snapshot or the compiled module configured by the environment, if any."""
+    shared_path = os.environ.get(ConfigLoader.VARNAME_SHARED_PATH)
+    compiled_path = os.environ.get(ConfigLoader.VARNAME_COMPILED_PATH)
+    module: types.ModuleType | None = None
+    if shared_path:
+        shared = importlib.import_module("pyspry.shared")
+        module = shared.load_shared(shared_path, module_name, loader, spec)
+    if module is None and compiled_path:
+        compiled = importlib.import_module("pyspry.compiled")
+        module = compiled.load_compiled(compiled_path, module_name, loader, spec)
+    return module
+
+
+Parser = Callable[[bytes], Any]
+"""Deserialize the raw contents of a config file."""
+
+PARSERS: dict[str, Parser] = {}
+"""Map the name of each registered parser to its function; see `register_parser`."""
+
+EXTENSIONS: dict[str, str] = {}
+"""Map (lower-case) file extensions to the name of the parser for those files."""
+
+DEFAULT_PARSER = "yaml"
+"""The name of the parser used for unrecognized file extensions."""
+
+ENV_CACHE_SIZE = 8
+"""The number of distinct environment snapshots to keep decoded; see `decode_env`."""
+
+
+def register_parser(name: str, *extensions: str) -> Callable[[Parser], Parser]:
+    r"""Register a parser function under the given name, and optionally for some file extensions.
+
+    >>> @register_parser("lines", ".lines")
+    ... def parse_lines(raw):
+    ...     return {f"LINE_{n}": line for n, line in enumerate(raw.decode().splitlines())}
+    >>> get_parser("config.lines")(b"a\nb")
+    {'LINE_0': 'a', 'LINE_1': 'b'}
+
+    >>> del PARSERS["lines"], EXTENSIONS[".lines"]
+
+    Args:
+        name (builtins.str): the name used to select this parser explicitly
+        *extensions (builtins.str): select this parser for files with these extensions
+
+    Returns:
+        typing.Callable[[pyspry.base.Parser], pyspry.base.Parser]: a decorator that registers the
+            parser function and returns it unchanged
+    """  # noqa: RST213
+    def decorator(parse: Parser) -> Parser:
+        PARSERS[name] = parse
+        for extension in extensions:
+            EXTENSIONS[extension.lower()] = name
+        return parse
+
+    return decorator
+
+
+def get_parser(file_path: Path | str, parser: str | None = None) -> Parser:
+    """Select the parser for the given file, by name if `parser` is provided or else by extension.
+
+    Files with unrecognized extensions are parsed as YAML:
+
+    >>> get_parser("config.json") is PARSERS["json"]
+    True
+    >>> get_parser("config.cfg") is get_parser("config.YML") is PARSERS["yaml"]
+    True
+    >>> get_parser("config.json", "unknown")
+    Traceback (most recent call last):
+    ...
+    ValueError: unknown config parser 'unknown'; expected one of: ...
+
+    Args:
+        file_path (pathlib.Path | builtins.str): the path to the config file
+        parser (typing.Optional[builtins.str]): if provided, the name of a registered parser
+
+    Raises:
+        builtins.ValueError: `parser` is not the name of a registered parser
+
+    Returns:
+        pyspry.base.Parser: the function to deserialize the raw file contents
+    """  # noqa: RST301
+    name = parser_name(file_path, parser)
+    try:
+        return PARSERS[name]
+    except KeyError as e:
+        raise ValueError(
+            f"unknown config parser '{name}'; expected one of: {', '.join(sorted(PARSERS))}"
+        ) from e
+
+
+def parser_name(file_path: Path | str, parser: str | None = None) -> str:
+    """Return `parser` if provided, or else the name of the parser registered for the extension.
+
+    >>> parser_name("config.JSON"), parser_name("config.cfg"), parser_name("config.cfg", "json")
+    ('json', 'yaml', 'json')
+
+    Args:
+        file_path (pathlib.Path | builtins.str): the path to the config file
+        parser (typing.Optional[builtins.str]): if provided, the name of a parser
+
+    Returns:
+        builtins.str: the name of the parser to use, which may not be registered
+    """
+    return parser or EXTENSIONS.get(Path(file_path).suffix.lower(), DEFAULT_PARSER)
+
+
+@register_parser("yaml", ".yaml", ".yml")
+def parse_yaml(raw: bytes) -> Any:
+    """Parse YAML with `libyaml` bindings, if available, or else the pure-Python loader.
+
+    >>> parse_yaml(b"A: [1, 2]")
+    {'A': [1, 2]}
+    """
+    return yaml.load(raw, Loader=YAMLLoader)  # nosec B506
+
+
+@register_parser("json", ".json")
+def parse_json(raw: bytes) -> Any:
+    """Parse JSON with the standard library.
+
+    >>> parse_json(b'{"A": [1, 2]}')
+    {'A': [1, 2]}
+    """
+    return json.loads(raw)
+
+
+@register_parser("toml", ".toml")
+def parse_toml(raw: bytes) -> Any:
+    """Parse TOML with `tomllib` (or `tomli`, before Python 3.11).
+
+    Raises:
+        builtins.ImportError: neither `tomllib` nor `tomli` is available
+    """
+    try:
+        # stdlib
+        import tomllib
+    except ImportError:
+        try:
+            # third party
+            import tomli as tomllib  # type: ignore[no-redef]
+        except ImportError as e:
+            raise ImportError(
+                "parsing TOML config files requires the 'tomli' package before Python 3.11"
+            ) from e
+    return tomllib.loads(raw.decode("UTF-8"))
+
 
 def load_env(prefix: str | None) -> dict[str, Any]:
     """Load the environment variables into a dictionary.
@@ -424,21 +1672,264 @@ def load_env(prefix: str | None) -> dict[str, Any]:
     )
 
 
-def load_yaml(f_obj: TextIOWrapper, prefix: str | None) -> dict[str, Any]:
-    """Load the YAML file from the given file object.
+def decode_env(environ: Mapping[str, str]) -> dict[str, Any]:
+    """Deserialize the JSON-encoded values of the given environment variables.
+
+    Values that aren't valid JSON are kept as plain strings:
+
+    >>> decode_env({"APP_A": "[1, 2]", "APP_B": "a string", "APP_C": "3"})
+    {'APP_A': [1, 2], 'APP_B': 'a string', 'APP_C': 3}
+
+    The decoded values are cached, keyed by the names and values of the variables, so repeated
+    loads with an unchanged environment don't decode them again. Treat the decoded containers as
+    read-only.
 
     Args:
-        f_obj (io.TextIOWrapper): the file object to read
+        environ (typing.Mapping[builtins.str, builtins.str]): the environment variables to decode
+
+    Returns:
+        dict[builtins.str, typing.Any]: the deserialized environment variables
+    """
+    return dict(_decode_env(tuple(environ.items())))
+
+
+@functools.lru_cache(maxsize=ENV_CACHE_SIZE)
+def _decode_env(items: tuple[tuple[str, str], ...]) -> tuple[tuple[str, Any], ...]:
+    decoded = []
+    for key, value in items:
+        try:
+            parsed = json.loads(value) if maybe_json(value) else value
+        except json.JSONDecodeError:
+            # the value must just be a simple string
+            parsed = value
+        decoded.append((key, parsed))
+    return tuple(decoded)
+
+
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_START = frozenset('{["-0123456789')
+_JSON_CONSTANTS = frozenset(["true", "false", "null", "NaN", "Infinity"])
+
+
+def maybe_json(value: str) -> bool:
+    """Check if the value could be decoded by `json.loads`, without decoding it.
+
+    This is a cheap test of the first character, so most plain strings (host names, paths, etc.)
+    are never passed to the JSON decoder:
+
+    >>> [maybe_json(v) for v in ('{"A": 1}', " 3", "null", "localhost", "/tmp", "", "10.0.0.1")]
+    [True, True, True, False, False, False, True]
+
+    Args:
+        value (builtins.str): the raw value of an environment variable
+
+    Returns:
+        builtins.bool: `False` if the value is certainly not JSON
+    """
+    stripped = value.strip(_JSON_WHITESPACE)
+    return bool(stripped) and (stripped[0] in _JSON_START or stripped in _JSON_CONSTANTS)
+
+
+def defer_env(environ: Mapping[str, str], min_size: int) -> dict[str, str]:
+    """Select the environment variables whose decoding can be deferred until they're accessed.
+
+    Only JSON objects and arrays of at least `min_size` characters are deferred. A variable is
+    never deferred if its name overlaps with another variable's name, because applying it later
+    could change how the two are merged:
+
+    >>> defer_env({"APP_A": "[1, 2]", "APP_B": "[3, 4]", "APP_B_0": "5", "APP_C": "6"}, 4)
+    {'APP_A': '[1, 2]'}
+
+    Args:
+        environ (typing.Mapping[builtins.str, builtins.str]): the environment variables to check
+        min_size (builtins.int): the minimum length of a deferred value
+
+    Returns:
+        dict[builtins.str, builtins.str]: the variables to decode later
+    """
+    large = [key for key, value in environ.items() if _is_large_json(value, min_size)]
+    return {key: environ[key] for key in large if not _overlaps_other(key, environ)}
+
+
+def _is_large_json(value: str, min_size: int) -> bool:
+    """Check if `value` is a JSON object or array of at least `min_size` characters."""
+    return len(value) >= min_size and value.lstrip(_JSON_WHITESPACE)[:1] in ("{", "[")
+
+
+def _overlaps(name: str, other: str) -> bool:
+    """Check if either name is a prefix of the other."""
+    return name.startswith(other) or other.startswith(name)
+
+
+def _overlaps_other(name: str, names: Iterable[str]) -> bool:
+    """Check if `name` overlaps (see `_overlaps`) with any of the other `names`."""
+    return any(other != name and _overlaps(name, other) for other in names)
+
+
+def filter_prefix(data: Mapping[Any, Any], prefix: str | None) -> dict[str, Any]:
+    """Filter the top-level keys of a parsed config file to those starting with the prefix.
+
+    >>> filter_prefix({"APP_A": 1, "OTHER_A": 2, 3: 4}, "APP")
+    {'APP_A': 1}
+
+    Args:
+        data (typing.Mapping[typing.Any, typing.Any]): the deserialized config file
         prefix (builtins.str): if specified, filter keys to those starting with this prefix
 
     Returns:
-        dict[builtins.str, typing.Any]: the deserialized YAML file
+        dict[builtins.str, typing.Any]: the filtered config, with all keys converted to strings
     """
     return {
         str(key): value
-        for key, value in yaml.safe_load(f_obj).items()
+        for key, value in data.items()
         if not prefix or str(key).startswith(f"{prefix}{NestedDict.sep}")
     }
 
 
+def load_yaml(f_obj: TextIOWrapper, prefix: str | None) -> dict[str, Any]:
+    """Load the YAML file from the given file object.
+
+    Args:
+        f_obj (io.TextIOWrapper): the file object to read
+        prefix (builtins.str): if specified, filter keys to those starting with this prefix
+
+    Returns:
+        dict[builtins.str, typing.Any]: the deserialized YAML file
+    """
+    return stream_yaml(f_obj.read(), prefix)
+
+
+def stream_yaml(stream: bytes | str, prefix: str | None) -> dict[str, Any]:
+    r"""Parse a YAML document, only constructing the top-level entries that match the prefix.
+
+    The document is processed as a stream of parser events. The subtrees of top-level keys that
+    don't start with the prefix are skipped without composing or constructing them, so the cost of
+    loading scales with the selected portion of the document:
+
+    >>> stream_yaml(b"APP_A: {B: [1, 2]}\nOTHER_A: {B: 3}\nAPP_C: 4", "APP")
+    {'APP_A': {'B': [1, 2]}, 'APP_C': 4}
+
+    Documents that can't be filtered this way are parsed in full and then filtered. This happens
+    if the root node isn't a plain mapping, if it has a merge key (`<<`) or a non-scalar key, or if
+    a selected entry refers to an anchor defined in a skipped subtree:
+
+    >>> stream_yaml(b"OTHER: &anchor {B: 3}\nAPP_A: *anchor", "APP")
+    {'APP_A': {'B': 3}}
+
+    Args:
+        stream (builtins.bytes | builtins.str): the YAML document
+        prefix (builtins.str): if specified, filter keys to those starting with this prefix
+
+    Returns:
+        dict[builtins.str, typing.Any]: the deserialized (and filtered) YAML document
+    """  # noqa: RST213
+    if prefix:
+        loader = _PrefixLoader(stream, f"{prefix}{NestedDict.sep}")
+        try:
+            data = loader.get_filtered_data()
+        finally:
+            loader.dispose()
+        if data is not None:
+            return data
+    return filter_prefix(yaml.load(stream, Loader=YAMLLoader), prefix)  # nosec B506
+
+
+class _PrefixLoader(YAMLLoader, Composer):  # type: ignore[misc,valid-type]
+    """Extend the YAML loader to compose and construct individual top-level entries."""
+
+    MERGE_TAG = "tag:yaml.org,2002:merge"
+
+    def __init__(self, stream: bytes | str, prefix: str) -> None:
+        YAMLLoader.__init__(self, stream)
+        # `Composer.__init__` isn't called by the C-accelerated loader
+        self.anchors: dict[str, Node] = {}
+        self.prefix = prefix
+        self.skipped_anchors = False
+
+    def get_filtered_data(self) -> dict[str, Any] | None:
+        """Construct the matching top-level entries, or return `None` to request a full parse."""
+        self.get_event()  # StreamStartEvent
+        if self.check_event(StreamEndEvent):
+            return {}
+        document_start = self.get_event()
+        if not self.enter_root():
+            return None
+
+        data = self.construct_root()
+        if data is None:
+            return None
+
+        self.get_event()  # MappingEndEvent
+        self.get_event()  # DocumentEndEvent
+        if not self.check_event(StreamEndEvent):
+            raise ComposerError(
+                "expected a single document in the stream",
+                document_start.start_mark,
+                "but found another document",
+                self.get_event().start_mark,
+            )
+        return data
+
+    def enter_root(self) -> bool:
+        """Consume the start of the root node, if it's a plain mapping."""
+        root = self.peek_event()
+        if not isinstance(root, MappingStartEvent) or root.anchor is not None:
+            return False
+        if root.tag not in (None, "!", self.DEFAULT_MAPPING_TAG):
+            return False
+        self.get_event()
+        return True
+
+    def construct_root(self) -> dict[str, Any] | None:
+        """Construct the selected entries, or return `None` if they refer to a skipped anchor."""
+        try:
+            return self.construct_entries()
+        except ComposerError:
+            if self.skipped_anchors:
+                return None
+            raise
+
+    def construct_entries(self) -> dict[str, Any] | None:
+        """Construct the entries of the root mapping whose keys start with the prefix.
+
+        Returns `None` if a key isn't a plain scalar (or is a merge key).
+        """
+        data: dict[str, Any] = {}
+        while not self.check_event(MappingEndEvent):
+            key_node = self.compose_entry()
+            if not isinstance(key_node, ScalarNode) or key_node.tag == self.MERGE_TAG:
+                return None
+            key = str(self.construct_object(key_node, deep=True))
+            if key.startswith(self.prefix):
+                data[key] = self.construct_object(self.compose_entry(), deep=True)
+            else:
+                self.skip_node()
+        return data
+
+    def compose_entry(self) -> Node:
+        """Compose the next key or value of the root mapping."""
+        # note: the parent and index are only used by path resolvers, which don't apply here
+        node = self.compose_node(None, None)  # type: ignore[arg-type]
+        assert node is not None
+        return node
+
+    def skip_node(self) -> None:
+        """Consume the events of the next node without composing it."""
+        depth = 0
+        while True:
+            event = self.get_event()
+            if isinstance(event, (ScalarEvent, CollectionStartEvent)) and event.anchor is not None:
+                self.skipped_anchors = True
+            depth += self.depth_change(event)
+            if depth == 0:
+                return
+
+    @staticmethod
+    def depth_change(event: Event) -> int:
+        """Return the change in nesting depth caused by `event`."""
+        if isinstance(event, CollectionStartEvent):
+            return 1
+        return -1 if isinstance(event, CollectionEndEvent) else 0
+
+
 logger.debug("successfully imported %s", __name__)
@@ -0,0 +1,279 @@
+"""Cache parsed config files on disk, keyed by a fingerprint of the source file.
+
+Parsing large YAML files dominates the start-up time of processes that load the same, unchanged
+config files over and over. `load_cached` stores the parsed data in a compact binary file
+(written with `marshal`) and reuses it for as long as the source file's fingerprint is unchanged:
+
+>>> import yaml
+>>> cache_dir = getfixture("tmp_path")
+>>> parsed = []
+>>> def parse(raw):
+...     parsed.append(raw)
+...     return yaml.safe_load(raw)
+
+>>> load_cached(config_path, parse, cache_dir=cache_dir)["APP_NAME_ATTR_B_K"]
+0
+>>> load_cached(config_path, parse, cache_dir=cache_dir)["APP_NAME_ATTR_B_K"]
+0
+>>> len(parsed)
+1
+
+Unlike `pickle`, `marshal` can't execute code while loading, and cache files are ignored unless
+they are owned by the current user and can't be modified by anyone else.
+"""  # noqa: RST301
+from __future__ import annotations
+
+# stdlib
+import datetime
+import hashlib
+import logging
+import marshal
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+__all__ = ["Fingerprint", "cache_path_for", "decode", "encode", "load_cached", "trusted"]
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = ".pyspry-cache"
+"""The file extension of the cache files."""
+
+CACHE_VERSION = 3
+"""Bump this number to invalidate all existing cache files when their layout changes."""
+
+_MISSING = object()
+"""Mark a missing or invalid cache file, since `None` is valid parsed data."""
+
+_DECODERS: dict[str, Callable[[str], Any]] = {
+    "date": datetime.date.fromisoformat,
+    "datetime": datetime.datetime.fromisoformat,
+    "time": datetime.time.fromisoformat,
+}
+"""Restore the values that `marshal` can't store, from their tag and ISO 8601 format."""
+
+
+class Fingerprint(NamedTuple):
+    """Identify one version of a config file."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+
+    @classmethod
+    def of(cls, path: Path, raw: bytes) -> Fingerprint:
+        """Fingerprint the file at `path`, given its contents.
+
+        Args:
+            path (pathlib.Path): the path to the source file
+            raw (builtins.bytes): the contents of the source file
+
+        Returns:
+            pyspry.cache.Fingerprint: the fingerprint of the file
+        """
+        stat = path.stat()
+        return cls(
+            str(path.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            hashlib.blake2b(raw, digest_size=16).hexdigest(),
+        )
+
+
+def cache_path_for(source: Path, cache_dir: Path | None = None, parser: str | None = None) -> Path:
+    """Return the path of the cache file for the given config file.
+
+    Without a `cache_dir`, the cache file is a hidden file next to the source file. Otherwise, the
+    cache file is named after a hash of the absolute path to the source file:
+
+    >>> cache_path_for(Path("config/settings.yml")).as_posix()
+    'config/.settings.yml.pyspry-cache'
+    >>> cache_path_for(Path("/config/settings.yml"), Path("/tmp/cache")).as_posix()
+    '/tmp/cache/settings.yml-....pyspry-cache'
+
+    The name of the parser (if provided) is included, so parsing the same file differently doesn't
+    overwrite the other cache file:
+
+    >>> cache_path_for(Path("config/settings.yml"), parser="json").as_posix()
+    'config/.settings.yml.json.pyspry-cache'
+
+    Args:
+        source (pathlib.Path): the path to the config file
+        cache_dir (typing.Optional[pathlib.Path]): if provided, store the cache file in this
+            directory
+        parser (typing.Optional[builtins.str]): if provided, the name of the parser of the file
+
+    Returns:
+        pathlib.Path: the path to the cache file
+    """
+    suffix = CACHE_SUFFIX if parser is None else f".{parser}{CACHE_SUFFIX}"
+    if cache_dir is None:
+        return source.with_name(f".{source.name}{suffix}")
+    path_hash = hashlib.blake2b(str(source.resolve()).encode(), digest_size=8).hexdigest()
+    return cache_dir / f"{source.name}-{path_hash}{suffix}"
+
+
+def load_cached(
+    source: Path | str,
+    parse: Callable[[bytes], Any],
+    cache_dir: Path | str | None = None,
+    parser: str | None = None,
+) -> Any:
+    """Load the parsed contents of a config file, reusing the cached data if it's still valid.
+
+    The cache is keyed by the absolute path, size, modification time, and content hash of the
+    source file, and by the name of the parser. If the cache file is missing, stale, or unreadable,
+    the source file is parsed and the cache file is rewritten. Failing to write the cache is
+    logged, but not raised.
+
+    Args:
+        source (pathlib.Path | builtins.str): the path to the config file
+        parse (typing.Callable[[builtins.bytes], typing.Any]): deserialize the file contents
+        cache_dir (typing.Optional[pathlib.Path | builtins.str]): if provided, store the cache
+            file in this directory instead of next to the source file
+        parser (typing.Optional[builtins.str]): the name of the parser `parse`, if it's registered
+            (see `pyspry.base.register_parser`)
+
+    Returns:
+        typing.Any: the parsed contents of the config file
+    """  # noqa: RST301
+    source = Path(source)
+    raw = source.read_bytes()
+    key = (*Fingerprint.of(source, raw), parser)
+    cache_path = cache_path_for(source, None if cache_dir is None else Path(cache_dir), parser)
+
+    data = _read_cache(source, cache_path, key)
+    if data is not _MISSING:
+        logger.debug("loaded '%s' from cache file '%s'", source, cache_path)
+        return data
+
+    data = parse(raw)
+    try:
+        encoded, tagged = encode(data)
+        _write_atomic(cache_path, (CACHE_VERSION, key, tagged, encoded))
+    except (OSError, ValueError) as e:
+        logger.warning("unable to write cache file '%s': %s", cache_path, e)
+    return data
+
+
+def trusted(stat: os.stat_result) -> bool:
+    """Check that a file is owned by the current user, and can't be modified by anyone else.
+
+    Args:
+        stat (os.stat_result): the status of the file (e.g. from `os.fstat` on the open file)
+
+    Returns:
+        builtins.bool: the file is safe to load
+    """
+    if not hasattr(os, "getuid"):  # pragma: no cover
+        return True  # note: Windows doesn't report owners or permission bits
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def encode(data: Any) -> tuple[Any, bool]:
+    """Replace the dates and times in parsed `data` with tuples that `marshal` can store.
+
+    Each one is replaced by a `(tag, ISO 8601 string)` tuple. Parsed config files never contain
+    tuples, so the tags are unambiguous:
+
+    >>> encode({"A": [datetime.date(2024, 2, 29)]})
+    ({'A': [('date', '2024-02-29')]}, True)
+
+    Args:
+        data (typing.Any): the parsed data
+
+    Returns:
+        builtins.tuple[typing.Any, builtins.bool]: the encoded data, and whether it has any tags
+
+    Raises:
+        builtins.ValueError: `data` contains tuples, which would be decoded incorrectly
+    """  # noqa: DAR401
+    tagged = False
+
+    def tag(value: Any) -> Any:
+        nonlocal tagged
+        if isinstance(value, dict):
+            return {tag(key): tag(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [tag(item) for item in value]
+        if isinstance(value, (set, frozenset)):
+            return type(value)(tag(item) for item in value)
+        if isinstance(value, tuple):
+            raise ValueError(f"cannot encode tuple {value!r}")
+        name = type(value).__name__
+        if isinstance(value, (datetime.date, datetime.time)) and name in _DECODERS:
+            tagged = True
+            return name, value.isoformat()
+        return value
+
+    return tag(data), tagged
+
+
+def decode(value: Any) -> Any:
+    """Restore the dates and times replaced by `encode`.
+
+    >>> decode({"A": [("date", "2024-02-29")]})
+    {'A': [datetime.date(2024, 2, 29)]}
+
+    Args:
+        value (typing.Any): the encoded data
+
+    Returns:
+        typing.Any: the original data
+    """
+    if isinstance(value, tuple):
+        name, text = value
+        return _DECODERS[name](text)
+    if isinstance(value, (dict, list, set, frozenset)):
+        return _decode_container(value)
+    return value
+
+
+def _decode_container(value: dict[Any, Any] | list[Any] | set[Any] | frozenset[Any]) -> Any:
+    """Decode the items of a container, see `decode`."""
+    if isinstance(value, dict):
+        return {decode(key): decode(item) for key, item in value.items()}
+    return type(value)(decode(item) for item in value)
+
+
+def _read_cache(source: Path, cache_path: Path, key: tuple[Any, ...]) -> Any:
+    """Read the cached data of `source`, or `_MISSING` if the cache file isn't valid for `key`."""
+    try:
+        version, cached_key, tagged, data = _read_trusted(cache_path)
+        if (version, cached_key) != (CACHE_VERSION, key):
+            logger.debug("discarding stale cache file '%s'", cache_path)
+            return _MISSING
+        return decode(data) if tagged else data
+    except FileNotFoundError:
+        logger.debug("no cache file for '%s'", source)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning("ignoring unreadable cache file '%s': %s", cache_path, e)
+    return _MISSING
+
+
+def _read_trusted(path: Path) -> Any:
+    """Unmarshal the file at `path`, if it passes the checks of `trusted`."""
+    with path.open("rb") as f:
+        if not trusted(os.fstat(f.fileno())):
+            raise PermissionError("not owned by the current user, or writable by others")
+        # note: `marshal` only creates plain data, and the file was checked above; reading the
+        # whole file first is much faster than `marshal.load`, which reads each object
+        return marshal.loads(f.read())  # nosec B302
+
+
+def _write_atomic(path: Path, obj: Any) -> None:
+    """Marshal `obj` to a temporary file, then move it into place to avoid partial reads."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(marshal.dumps(obj))
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+logger.debug("successfully imported %s", __name__)
@@ -0,0 +1,349 @@
+"""Compile loaded settings into a plain Python module of constants.
+
+Importing a compiled module is a `marshal` load of its cached bytecode: no YAML parsing, JSON
+decoding, or `pyspry.NestedDict` construction. Each top-level setting becomes a module constant
+(without the prefix), so the module works as a Django settings module:
+
+>>> from pyspry.base import ConfigLoader
+>>> compiled_path = getfixture("tmp_path") / "compiled_settings.py"
+>>> loader = ConfigLoader(str(config_path), "APP_NAME")
+>>> compile_settings(compiled_path, loader) == compiled_path
+True
+>>> compiled = load_compiled(compiled_path, "__compiled_settings", loader)
+>>> compiled.EXAMPLE_PARAM, compiled.ATTR_A
+('a string!', [1, 2, 3])
+
+Other names (with the prefix, or traversing nested settings) are resolved by a `pyspry.Settings`
+object, which is only created when such a name is first accessed:
+
+>>> compiled.APP_NAME_ATTR_B_K
+0
+
+The first line of the module holds the fingerprints of the config files and of the environment
+variables with the prefix. `load_compiled` (and so `pyspry.base.bootstrap_module`, if the
+environment variable named by `pyspry.base.ConfigLoader.VARNAME_COMPILED_PATH` is set) reads them
+before executing the module, and ignores the module once they no longer match:
+
+>>> getfixture("monkeypatch").setenv("APP_NAME_EXAMPLE_PARAM", "changed")
+>>> load_compiled(compiled_path, "__compiled_settings", loader) is None
+True
+
+To compile the settings configured by environment variables (see `pyspry.base.ConfigLoader`):
+
+    python -m pyspry.compiled compiled_settings.py
+
+Like any settings module, the constants are shared by all importers, so treat them as read-only.
+"""  # noqa: RST301
+from __future__ import annotations
+
+# stdlib
+import argparse
+import datetime
+import hashlib
+import importlib
+import importlib.util
+import json
+import keyword
+import logging
+import math
+import os
+import py_compile
+import sys
+import tempfile
+import threading
+import types
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+if TYPE_CHECKING:  # pragma: no cover
+    # local
+    from pyspry.base import ConfigLoader, Settings
+
+__all__ = ["compile_settings", "fallback", "fingerprint", "load_compiled", "write_module"]
+
+logger = logging.getLogger(__name__)
+
+COMPILED_VERSION = 2
+"""Bump this number to invalidate all existing compiled modules when their layout changes."""
+
+FINGERPRINT_HEADER = "# pyspry fingerprint: "
+"""Start the first line of compiled modules, followed by their fingerprint in JSON format."""
+
+
+def fingerprint(loader: ConfigLoader) -> dict[str, Any]:
+    """Identify the inputs of `loader`: its config files, prefix, parser, and environment variables.
+
+    Config files are identified by their size and the hash of their contents, so compiled modules
+    stay valid when the files are copied or touched, e.g. while building a container image.
+
+    Args:
+        loader (pyspry.base.ConfigLoader): the loader reading the settings
+
+    Returns:
+        builtins.dict[builtins.str, typing.Any]: the fingerprint, as plain data
+    """
+    files = []
+    for path in loader.paths:
+        raw = Path(path).read_bytes()
+        files.append([len(raw), hashlib.blake2b(raw, digest_size=16).hexdigest()])
+
+    base = importlib.import_module("pyspry.base")
+    # note: the paths of compiled modules and snapshots may share the prefix, but they don't affect
+    # the settings
+    ignored = {base.ConfigLoader.VARNAME_COMPILED_PATH, base.ConfigLoader.VARNAME_SHARED_PATH}
+    environ = sorted(
+        (key, value) for key, value in base.load_env(loader.prefix).items() if key not in ignored
+    )
+    return {
+        "version": COMPILED_VERSION,
+        "prefix": loader.prefix,
+        "parser": loader.parser,
+        "files": files,
+        "environ": hashlib.blake2b(json.dumps(environ).encode(), digest_size=16).hexdigest(),
+    }
+
+
+def _literal(value: Any) -> str:
+    """Return the Python source of a value loaded from a config file or environment variable."""
+    if value is None or isinstance(value, (bool, int, str, bytes, datetime.date)):
+        # note: the `repr()` of dates and times relies on the `datetime` import
+        return repr(value)
+    if isinstance(value, float):
+        return repr(value) if math.isfinite(value) else f'float("{value}")'
+    return _container_literal(value)
+
+
+def _container_literal(value: Any) -> str:
+    """Return the Python source of a container, see `_literal`."""
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_literal(k)}: {_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, list):
+        return f"[{_join_literals(value)}]"
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}([{_join_literals(value)}])"
+    raise TypeError(f"cannot compile a value of type {type(value).__name__}: {value!r}")
+
+
+def _join_literals(items: Iterable[Any]) -> str:
+    """Return the comma-separated Python source of `items`."""
+    return ", ".join(_literal(item) for item in items)
+
+
+def write_module(output: Path | str, settings: Settings, inputs: dict[str, Any]) -> Path:
+    """Write `settings` to a Python module at `output`, and compile its bytecode.
+
+    Args:
+        output (pathlib.Path | builtins.str): the path of the module to write
+        settings (pyspry.base.Settings): the fully loaded settings
+        inputs (builtins.dict[builtins.str, typing.Any]): the fingerprint of the inputs of
+            `settings` (see `fingerprint`)
+
+    Returns:
+        pathlib.Path: the path of the module
+
+    Raises:
+        builtins.TypeError: the settings contain a value that can't be written as a literal
+    """  # noqa: DAR402
+    output = Path(output)
+    config = settings.serialize()
+    if not isinstance(config, dict):
+        raise TypeError(f"cannot compile settings based on a list: {config!r}")
+
+    lines = [
+        f"{FINGERPRINT_HEADER}{json.dumps(inputs)}",
+        "# This module was generated by `python -m pyspry.compiled`; do not edit it.",
+        "# pylint: skip-file",
+        "# flake8: noqa",
+        "import datetime",
+        "",
+        "from pyspry.compiled import fallback as _fallback",
+        "",
+        f"_pyspry_fingerprint = {_literal(inputs)}",
+        "",
+        "_pyspry_config = {",
+        *(f"    {_literal(key)}: {_literal(value)}," for key, value in config.items()),
+        "}",
+        "",
+    ]
+    lines += _aliases(settings, config)
+    lines += ["", "__getattr__ = _fallback(globals())", ""]
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output.parent, prefix=output.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="UTF-8") as f:
+            f.write("\n".join(lines))
+        os.replace(tmp_name, output)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    # note: hash-based bytecode stays valid only as long as the source is unchanged, even if the
+    # module is rewritten within the resolution of the file system's modification times
+    py_compile.compile(
+        str(output), doraise=True, invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH
+    )
+    logger.info("compiled %d settings to '%s'", len(config), output)
+    return output
+
+
+def _aliases(settings: Settings, config: dict[str, Any]) -> list[str]:
+    """Return the assignments exposing each setting as a constant of the compiled module."""
+    # note: expose the settings by the names `Settings` uses, i.e. without the prefix
+    head = settings.maybe_add_prefix("") if settings.prefix else ""
+    lines = []
+    for key in config:
+        name = key[len(head) :] if key.startswith(head) else key
+        if _is_public_name(name):
+            lines.append(f"{name} = _pyspry_config[{key!r}]")
+    return lines
+
+
+def _is_public_name(name: str) -> bool:
+    """Check if `name` can be assigned as a public, module-level constant."""
+    return name.isidentifier() and not keyword.iskeyword(name) and not name.startswith("_")
+
+
+def compile_settings(output: Path | str, loader: ConfigLoader | None = None) -> Path:
+    """Load the settings with `loader`, then write them to a Python module at `output`.
+
+    Args:
+        output (pathlib.Path | builtins.str): the path of the module to write
+        loader (typing.Optional[pyspry.base.ConfigLoader]): the loader to use; defaults to
+            `pyspry.base.ConfigLoader.create()`
+
+    Returns:
+        pathlib.Path: the path of the module
+    """
+    if loader is None:
+        loader = importlib.import_module("pyspry.base").ConfigLoader.create()
+
+    # note: fingerprint the files before reading them, so a concurrent change makes the module stale
+    inputs = fingerprint(loader)
+    return write_module(output, loader.read_settings(), inputs)
+
+
+def load_compiled(
+    path: Path | str,
+    module_name: str,
+    loader: ConfigLoader,
+    spec: ModuleSpec | None = None,
+) -> types.ModuleType | None:
+    """Import the compiled module at `path`, unless it's missing or stale.
+
+    Args:
+        path (pathlib.Path | builtins.str): the path of the compiled module
+        module_name (builtins.str): the name to give the module
+        loader (pyspry.base.ConfigLoader): the loader whose inputs must match the fingerprint
+        spec (typing.Optional[importlib.machinery.ModuleSpec]): if provided, replace the spec of
+            the module, e.g. so that `importlib.reload()` bootstraps the settings again
+
+    Returns:
+        typing.Optional[types.ModuleType]: the module, or `None` if it can't be used
+    """
+    if not Path(path).is_file():
+        logger.info("compiled settings '%s' not found", path)
+        return None
+
+    # note: stale modules are never executed; the fingerprint is checked again after executing the
+    # module, in case it was replaced in the meantime
+    current = _check_fingerprint(path, loader)
+    module = None if current is None else _execute(path, module_name, current)
+    if module is not None and spec is not None:
+        module.__spec__ = spec
+    return module
+
+
+def _check_fingerprint(path: Path | str, loader: ConfigLoader) -> dict[str, Any] | None:
+    """Compare the first line of the compiled module at `path` with the inputs of `loader`.
+
+    Returns:
+        typing.Optional[builtins.dict[builtins.str, typing.Any]]: the fingerprint of the inputs,
+            or `None` if the module is stale or unreadable
+    """
+    try:
+        current = fingerprint(loader)
+        with open(path, encoding="UTF-8") as f:
+            header = f.readline()
+        compiled = json.loads(header[len(FINGERPRINT_HEADER) :])
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning("ignoring compiled settings '%s': %s", path, e)
+        return None
+
+    if not header.startswith(FINGERPRINT_HEADER) or compiled != current:
+        logger.info("ignoring stale compiled settings '%s'", path)
+        return None
+    return current
+
+
+def _execute(
+    path: Path | str, module_name: str, current: dict[str, Any]
+) -> types.ModuleType | None:
+    """Execute the compiled module at `path`, unless it doesn't match the `current` fingerprint."""
+    file_spec = importlib.util.spec_from_file_location(module_name, path)
+    if file_spec is None or file_spec.loader is None:
+        logger.info("compiled settings '%s' not found", path)
+        return None
+
+    module = importlib.util.module_from_spec(file_spec)
+    try:
+        file_spec.loader.exec_module(module)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning("ignoring compiled settings '%s': %s", path, e)
+        return None
+
+    if getattr(module, "_pyspry_fingerprint", None) != current:
+        logger.info("ignoring stale compiled settings '%s'", path)
+        return None
+    logger.debug("loaded compiled settings '%s' as '%s'", path, module_name)
+    return module
+
+
+def fallback(namespace: dict[str, Any]) -> Callable[[str], Any]:
+    """Create the `__getattr__` function of a compiled module (see PEP 562).
+
+    Names that are not module constants are resolved by a `pyspry.Settings` object, created from
+    the compiled config on first use.
+
+    Args:
+        namespace (builtins.dict[builtins.str, typing.Any]): the globals of the compiled module
+
+    Returns:
+        typing.Callable[[builtins.str], typing.Any]: the function resolving missing attributes
+    """
+    config: dict[str, Any] = namespace["_pyspry_config"]
+    lock = threading.Lock()
+    settings: Settings | None = None
+
+    def __getattr__(name: str) -> Any:
+        nonlocal settings
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        if name in config:
+            return config[name]
+        if settings is None:
+            with lock:
+                if settings is None:
+                    base = importlib.import_module("pyspry.base")
+                    prefix = namespace["_pyspry_fingerprint"]["prefix"]
+                    settings = base.Settings(config, {}, prefix or "")
+        return getattr(settings, name)
+
+    return __getattr__
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Compile the settings configured by environment variables to the given path."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("output", type=Path, help="the path of the Python module to write")
+    args = parser.parse_args(argv)
+
+    compile_settings(args.output)
+    return 0
+
+
+logger.debug("successfully imported %s", __name__)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Enumerate the flattened keys of nested mappings without recursion."""
+# stdlib
+import typing
+
+__all__ = ["flatten"]
+
+
+def flatten(
+    mapping: typing.Mapping[typing.Any, typing.Any], prefix: str = "", sep: str = "_"
+) -> typing.Iterator[str]:
+    """Yield the key of every nested value, joined to the keys of its parents with `sep`.
+
+    Keys are yielded depth-first, each parent before its children. Each container's prefix is built
+    once, so the cost is one string per key regardless of the depth:
+
+    >>> list(flatten({"A": {"B": {"C": 0}, "D": [1]}, "E": 2}, prefix="X"))
+    ['X_A', 'X_A_B', 'X_A_B_C', 'X_A_D', 'X_E']
+
+    Args:
+        mapping (typing.Mapping[typing.Any, typing.Any]): the nested mapping
+        prefix (builtins.str): prepend this string (and `sep`) to each key, if non-empty
+        sep (builtins.str): the separator between layers of nesting
+
+    Yields:
+        builtins.str: each flattened key
+    """
+    stack = [(f"{prefix}{sep}" if prefix else "", _children(mapping))]
+    while stack:
+        start, items = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            continue
+        key, value = item
+        name = f"{start}{key}"
+        yield name
+        if hasattr(value, "items"):
+            stack.append((f"{name}{sep}", _children(value)))
+
+
+def _children(mapping: typing.Any) -> typing.Iterator[typing.Tuple[typing.Any, typing.Any]]:
+    """Iterate over the items of `mapping`, without traversing nesting.
+
+    `pyspry.NestedDict.children` is preferred, because `items()` looks each key up in its flat-key
+    index, which would be built for every nested `pyspry.NestedDict`.
+    """
+    children = getattr(mapping, "children", None)
+    return iter(children() if children is not None else mapping.items())
@@ -1,11 +1,14 @@
 """Override the `collections.abc.KeysView` class for Python 3.8."""
 # stdlib
 from collections.abc import KeysView, Mapping
-from typing import Iterator
+from typing import Callable, Collection, Iterator, Optional
 
 # third party
 from typing_extensions import TypeAlias
 
+# local
+from pyspry.keysview.flatten import flatten
+
 # pylint: disable=duplicate-code
 
 KT: TypeAlias = str
@@ -26,24 +29,41 @@ class NestedKeysView(KeysView):  # type: ignore[type-arg]
 
     _mapping: Mapping  # type: ignore[type-arg]
 
-    def __init__(self, mapping: Mapping, prefix: str = "", sep: str = "_") -> None:  # type: ignore[type-arg]
+    def __init__(
+        self,
+        mapping: Mapping,  # type: ignore[type-arg]
+        prefix: str = "",
+        sep: str = "_",
+        flat_keys: Optional[Callable[[], Collection[str]]] = None,
+    ) -> None:
         """Prepend `prefix` to each key in the view, with a `sep` delimiter.
 
         Args:
             mapping (Mapping[KT, Any]): create a view of this mapping object's keys
             prefix (str): prepend this string to each key in the view; defaults to ""
             sep (str): join each layer of nested keys with this separator; defaults to "_".
+            flat_keys (Optional[Callable]): if provided, return the (cached) flattened keys of
+                `mapping` joined with `sep`, to use when there's no `prefix`
         """
+        self.flat_keys = flat_keys
         self.sep = sep
         self.prefix = prefix
         super().__init__(mapping)  # pyright: ignore
 
+    def __contains__(self, key: object) -> bool:
+        """Check for `key` among the flattened keys."""
+        return key in self._flattened()
+
     def __iter__(self) -> Iterator[str]:
         """Override the parent class to return a string matching layers of nesting."""
-        start = f"{self.prefix}{self.sep}" if self.prefix else ""
-        for key, value in self._mapping.items():  # pyright: ignore
-            if hasattr(value, "items"):  # pyright: ignore
-                yield f"{start}{key}"
-                yield from self.__class__(value, f"{start}{key}", self.sep)  # pyright: ignore
-            else:
-                yield f"{start}{key}"
+        return iter(self._flattened())
+
+    def __len__(self) -> int:
+        """Count the flattened keys."""
+        return len(self._flattened())
+
+    def _flattened(self) -> Collection[str]:
+        """Return the flattened keys, from `flat_keys` if possible."""
+        if self.flat_keys is not None and not self.prefix:
+            return self.flat_keys()
+        return dict.fromkeys(flatten(self._mapping, self.prefix, self.sep)).keys()
@@ -3,6 +3,9 @@
 import logging
 import typing
 
+# local
+from pyspry.keysview.flatten import flatten
+
 logger = logging.getLogger(__name__)
 
 KT = typing.TypeVar("KT")
@@ -25,11 +28,16 @@ class NestedKeysView(typing.KeysView[KT]):
     """  # pylint: disable=line-too-long
 
     _mapping: typing.Mapping[KT, typing.Any]
+    flat_keys: typing.Optional[typing.Callable[[], typing.Collection[str]]]
     prefix: str
     sep: str
 
     def __init__(
-        self, mapping: typing.Mapping[KT, typing.Any], prefix: str = "", sep: str = "_"
+        self,
+        mapping: typing.Mapping[KT, typing.Any],
+        prefix: str = "",
+        sep: str = "_",
+        flat_keys: typing.Optional[typing.Callable[[], typing.Collection[str]]] = None,
     ) -> None:
         """Prepend `prefix` to each key in the view, with a `sep` delimiter.
 
@@ -40,20 +48,35 @@ class NestedKeysView(typing.KeysView[KT]):
                 an empty string
             sep (builtins.str): join each layer of nested keys with this separator; defaults to
                 `_`
+            flat_keys (typing.Optional[typing.Callable]): if provided, return the (cached)
+                flattened keys of `mapping` joined with `sep`, to use when there's no `prefix`
         """
+        self.flat_keys = flat_keys
         self.sep = sep
         self.prefix = prefix
         super().__init__(mapping)
 
+    def __contains__(self, key: object) -> bool:
+        """Check for `key` among the flattened keys."""
+        return key in self._flattened()
+
     def __iter__(self) -> typing.Iterator[str]:  # type: ignore[override]
         """Override the parent class to return a string matching layers of nesting."""
-        start = f"{self.prefix}{self.sep}" if self.prefix else ""
-        for key, value in self._mapping.items():
-            if hasattr(value, "items"):
-                yield f"{start}{key}"
-                yield from self.__class__(value, f"{start}{key}", self.sep)
-            else:
-                yield f"{start}{key}"
+        return iter(self._flattened())
+
+    def __len__(self) -> int:
+        """Count the flattened keys."""
+        return len(self._flattened())
+
+    def _flattened(self) -> typing.Collection[str]:
+        """Return the flattened keys, from `NestedKeysView.flat_keys` if possible.
+
+        A `pyspry.NestedDict` caches its flattened keys until it's modified (see
+        `pyspry.NestedDict.flat_keys`), so `len()` and `in` are constant-time.
+        """
+        if self.flat_keys is not None and not self.prefix:
+            return self.flat_keys()
+        return dict.fromkeys(flatten(self._mapping, self.prefix, self.sep)).keys()
 
 
 logger.debug("successfully imported %s", __name__)
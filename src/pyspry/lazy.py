@@ -0,0 +1,147 @@
+"""Defer loading settings (and importing `pyspry.base`) until a setting is first accessed.
+
+If the environment variable named by `VARNAME_LAZY` is truthy, `bootstrap` installs a
+`LazySettingsContainer` in `sys.modules`. Importing `pyspry.settings` is then nearly free: `yaml`
+and the rest of `pyspry.base` are only imported, and the config files only parsed, when an
+attribute is read from the container:
+
+>>> monkeypatch = getfixture("monkeypatch")
+>>> monkeypatch.setenv(VARNAME_LAZY, "true")
+>>> lazy_settings = bootstrap("__lazy_settings")
+>>> lazy_settings
+pyspry.lazy.LazySettingsContainer('__lazy_settings', loaded=False)
+>>> lazy_settings.TEST_RUNNER
+'django.test.runner.DiscoverRunner'
+>>> lazy_settings
+pyspry.lazy.LazySettingsContainer('__lazy_settings', loaded=True)
+
+This module only depends on the standard library.
+"""  # noqa: RST301
+from __future__ import annotations
+
+# stdlib
+import importlib
+import importlib.util
+import logging
+import os
+import sys
+import threading
+import types
+from collections.abc import Container
+from importlib.machinery import ModuleSpec
+from typing import Any, Iterable
+
+__all__ = ["LazySettingsContainer", "VARNAME_LAZY", "bootstrap"]
+
+logger = logging.getLogger(__name__)
+
+VARNAME_LAZY = "PYSPRY_LAZY"
+"""The name of the environment variable enabling lazy loading of `pyspry.settings`."""
+
+_TRUTHY = frozenset(["1", "on", "true", "y", "yes"])
+
+
+class LazySettingsContainer(types.ModuleType):
+    """Stand in for a `pyspry.base.SettingsContainer` until one of its attributes is accessed.
+
+    The settings module is created once, on first use, by `pyspry.base.create_module` (so a shared
+    snapshot or compiled settings are used if configured); every later access is delegated to it.
+    """
+
+    __name__: str
+    """The name of the module that has been bootstrapped by this object."""
+
+    __spec__: ModuleSpec | None
+    """The `ModuleSpec` object is used by `importlib` internals."""
+
+    __container: types.ModuleType | None
+    """The loaded settings module, or `None` until the first attribute access."""
+
+    __lock: threading.Lock
+    """Ensure the settings are loaded only once, even if several threads access them."""
+
+    def __init__(self, module_name: str, spec: ModuleSpec | None) -> None:  # noqa: D107
+        # these properties are used by `importlib.reload()`:
+        self.__name__ = module_name
+        self.__spec__ = spec
+
+        self.__container = None
+        self.__lock = threading.Lock()
+
+    def __contains__(self, obj: Any) -> bool:
+        """Load the settings, then check them for the given name.
+
+        Compiled and snapshot modules don't support `in`, so they're checked for an attribute.
+        """
+        container: Any = self._load()
+        if isinstance(container, Container):
+            return obj in container
+        return isinstance(obj, str) and hasattr(container, obj)
+
+    def __dir__(self) -> Iterable[str]:
+        """Load the settings, then list their names."""
+        return dir(self._load())
+
+    def __getattr__(self, name: str) -> Any:
+        """Load the settings, then retrieve the attribute from them."""
+        if name.startswith("__") and name.endswith("__"):
+            # note: keep introspection (e.g. by `doctest` or `inspect`) from loading the settings
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        """Show whether the settings have been loaded, without loading them."""
+        return (
+            f"{__name__}.{self.__class__.__name__}("
+            f"'{self.__name__}', loaded={self.__container is not None})"
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: D105
+        if name in LazySettingsContainer.__annotations__:
+            super().__setattr__(name, value)
+        else:
+            setattr(self._load(), name, value)
+
+    def __str__(self) -> str:  # noqa: D105
+        return str(self._load())
+
+    def _load(self) -> types.ModuleType:
+        """Create the settings module with `pyspry.base.create_module` on first use."""
+        container = self.__container
+        if container is None:
+            with self.__lock:
+                container = self.__container
+                if container is None:
+                    logger.debug("loading settings for lazy module '%s'", self.__name__)
+                    base = importlib.import_module("pyspry.base")
+                    container = base.create_module(self.__name__, self.__spec__)
+                    self.__container = container
+        return container
+
+
+def bootstrap(module_name: str) -> types.ModuleType:
+    """Replace the named module with a settings container, loading it now or on first use.
+
+    If the environment variable `VARNAME_LAZY` is unset, this is the same as
+    `pyspry.base.bootstrap_module`.
+
+    Args:
+        module_name (builtins.str): the name of the module to replace
+
+    Returns:
+        types.ModuleType: the container installed in `sys.modules`
+    """
+    if os.environ.get(VARNAME_LAZY, "").strip().lower() not in _TRUTHY:
+        base = importlib.import_module("pyspry.base")
+        return base.bootstrap_module(module_name)  # type: ignore[no-any-return]
+
+    if sys.modules.get(module_name):
+        logger.info("replacing module '%s' with lazy settings object", module_name)
+        del sys.modules[module_name]
+
+    container = LazySettingsContainer(module_name, importlib.util.find_spec(module_name))
+    sys.modules[module_name] = container
+    return container
+
+
+logger.debug("successfully imported %s", __name__)
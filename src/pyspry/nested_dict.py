@@ -2,18 +2,69 @@
 from __future__ import annotations
 
 # stdlib
+import itertools
 import logging
+import re
+import sys
 import typing
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 
 # local
 from pyspry.keysview import NestedKeysView
+from pyspry.keysview.flatten import flatten
 
-__all__ = ["NestedDict", "NestedKeyPair"]
+__all__ = ["NestedChange", "NestedDict", "NestedKeyPair", "ReadOnlyMapping", "ReadOnlySequence"]
 
 
 logger = logging.getLogger(__name__)
 
+_GENERATIONS = itertools.count(1)
+"""Issue a unique generation for every mutation; `next()` is atomic, unlike `+= 1`."""
+
+_MISSING = object()
+"""Mark missing keys in `NestedDict.get_many`, since `None` is a valid value."""
+
+_LIST_INDEX = re.compile(r"0|[1-9][0-9]*")
+"""Match the `str` of a list index, without leading zeros or a sign."""
+
+
+class _Version:
+    """Track the mutations of a family of `NestedDict` objects that share nodes.
+
+    Storing a `NestedDict` in another joins their families (as in a union-find structure), so a
+    mutation of any node invalidates the flat-key indexes of the trees containing it, but not those
+    of unrelated trees.
+    """
+
+    __slots__ = ("parent", "rank", "value")
+
+    def __init__(self) -> None:
+        self.parent: _Version | None = None
+        self.rank = 0
+        self.value = next(_GENERATIONS)
+
+    def root(self) -> _Version:
+        """Find the representative of this family, shortening the path to it along the way."""
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        node = self
+        while node.parent is not None and node.parent is not root:
+            node.parent, node = root, node.parent
+        return root
+
+    def join(self, other: _Version) -> None:
+        """Merge the family of `other` into the family of this object."""
+        mine, theirs = self.root(), other.root()
+        if mine is theirs:
+            return
+        if mine.rank < theirs.rank:
+            mine, theirs = theirs, mine
+        elif mine.rank == theirs.rank:
+            mine.rank += 1
+        # note: generations are unique, so the indexes recorded by the absorbed family are rebuilt
+        theirs.parent = mine
+
 
 class NestedKeyPair(typing.NamedTuple):
     """A pair of keys `NestedDict` keys separated at a layer of nesting.
@@ -39,6 +90,38 @@ class NestedKeyPair(typing.NamedTuple):
         return cls(parents, children)
 
 
+class NestedChange(typing.NamedTuple):
+    """A single difference between two `NestedDict` objects; see `NestedDict.diff`.
+
+    The location of the change is stored as a `path` of keys, one per level of nesting, because
+    the keys themselves may contain `NestedDict.sep`:
+
+    >>> change = NestedChange("change", ("APP_A", "B"), 2)
+    >>> change.key
+    'APP_A_B'
+    """
+
+    op: typing.Literal["add", "remove", "change"]
+    path: tuple[str, ...]
+    value: typing.Any = None
+
+    @property
+    def key(self) -> str:
+        """Return the flattened key of the change."""
+        return NestedDict.sep.join(self.path)
+
+
+def _list_index(key: typing.Any) -> int | None:
+    """Convert `key` to a list index, if it's the `str` of one; otherwise, return `None`.
+
+    >>> _list_index("10"), _list_index("01"), _list_index("-1"), _list_index(1)
+    (10, None, None, None)
+    """
+    if isinstance(key, str) and _LIST_INDEX.fullmatch(key):
+        return int(key)
+    return None
+
+
 class NestedDict(MutableMapping):  # type: ignore[type-arg]
     """Traverse nested data structures.
 
@@ -63,10 +146,10 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
     Nested containers are converted to `NestedDict` objects:
 
     >>> d["SUB"]
-    NestedDict({'A': 1, 'B': NestedDict({'0': '1', '1': '2', '2': '3'})})
+    NestedDict({'A': 1, 'B': NestedDict(['1', '2', '3'])})
 
     >>> d["SUB_B"]
-    NestedDict({'0': '1', '1': '2', '2': '3'})
+    NestedDict(['1', '2', '3'])
 
     Nested containers can be accessed by appending the nested key name to the parent key name:
 
@@ -88,10 +171,21 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
 
     >>> "SUB_B_0" in d
     True
+
+    # Memory Layout
+
+    Nodes have no instance `__dict__` (see `__slots__`), their keys are interned, and list-based
+    nodes store their items in a `list`, so the `str` of each index is only created to look it up.
     """
 
-    __data: dict[str, typing.Any]
+    __slots__ = ("__data", "__frozen", "__index", "__is_list", "__keys", "__version")
+
+    __data: dict[str, typing.Any] | list[typing.Any]
+    __frozen: bool
+    __index: tuple[int, dict[str, typing.Any]] | None
+    __keys: tuple[int, typing.KeysView[str]] | None
     __is_list: bool
+    __version: _Version
     sep = "_"
 
     def __init__(
@@ -101,30 +195,45 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         if len(args) > 1:  # pragma: no cover
             raise TypeError(f"expected at most 1 argument, got {len(args)}")
         self.__is_list = False
-        structured_data: dict[str, typing.Any] = {}
-
-        if args:
-            data = args[0]
-            operations: dict[type, tuple[typing.Callable[[typing.Any], typing.Any], bool]] = {
-                dict: (self._ensure_structure, self.__is_list),
-                list: (
-                    lambda d: self._ensure_structure(dict(enumerate(d))),  # pyright: ignore
-                    True,
-                ),
-                self.__class__: (dict, getattr(data, "is_list", False)),
-            }
-
-            for data_type, (restructure, is_list) in operations.items():
-                if isinstance(data, data_type):
-                    structured_data = restructure(data)
-                    self.__is_list = is_list
-                    break
-
-        restructured = self._ensure_structure(kwargs)
-        structured_data.update(restructured)
-
-        self.__data = structured_data
-        self.squash()
+        self.__frozen = False
+        self.__index = None
+        self.__keys = None
+        self.__version = _Version()
+        structured_data, owned = self._structure(args[0]) if args else ({}, True)
+        self.__data = self._build_data(structured_data, owned, kwargs)
+        self._adopt_all(self.__data)
+
+    def _structure(
+        self, data: typing.Any
+    ) -> tuple[dict[str, typing.Any] | list[typing.Any], bool]:
+        """Convert the positional argument of `__init__`, and tell if its containers are owned."""
+        operations: dict[type, tuple[typing.Callable[[typing.Any], typing.Any], bool]] = {
+            dict: (self._ensure_structure, self.__is_list),
+            list: (self._ensure_items, True),
+            self.__class__: (lambda d: d._copy_data(), getattr(data, "is_list", False)),
+        }
+
+        for data_type, (restructure, is_list) in operations.items():
+            if isinstance(data, data_type):
+                self.__is_list = is_list
+                # note: the containers of another `NestedDict` are shared, not copied
+                return restructure(data), not isinstance(data, NestedDict)
+        return {}, True
+
+    def _build_data(
+        self,
+        structured_data: dict[str, typing.Any] | list[typing.Any],
+        owned: bool,
+        kwargs: dict[str, typing.Any],
+    ) -> dict[str, typing.Any] | list[typing.Any]:
+        """Squash the structured data of `__init__`, adding the keyword arguments to a mapping."""
+        if isinstance(structured_data, list):
+            if kwargs:  # pragma: no cover
+                raise TypeError("cannot add keyword arguments to a list-based NestedDict")
+            # note: list indices never contain the separator, so only the items are squashed
+            return self._squash_items(structured_data) if owned else structured_data
+        structured_data.update(self._ensure_structure(kwargs))
+        return self._squash_data(structured_data, owned)
 
     def __contains__(self, key: typing.Any) -> bool:
         """Check if `self.__data` provides the specified key.
@@ -139,30 +248,43 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
 
         >>> "KEY_MISSING" in example
         False
+
+        A key is contained exactly when `__getitem__` would find it; both are served by the
+        flat-key index.
         """
-        if key in self.__data:
-            return True
-        for k, value in self.__data.items():
-            if key.startswith(f"{k}{self.sep}") and self.maybe_strip(k, key) in value:
-                return True
-        return False
+        return key in self._index
 
     def __delitem__(self, key: str) -> None:
         """Delete the object with the specified key from the internal data structure."""
-        del self.__data[key]
+        self._check_mutable()
+        self._delete(key)
+        self._touch()
 
     def __getitem__(self, key: str) -> typing.Any:
-        """Traverse nesting according to the `NestedDict.sep` property."""
-        try:
-            return self.get_first_match(key)
-        except ValueError:
-            pass
+        """Traverse nesting according to the `NestedDict.sep` property.
 
+        Lookups are constant-time: they are answered by the flat-key index, which resolves
+        overlapping keys in the same order as `NestedDict.get_first_match`:
+
+        >>> d = NestedDict({"A": {"B": 0}})
+        >>> d["A_C"] = 1
+        >>> d["A_B"], d["A_C"]
+        (0, 1)
+
+        Keys missing from the index fall back to `NestedDict.get_first_match`, which also resolves
+        a name that repeats a key (such as `"A_A"` for the key `"A"`) to that key's value.
+
+        Raises:
+            builtins.KeyError: no value matches `key`
+        """
         try:
-            return self.__data[key]
+            return self._index[key]
         except KeyError:
             pass
-        raise KeyError(key)
+        try:
+            return self.get_first_match(key)
+        except ValueError:
+            raise KeyError(key) from None
 
     def __ior__(self, other: typing.Mapping[str, typing.Any] | list[typing.Any]) -> NestedDict:
         """Override settings in this object with settings from the specified object.
@@ -177,15 +299,17 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         >>> example.serialize()
         ['D', 'E']
         """
-        converted = NestedDict(other)
-        self.maybe_merge(converted, self)
-
-        if converted.is_list:
-            self._reduce(self, converted)
+        self._check_mutable()
+        merged = self._merge_values([(self, False), (NestedDict(other), False)], root=True)
+        if merged is not self:
+            self._replace_data(merged.__data)
+            self._touch()
         return self
 
     def __iter__(self) -> typing.Iterator[typing.Any]:
-        """Return an iterator from the internal data structure."""
+        """Return an iterator from the internal data structure (of `str` indices, for lists)."""
+        if isinstance(self.__data, list):
+            return map(str, range(len(self.__data)))
         return iter(self.__data)
 
     def __len__(self) -> int:
@@ -204,7 +328,7 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         TypeError: cannot merge [0, 1] (list: True) with NestedDict({'A': 0}) (list: False)
 
         >>> NestedDict([0, {"A": 1}]) | [1, {"B": 2}]
-        NestedDict({'0': 1, '1': NestedDict({'A': 1, 'B': 2})})
+        NestedDict([1, NestedDict({'A': 1, 'B': 2})])
         """
         if self.is_list ^ (converted := NestedDict(other)).is_list:
             raise TypeError(
@@ -212,12 +336,7 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
                 f"{self.is_list})"
             )
 
-        self.maybe_merge(converted, self)
-        if converted.is_list:
-            self._reduce(self, converted)
-            return self
-
-        return self
+        return self.merge(self, converted)
 
     def __repr__(self) -> str:
         """Use a `str` representation similar to `dict`, but wrap it in the class name."""
@@ -236,20 +355,48 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         return NestedDict(other) | self
 
     def __setitem__(self, name: str, value: typing.Any) -> None:
-        """Similar to `__getitem__`, traverse nesting at `NestedDict.sep` in the key."""
-        for data_key, data_val in list(self.__data.items()):
-            if data_key == name:
-                self._merge_or_set(name, value, data_val)
-                return
+        """Similar to `__getitem__`, traverse nesting at `NestedDict.sep` in the key.
 
-            if name.startswith(f"{data_key}{self.sep}"):
-                one_level_down = {self.maybe_strip(data_key, name): value}
-                if not self.maybe_merge(one_level_down, data_val):
-                    continue
-                self.__data.pop(name, None)
+        Only the prefixes of `name` that end at a separator are checked, so the cost of an
+        assignment grows with the depth of `name` rather than the number of keys:
+
+        >>> d = NestedDict({"A": {"B": {"C": 0}}})
+        >>> d["A_B_D"] = 1
+        >>> d
+        NestedDict({'A': NestedDict({'B': NestedDict({'C': 0, 'D': 1})})})
+        """
+        self._check_mutable()
+        try:
+            self._assign(name, value)
+        finally:
+            self._touch()
+
+    def _assign(self, name: str, value: typing.Any) -> None:
+        """Set `name`, or merge it into the first key (in order) that it equals or extends."""
+        for key in self._assignment_targets(name):
+            if key == name:
+                self._merge_or_set(name, value, self._get(name))
+                return
+            if self.maybe_merge({name[len(key) + len(self.sep) :]: value}, self._get(key)):
+                if isinstance(self.__data, dict):
+                    self.__data.pop(name, None)
                 return
+        self._set(name, value)
 
-        self.__data[name] = value
+    def _assignment_targets(self, name: str) -> list[str]:
+        """List `name` and the containers whose key is a prefix of it, in the order of the keys.
+
+        The keys are only scanned for their order when there is more than one candidate.
+        """
+        targets = [p for p, _ in self._split_points(name) if isinstance(self._get(p), MutableMapping)]
+        if self._has(name):
+            targets.append(name)
+        return self._in_order(targets) if len(targets) > 1 else targets
+
+    def _in_order(self, keys: list[str]) -> list[str]:
+        """Sort some of the keys of this object in the order of its data."""
+        order = {key: index for index, (key, _) in enumerate(self._items())}
+        return sorted(keys, key=order.__getitem__)
 
     @classmethod
     def _ensure_structure(
@@ -257,13 +404,361 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
     ) -> dict[str, typing.Any]:
         out: dict[str, typing.Any] = {}
         for key, maybe_nested in list(data.items()):
-            k = str(key)
+            k = sys.intern(str(key))
             if isinstance(maybe_nested, (dict, list)):
                 out[k] = NestedDict(maybe_nested)  # pyright: ignore
             else:
                 out[k] = maybe_nested
         return out
 
+    @classmethod
+    def _ensure_items(cls, data: typing.Iterable[typing.Any]) -> list[typing.Any]:
+        return [NestedDict(item) if isinstance(item, (dict, list)) else item for item in data]
+
+    def _copy_data(self) -> dict[str, typing.Any] | list[typing.Any]:
+        """Return a shallow copy of the internal data structure."""
+        return self.__data.copy()
+
+    def _items(self) -> typing.Iterable[tuple[str, typing.Any]]:
+        """Iterate over the keys (`str` indices, for lists) and values of this object."""
+        if isinstance(self.__data, list):
+            return zip(map(str, range(len(self.__data))), self.__data)
+        return self.__data.items()
+
+    def _as_dict(self) -> dict[str, typing.Any]:
+        """Return the internal data structure as a `dict` (keyed by `str` index, for lists)."""
+        return dict(self._items()) if isinstance(self.__data, list) else self.__data
+
+    def _values(self) -> typing.Iterable[typing.Any]:
+        """Iterate over the values of this object."""
+        return self.__data if isinstance(self.__data, list) else self.__data.values()
+
+    def _has(self, key: typing.Any) -> bool:
+        """Check for a key of this object, without traversing nesting."""
+        if isinstance(self.__data, list):
+            index = _list_index(key)
+            return index is not None and index < len(self.__data)
+        return key in self.__data
+
+    def _get(self, key: typing.Any, default: typing.Any = None) -> typing.Any:
+        """Retrieve the value of a key of this object (or `default`), without traversing nesting."""
+        if isinstance(self.__data, list):
+            index = _list_index(key)
+            return self.__data[index] if index is not None and index < len(self.__data) else default
+        return self.__data.get(key, default)
+
+    def _child(self, key: typing.Any) -> typing.Any:
+        """Retrieve the value of a key of this object, without traversing nesting.
+
+        Raises:
+            builtins.KeyError: the key does not exist
+        """  # noqa: DAR402
+        if self._has(key):
+            return self._get(key)
+        raise KeyError(key)
+
+    def _set(self, key: str, value: typing.Any) -> None:
+        """Set the value of a key of this object.
+
+        List-based objects keep a `list` while they are assigned existing indices or appended to
+        (at the next index). Any other key switches them to a `dict` keyed by `str` index, so they
+        retain every key, in order:
+
+        >>> d = NestedDict([1])
+        >>> d._set("1", 2)
+        >>> d
+        NestedDict([1, 2])
+        >>> d._set("X", 3)
+        >>> d, d.serialize()
+        (NestedDict({'0': 1, '1': 2, 'X': 3}), [1, 2, 3])
+        """
+        self._adopt(value)
+        data = self.__data
+        if isinstance(data, list):
+            index = _list_index(key)
+            if index is not None and index < len(data):
+                data[index] = value
+                return
+            if index == len(data):
+                data.append(value)
+                return
+            data = self.__data = self._as_dict()
+        data[sys.intern(key)] = value
+
+    def _delete(self, key: typing.Any) -> None:
+        """Delete a key of this object.
+
+        As with `NestedDict._set`, the indices of the remaining items never change; removing any
+        item but the last one switches list-based objects to a `dict` keyed by `str` index.
+
+        Raises:
+            builtins.KeyError: the key does not exist
+        """  # noqa: DAR402
+        data = self.__data
+        if isinstance(data, list):
+            if not self._has(key):
+                raise KeyError(key)
+            if int(key) == len(data) - 1:
+                data.pop()
+                return
+            data = self.__data = self._as_dict()
+        del data[key]
+
+    def _replace_data(self, data: dict[str, typing.Any] | list[typing.Any]) -> None:
+        """Replace the contents of this object in place, so that existing views reflect them."""
+        self._adopt_all(data)
+        if isinstance(self.__data, list) and isinstance(data, list):
+            self.__data[:] = data
+        elif isinstance(self.__data, dict) and isinstance(data, dict):
+            self.__data.clear()
+            self.__data.update(data)
+        else:
+            self.__data = data
+
+    @classmethod
+    def _split_points(cls, name: str) -> typing.Iterator[tuple[str, str]]:
+        """Yield each way of splitting `name` at a separator, shortest parent first.
+
+        >>> list(NestedDict._split_points("A_B_C"))
+        [('A', 'B_C'), ('A_B', 'C')]
+        """
+        cut = name.find(cls.sep)
+        while cut != -1:
+            yield name[:cut], name[cut + len(cls.sep) :]
+            cut = name.find(cls.sep, cut + 1)
+
+    @classmethod
+    def _squash_data(cls, data: dict[str, typing.Any], owned: bool = True) -> dict[str, typing.Any]:
+        """Collapse the flattened keys of `data` into the containers they extend, in one pass.
+
+        The result is the same as popping each key in order and setting it again with
+        `NestedDict.__setitem__`: the value is squashed, then moved into the first container (in
+        the current order of the keys) whose key is a prefix of it, split at a separator.
+
+        Unless `owned` is set, the containers in `data` may be shared with other objects: they're
+        neither squashed again nor merged into, unless they're copied first.
+        """
+        values = dict(data)
+        owned_keys = set(data) if owned else cls._copy_containers(values)
+        position = dict(zip(data, range(len(data))))
+        squashed: dict[str, typing.Any] = {}
+        for index, key in enumerate(data):
+            if key in owned_keys:
+                _squash(values[key])
+            if not cls._squash_key(key, index, position, values):
+                squashed[key] = values[key]
+        return squashed
+
+    @staticmethod
+    def _squash_items(items: list[typing.Any]) -> list[typing.Any]:
+        """Squash the `NestedDict` items of a list-based object, as `NestedDict.squash` does."""
+        for item in items:
+            _squash(item)
+        return items
+
+    @classmethod
+    def _squash_key(
+        cls, key: str, index: int, position: dict[str, int], values: dict[str, typing.Any]
+    ) -> bool:
+        """Move `key` into its container, if it has one; the keys before `index` were moved.
+
+        The keys that haven't been moved yet come first, in their original order; the keys that
+        were moved into the top level follow, in the order they were moved.
+        """
+        parents = [p for p, _ in cls._split_points(key) if isinstance(values.get(p), MutableMapping)]
+        if not parents:
+            return False
+        parent = min(parents, key=lambda p: (position[p] < index, position[p]))
+        cls.maybe_merge({key[len(parent) + len(cls.sep) :]: values.pop(key)}, values[parent])
+        return True
+
+    @classmethod
+    def _copy_containers(cls, values: dict[str, typing.Any]) -> set[str]:
+        """Copy the `NestedDict` values that flattened keys may be merged into, in place.
+
+        Returns:
+            builtins.set[builtins.str]: the keys of the copied values
+        """
+        parents = {p for key in values for p, _ in cls._split_points(key)}.intersection(values)
+        values.update((key, _copy(values[key])) for key in parents)
+        return parents
+
+    def _copy_tree(self) -> NestedDict:
+        """Copy this object and the `NestedDict` objects nested in it, without squashing them."""
+        return self._from_data({key: _copy(value) for key, value in self._items()}, self.__is_list)
+
+    def _flatten(self) -> dict[str, typing.Any]:
+        """Map every key accepted by `__getitem__` to the value it resolves to.
+
+        Keys are visited shortest-first and the first entry for a flattened key wins, which
+        reproduces the precedence of `NestedDict.get_first_match`.
+        """
+        flat: dict[str, typing.Any] = {}
+        items = (item for item in self._items() if isinstance(item[0], str))
+        for key, value in sorted(items, key=lambda item: len(item[0])):
+            flat.setdefault(key, value)
+            self._flatten_into(flat, key, _flat_children(value))
+        return flat
+
+    def _flatten_into(
+        self, flat: dict[str, typing.Any], key: str, nested: dict[str, typing.Any]
+    ) -> None:
+        """Add the flattened `nested` keys of the value at `key` to `flat`."""
+        start = f"{key}{self.sep}"
+        for nested_key, nested_val in nested.items():
+            flat.setdefault(f"{start}{nested_key}", nested_val)
+            # `get_first_match` also passes the full name to children whose key is a plain
+            # (separator-less) prefix of the name
+            if nested_key.startswith(key) and not nested_key.startswith(start):
+                flat.setdefault(nested_key, nested_val)
+
+    @property
+    def _index(self) -> dict[str, typing.Any]:
+        """Return the flat-key index, rebuilding it after any mutation of this object's tree."""
+        index = self.__index
+        if index is not None and self.__frozen:
+            return index[1]
+        generation = self.__version.root().value
+        if index is None or index[0] != generation:
+            # note: publish the index with a single assignment, so concurrent readers see either
+            # the old or the new one
+            index = self.__index = (generation, self._flatten())
+        return index[1]
+
+    def _check_mutable(self) -> None:
+        """Raise a `TypeError` if this object is frozen (see `NestedDict.freeze`)."""
+        if self.__frozen:
+            raise TypeError(f"cannot modify a frozen {self.__class__.__name__}")
+
+    def _touch(self) -> None:
+        """Record a mutation, invalidating the flat-key indexes of the trees containing it."""
+        self.__version.root().value = next(_GENERATIONS)
+
+    def _adopt(self, value: typing.Any) -> None:
+        """Join the family of `value` (if it's a `NestedDict`), since its mutations change this."""
+        if isinstance(value, NestedDict):
+            self.__version.join(value.__version)
+
+    def _adopt_all(self, data: dict[str, typing.Any] | list[typing.Any]) -> None:
+        """Join the families of the `NestedDict` objects in `data` (see `NestedDict._adopt`)."""
+        for value in data.values() if isinstance(data, dict) else data:
+            self._adopt(value)
+
+    @classmethod
+    def _from_data(cls, data: dict[str, typing.Any], is_list: bool) -> NestedDict:
+        """Wrap already-structured `data` without converting or squashing it.
+
+        List-based data is stored as a `list` unless its keys aren't the consecutive indices.
+        """
+        node = cls.__new__(cls)
+        indexed = is_list and all(key == str(index) for index, key in enumerate(data))
+        node.__data = list(data.values()) if indexed else data
+        node.__frozen = False
+        node.__index = None
+        node.__keys = None
+        node.__is_list = is_list
+        node.__version = _Version()
+        for value in data.values():
+            node._adopt(value)
+        return node
+
+    @classmethod
+    def _merge_values(
+        cls, contributions: list[tuple[typing.Any, bool]], root: bool = False
+    ) -> typing.Any:
+        """Fold `(value, routed)` pairs (lowest precedence first) into a single value.
+
+        The result matches successive `NestedDict.maybe_merge` calls, but each level is visited
+        once and any value that is not merged with another is reused as-is. A `routed` value is a
+        flattened key that was redirected into this container; unlike a regular value, it never
+        triggers list reduction.
+        """
+        if not root:
+            contributions = cls._drop_replaced(contributions)
+        if len(contributions) == 1:
+            return contributions[0][0]
+
+        base = contributions[0][0]
+        base_is_list = getattr(base, "is_list", False)
+        slots = cls._merge_slots(contributions, root, base_is_list)
+        data = {key: cls._merge_values(entries) for key, entries in slots.items()}
+        return cls._from_data(data, base_is_list) if isinstance(base, NestedDict) else data
+
+    @staticmethod
+    def _drop_replaced(
+        contributions: list[tuple[typing.Any, bool]]
+    ) -> list[tuple[typing.Any, bool]]:
+        """Drop the contributions replaced by a later scalar (or empty mapping)."""
+        start = 0
+        for position, (value, _) in enumerate(contributions):
+            if _replaces(value):
+                start = position
+        if not isinstance(contributions[start][0], Mapping) and start < len(contributions) - 1:
+            # a mapping merged over a scalar replaces it
+            start += 1
+        return contributions[start:]
+
+    @classmethod
+    def _merge_slots(
+        cls, contributions: list[tuple[typing.Any, bool]], root: bool, base_is_list: bool
+    ) -> dict[str, list[tuple[typing.Any, bool]]]:
+        """Collect the contributions to each key of the mappings in `contributions`."""
+        slots: dict[str, list[tuple[typing.Any, bool]]] = {}
+        routable: dict[str, bool] = {}
+
+        for position, (layer, routed) in enumerate(contributions):
+            cls._add_slots(slots, routable, _items(layer), bool(position))
+
+            reduce = getattr(layer, "is_list", False) if root else base_is_list
+            if reduce and not routed:
+                # a list replaces the items of the list before it, instead of merging into them
+                # (a no-op for the first layer)
+                cls._drop_slots(slots, routable, layer)
+        return slots
+
+    @staticmethod
+    def _drop_slots(
+        slots: dict[str, list[tuple[typing.Any, bool]]],
+        routable: dict[str, bool],
+        layer: typing.Mapping[str, typing.Any],
+    ) -> None:
+        """Drop the slots of the keys missing from `layer`."""
+        for key in set(slots).difference(layer):
+            del slots[key]
+            del routable[key]
+
+    @classmethod
+    def _add_slots(
+        cls,
+        slots: dict[str, list[tuple[typing.Any, bool]]],
+        routable: dict[str, bool],
+        items: typing.Iterable[tuple[str, typing.Any]],
+        route: bool,
+    ) -> None:
+        """Add the contributions of a layer's `items` to `slots`, routing flattened keys if asked."""
+        for key, value in items:
+            slot, entry = cls._route(key, value, routable) if route else (key, (value, False))
+            if entry[1]:
+                # the flattened key was redirected into `slot`, so it no longer has its own slot
+                slots.pop(key, None)
+                routable.pop(key, None)
+            else:
+                routable[slot] = isinstance(value, MutableMapping)
+            slots.setdefault(slot, []).append(entry)
+
+    @classmethod
+    def _route(
+        cls, key: str, value: typing.Any, routable: dict[str, bool]
+    ) -> tuple[str, tuple[typing.Any, bool]]:
+        """Redirect a flattened `key` into the mapping of its shortest `routable` parent key.
+
+        As in `__setitem__`, the nested value replaces the flattened key.
+        """
+        for parent, remainder in cls._split_points(key):
+            if routable.get(parent):
+                return parent, ({remainder: value}, True)
+        return key, (value, False)
+
     def _merge_or_set(
         self,
         name: str,
@@ -271,7 +766,28 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         target: typing.MutableMapping[str, typing.Any],
     ) -> None:
         if not self.maybe_merge(incoming, target):
-            self.__data[name] = incoming
+            self._set(name, incoming)
+
+    def _scan_contains(self, key: str) -> bool:
+        """Check for `key` by scanning the nested data, without building the flat-key index.
+
+        Merges interleave lookups with mutations, which would otherwise rebuild the index for
+        every incoming key.
+        """
+        if self._has(key):
+            return True
+        return any(
+            self._has(parent) and _scan_contains(self._get(parent), remainder)
+            for parent, remainder in self._split_points(key)
+        )
+
+    def _scan_getitem(self, key: str) -> typing.Any:
+        """Retrieve `key` by scanning the nested data, without building the flat-key index."""
+        try:
+            return self.get_first_match(key)
+        except ValueError:
+            pass
+        return self._child(key)
 
     @staticmethod
     def _reduce(
@@ -279,9 +795,183 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         incoming: typing.Mapping[str, typing.Any],
     ) -> None:
         """Delete keys from `base` that are not present in `incoming`."""
-        for key_to_remove in set(base).difference(incoming):
+        remove = [key for key in base if key not in incoming]
+        if isinstance(base, NestedDict):
+            # note: the last items go first, so lists stay lists when they shrink from the end
+            remove.reverse()
+        for key_to_remove in remove:
             del base[key_to_remove]
 
+    def apply_patch(self, changes: typing.Iterable[NestedChange]) -> None:
+        """Apply the changes computed by `NestedDict.diff`, in place.
+
+        Containers that aren't on the path of any change are left untouched:
+
+        >>> d = NestedDict({"A": {"B": 1}, "C": {"D": 2}})
+        >>> sub = d["C"]
+        >>> d.apply_patch([NestedChange("change", ("A", "B"), 3), NestedChange("add", ("E",), [4])])
+        >>> d.serialize(), d["C"] is sub
+        ({'A': {'B': 3}, 'C': {'D': 2}, 'E': [4]}, True)
+
+        Args:
+            changes (typing.Iterable[pyspry.nested_dict.NestedChange]): the changes to apply
+
+        Raises:
+            builtins.KeyError: the path of a change does not exist in this object
+        """  # noqa: DAR402
+        try:
+            for op, path, value in changes:
+                node = self._parent(path)
+                node._check_mutable()
+                if op == "remove":
+                    node._delete(path[-1])
+                else:
+                    node._set(
+                        path[-1], NestedDict(value) if isinstance(value, (dict, list)) else value
+                    )
+        finally:
+            self._touch()
+
+    def _parent(self, path: tuple[str, ...]) -> NestedDict:
+        """Find the container of the last key of `path`."""
+        node = self
+        for key in path[:-1]:
+            node = node._child(key)
+            if not isinstance(node, NestedDict):
+                raise KeyError(NestedDict.sep.join(path))
+        return node
+
+    def diff(self, other: NestedDict) -> list[NestedChange]:
+        """List the changes that turn this object into `other`.
+
+        Subtrees that are shared by both objects (e.g. those reused by `NestedDict.merge`) are
+        skipped without being compared, so the cost scales with the size of the changed parts:
+
+        >>> old = NestedDict({"A": {"B": 1, "C": 2}, "D": [1, 2], "E": 0})
+        >>> new = NestedDict.merge(old, {"A_B": 3, "D": [1], "F": "x"})
+        >>> for change in old.diff(new):
+        ...     print(change.op, change.key, change.value)
+        change A_B 3
+        remove D_1 None
+        add F x
+        >>> old.apply_patch(old.diff(new))
+        >>> old.serialize() == new.serialize()
+        True
+
+        Args:
+            other (pyspry.nested_dict.NestedDict): the object to compare with
+
+        Returns:
+            builtins.list[pyspry.nested_dict.NestedChange]: the changes, as accepted by
+                `NestedDict.apply_patch`
+        """
+        changes: list[NestedChange] = []
+        self._diff(other, (), changes)
+        return changes
+
+    def _diff(self, other: NestedDict, path: tuple[str, ...], changes: list[NestedChange]) -> None:
+        if self is other:
+            return
+        data, other_data = self._as_dict(), other._as_dict()
+        self._diff_removed(data, other_data, path, changes)
+        for key, new in other_data.items():
+            if key in data:
+                self._diff_value(data[key], new, (*path, key), changes)
+            else:
+                changes.append(NestedChange("add", (*path, key), new))
+
+    def _diff_removed(
+        self,
+        data: dict[str, typing.Any],
+        other_data: dict[str, typing.Any],
+        path: tuple[str, ...],
+        changes: list[NestedChange],
+    ) -> None:
+        # note: remove the last items of lists first, so the indices of the others don't move
+        for key in reversed(list(data)) if self.__is_list else data:
+            if key not in other_data:
+                changes.append(NestedChange("remove", (*path, key)))
+
+    @staticmethod
+    def _diff_value(
+        old: typing.Any, new: typing.Any, path: tuple[str, ...], changes: list[NestedChange]
+    ) -> None:
+        if old is new:
+            return
+        if _same_kind(old, new):
+            old._diff(new, path, changes)
+        elif _changed(old, new):
+            changes.append(NestedChange("change", path, new))
+
+    def children(self) -> typing.Iterable[tuple[str, typing.Any]]:
+        """Iterate over the keys and values stored directly in this object (not nested ones).
+
+        >>> list(NestedDict({"A": {"B": 0}, "C": [1]}).children())
+        [('A', NestedDict({'B': 0})), ('C', NestedDict([1]))]
+        """
+        return self._items()
+
+    def flat_keys(self) -> typing.KeysView[str]:
+        """View the flattened keys, in the order of `NestedDict.keys`.
+
+        The keys are enumerated once, then cached until this object's tree is modified (or forever,
+        once this object is frozen), so `len()` and `in` are constant-time:
+
+        >>> d = NestedDict({"A": {"B": [0]}})
+        >>> d.flat_keys()
+        dict_keys(['A', 'A_B', 'A_B_0'])
+        >>> d["C"] = 1
+        >>> len(d.flat_keys()), "C" in d.flat_keys()
+        (4, True)
+        """
+        keys = self.__keys
+        if keys is not None and self.__frozen:
+            return keys[1]
+        generation = self.__version.root().value
+        if keys is None or keys[0] != generation:
+            keys = self.__keys = (generation, dict.fromkeys(flatten(self, sep=self.sep)).keys())
+        return keys[1]
+
+    def flat_items(self) -> typing.ItemsView[str, typing.Any]:
+        """View every key accepted by `NestedDict.__getitem__`, with the value it resolves to.
+
+        >>> dict(NestedDict({"A": {"B": 0}}).flat_items())
+        {'A': NestedDict({'B': 0}), 'A_B': 0}
+        """
+        return self._index.items()
+
+    def freeze(self) -> NestedDict:
+        """Make this object and all nested `NestedDict` objects immutable, and return it.
+
+        Frozen objects can be read by any number of threads without locking, and their flat-key
+        index is never invalidated by changes to other objects. Any attempt to modify them raises a
+        `TypeError`:
+
+        >>> d = NestedDict({"A": {"B": 0}}).freeze()
+        >>> d["A"]["C"] = 1
+        Traceback (most recent call last):
+        ...
+        TypeError: cannot modify a frozen NestedDict
+
+        Merging frozen objects (e.g. with `NestedDict.merge` or `|`) creates a new, mutable object.
+
+        Returns:
+            pyspry.nested_dict.NestedDict: this object
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.__frozen:
+                continue  # note: shared subtrees may already be frozen
+            node.__frozen = True
+            stack.extend(value for value in node._values() if isinstance(value, NestedDict))
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        """Return `True` if this object is immutable; see `NestedDict.freeze`."""
+        return self.__frozen
+
     def get_first_match(self, nested_name: str) -> typing.Any:
         """Traverse nested settings to retrieve the value of `nested_name`.
 
@@ -296,12 +986,16 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
                 or any of its child objects
         """  # noqa: DAR401, DAR402
         for key, remainder in self.get_matches(nested_name):
-            nested_obj = self.__data[key]
+            nested_obj = self._child(key)
             if not remainder:
                 return nested_obj
 
             try:
-                return nested_obj[remainder]
+                return (
+                    nested_obj._scan_getitem(remainder)
+                    if isinstance(nested_obj, NestedDict)
+                    else nested_obj[remainder]
+                )
             except (KeyError, TypeError):
                 pass
 
@@ -316,14 +1010,39 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         Returns:
             list[`typing.Any`]: the values retrieved from this object or any of its child objects
         """
-        return sorted(
-            [
-                NestedKeyPair.dedupe(key, self.maybe_strip(key, nested_name))
-                for key in self.__data
-                if str(nested_name).startswith(key)
-            ],
-            key=lambda match: len(match[0]) if match else 0,
-        )
+        name = str(nested_name)
+        return [
+            NestedKeyPair.dedupe(key, self.maybe_strip(key, nested_name))
+            for key in (name[:end] for end in range(len(name) + 1))
+            if self._has(key)
+        ]
+
+    def get_many(self, keys: typing.Iterable[str]) -> tuple[dict[str, typing.Any], set[str]]:
+        """Look up several keys at once, without raising a `KeyError` for the missing ones.
+
+        The flat-key index is validated once for the whole batch:
+
+        >>> d = NestedDict({"A": {"B": 0, "C": [1]}})
+        >>> d.get_many(["A_B", "A_C_0", "A_D"])
+        ({'A_B': 0, 'A_C_0': 1}, {'A_D'})
+
+        Args:
+            keys (typing.Iterable[builtins.str]): the keys to look up, as for `__getitem__`
+
+        Returns:
+            builtins.tuple[builtins.dict[builtins.str, typing.Any], builtins.set[builtins.str]]:
+                the value of each key that exists, and the keys that don't
+        """
+        index = self._index
+        found: dict[str, typing.Any] = {}
+        missing: set[str] = set()
+        for key in keys:
+            value = index.get(key, _MISSING)
+            if value is _MISSING:
+                missing.add(key)
+            else:
+                found[key] = value
+        return found, missing
 
     @property
     def is_list(self) -> bool:
@@ -344,22 +1063,73 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         >>> list(example.keys())
         ['KEY', 'KEY_SUB', 'KEY_SUB_NAME', 'KEY_SUB_OTHER']
         """
-        return NestedKeysView(self, sep=self.sep)
+        return NestedKeysView(self, sep=self.sep, flat_keys=self.flat_keys)
 
     @classmethod
     def _maybe_merge(
         cls, key: str, val: typing.Any, target: MutableMapping[str, typing.Any]
     ) -> None:
-        if not cls.maybe_merge(val, target[key]):
+        if not _scan_contains(target, key):
+            target[key] = val
+            return
+
+        existing = target._scan_getitem(key) if isinstance(target, NestedDict) else target[key]
+        if not cls.maybe_merge(val, existing):
             target[key] = val
-        elif hasattr(target[key], "is_list") and target[key].is_list:
-            cls._reduce(target[key], val)
+        elif getattr(existing, "is_list", False):
+            cls._reduce(existing, val)
+
+    @classmethod
+    def merge(cls, *layers: typing.Mapping[str, typing.Any] | list[typing.Any]) -> NestedDict:
+        """Merge any number of layers in one pass, with later layers taking precedence.
+
+        The result is the same as chaining `|` operators, but each level of nesting is visited
+        once, and subtrees that only one layer provides are reused rather than copied:
+
+        >>> base = NestedDict({"A": {"B": 0}, "C": {"D": 1}, "E": [1, 2, 3]})
+        >>> merged = NestedDict.merge(base, {"A_B": 2}, {"E": [4]})
+        >>> merged.serialize()
+        {'A': {'B': 2}, 'C': {'D': 1}, 'E': [4]}
+        >>> merged["C"] is base["C"]
+        True
+
+        Raises:
+            builtins.TypeError: the layers are not all lists or all mappings
+        """
+        nodes = cls._as_nodes(layers)
+        if not nodes:
+            return cls()
+
+        merged: NestedDict = cls._merge_values([(node, False) for node in nodes], root=True)
+        if merged is not nodes[0]:
+            return merged
+        copy = cls._from_data({}, merged.is_list)
+        copy._replace_data(merged._copy_data())
+        return copy
+
+    @classmethod
+    def _as_nodes(
+        cls, layers: tuple[typing.Mapping[str, typing.Any] | list[typing.Any], ...]
+    ) -> list[NestedDict]:
+        """Convert the layers of `NestedDict.merge`, checking that they're all lists or mappings.
+
+        Raises:
+            builtins.TypeError: the layers are not all lists or all mappings
+        """
+        nodes = [layer if isinstance(layer, NestedDict) else cls(layer) for layer in layers]
+        for layer, node in zip(layers[1:], nodes[1:]):
+            if node.is_list != nodes[0].is_list:
+                raise TypeError(
+                    f"cannot merge {layer} (list: {node.is_list}) with {nodes[0]} (list: "
+                    f"{nodes[0].is_list})"
+                )
+        return nodes
 
     @classmethod
     def maybe_merge(
         cls,
         incoming: Mapping[str, typing.Any] | typing.Any,
-        target: MutableMapping[str, typing.Any],
+        target: MutableMapping[str, typing.Any] | typing.Any,
     ) -> bool:
         """If the given objects are both `typing.Mapping` subclasses, merge them.
 
@@ -375,20 +1145,18 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         Args:
             incoming (typing.Mapping[builtins.str, typing.Any] | typing.Any): test this object to
                 verify it is a `typing.Mapping`
-            target (typing.MutableMapping[builtins.str, typing.Any]): update this
-                `typing.MutableMapping` with the `incoming` mapping
+            target (typing.MutableMapping[builtins.str, typing.Any] | typing.Any): update this
+                object with the `incoming` mapping if it's a `typing.MutableMapping`
 
         Returns:
             builtins.bool: the two `typing.Mapping` objects were merged
         """
         if not hasattr(incoming, "items") or not incoming.items():
             return False
+        if not isinstance(target, MutableMapping):
+            return False
 
         for k, v in incoming.items():
-            if k not in target:
-                target[k] = v
-                continue
-
             cls._maybe_merge(k, v, target)
 
         return True
@@ -404,20 +1172,62 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
             self.maybe_strip(strip_prefix, key): (
                 value.serialize() if isinstance(value, self.__class__) else value
             )
-            for key, value in self.__data.items()
+            for key, value in self._items()
         }
 
     def _serialize_list(self) -> list[typing.Any]:
         """Serialize the internal data structure as a `list`."""
         return [
             item.serialize() if isinstance(item, self.__class__) else item
-            for item in self.__data.values()
+            for item in self._values()
         ]
 
     def serialize(self, strip_prefix: str = "") -> dict[str, typing.Any] | list[typing.Any]:
         """Convert the `NestedDict` back to a `dict` or `list`."""
         return self._serialize_list() if self.__is_list else self._serialize_dict(strip_prefix)
 
+    def shape(self) -> tuple[int, int]:
+        """Count the leaf values, and the levels of nesting that contain them.
+
+        >>> NestedDict({"A": {"B": [1, 2]}, "C": 3}).shape()
+        (3, 3)
+
+        Returns:
+            builtins.tuple[builtins.int, builtins.int]: the number of leaves, and the depth
+        """
+        leaves = depth = 0
+        stack = [(self, 1)]
+        while stack:
+            node, level = stack.pop()
+            for value in node._values():
+                if isinstance(value, NestedDict):
+                    stack.append((value, level + 1))
+                else:
+                    leaves += 1
+                    depth = max(depth, level)
+        return leaves, depth
+
+    def view(self, strip_prefix: str = "") -> ReadOnlyMapping | ReadOnlySequence:
+        """Return a read-only view of this object, without copying any data.
+
+        Unlike `NestedDict.serialize`, nested containers are only wrapped when they are accessed,
+        and the view reflects later changes to this object:
+
+        >>> d = NestedDict({"APP_A": {"B": [1, 2]}, "APP_C": 3})
+        >>> v = d.view(strip_prefix="APP")
+        >>> v["A"]["B"][-1]
+        2
+        >>> d["APP_C"] = 4
+        >>> v
+        ReadOnlyMapping({'A': {'B': [1, 2]}, 'C': 4})
+        """
+        if isinstance(self.__data, list):
+            return ReadOnlySequence(self.__data)
+        if self.__is_list:
+            # note: the items of a `dict`-based list are copied, so later changes aren't reflected
+            return ReadOnlySequence(list(self.__data.values()))
+        return ReadOnlyMapping(self.__data, strip_prefix, self.sep)
+
     def squash(self) -> None:
         """Collapse all nested keys in the given dictionary.
 
@@ -427,11 +1237,178 @@ class NestedDict(MutableMapping):  # type: ignore[type-arg]
         >>> nested.serialize()
         {'A': {'B': {'C': 1, 'D': 2}, 'THING': True}, 'N_KEYS': 0}
         """
-        for key, value in list(self.__data.items()):
-            if isinstance(value, NestedDict):
-                value.squash()
-            self.__data.pop(key)
-            self[key] = value
+        self._check_mutable()
+        if isinstance(self.__data, dict):
+            self._replace_data(self._squash_data(self.__data))
+        else:
+            self._squash_items(self.__data)
+        self._touch()
+
+
+def _squash(value: typing.Any) -> None:
+    """Squash `NestedDict` objects, leaving other values as they are."""
+    if isinstance(value, NestedDict):
+        value.squash()
+
+
+def _copy(value: typing.Any) -> typing.Any:
+    """Copy `NestedDict` objects with `NestedDict._copy_tree`, leaving other values as they are."""
+    return value._copy_tree() if isinstance(value, NestedDict) else value
+
+
+def _flat_children(value: typing.Any) -> dict[str, typing.Any]:
+    """Flatten the string keys of a mapping value (no keys for any other value)."""
+    if isinstance(value, NestedDict):
+        return value._flatten()
+    if isinstance(value, Mapping):
+        return {k: v for k, v in value.items() if isinstance(k, str)}
+    return {}
+
+
+def _scan_contains(value: typing.Any, key: str) -> bool:
+    """Check a `NestedDict` for `key` with `NestedDict._scan_contains`, or a mapping with `in`."""
+    if isinstance(value, NestedDict):
+        return value._scan_contains(key)
+    return isinstance(value, Mapping) and key in value
+
+
+def _items(layer: typing.Mapping[str, typing.Any]) -> typing.Iterable[tuple[str, typing.Any]]:
+    """Iterate over the items of a mapping, without building the keys view of a `NestedDict`."""
+    return layer._items() if isinstance(layer, NestedDict) else layer.items()
+
+
+def _replaces(value: typing.Any) -> bool:
+    """Check if `value` replaces, rather than merges into, the values before it."""
+    return not isinstance(value, Mapping) or not value
+
+
+def _same_kind(old: typing.Any, new: typing.Any) -> bool:
+    """Check if both values are `NestedDict` objects based on lists, or both based on dicts."""
+    return isinstance(old, NestedDict) and isinstance(new, NestedDict) and old.is_list == new.is_list
+
+
+def _changed(old: typing.Any, new: typing.Any) -> bool:
+    """Compare two values that aren't both `NestedDict` objects of the same kind."""
+    # note: e.g. `{}` and `[]` compare equal as mappings, so containers of different kinds always
+    # differ
+    return isinstance(old, NestedDict) or type(old) is not type(new) or old != new
+
+
+def _view(value: typing.Any) -> typing.Any:
+    """Wrap `NestedDict` objects in read-only views, leaving other values as they are."""
+    return value.view() if isinstance(value, NestedDict) else value
+
+
+def _serialize(value: typing.Any) -> typing.Any:
+    """Materialize read-only views, leaving other values as they are."""
+    return value.serialize() if isinstance(value, (ReadOnlyMapping, ReadOnlySequence)) else value
+
+
+class ReadOnlyMapping(Mapping):  # type: ignore[type-arg]
+    """Provide read-only, lazy access to the data of a dictionary-based `NestedDict`.
+
+    Keys are exposed as `NestedDict.serialize` would return them:
+
+    >>> v = NestedDict({"APP_A": 0, "B": {"C": 1}}).view(strip_prefix="APP")
+    >>> list(v), v["A"], v["B"]
+    (['A', 'B'], 0, ReadOnlyMapping({'C': 1}))
+    >>> v == {"A": 0, "B": {"C": 1}}
+    True
+    """
+
+    __slots__ = ("_data", "_prefix")
+
+    _data: dict[str, typing.Any]
+    _prefix: str
+
+    def __init__(self, data: dict[str, typing.Any], strip_prefix: str = "", sep: str = "_") -> None:
+        """Wrap the internal data of a `NestedDict`, hiding `strip_prefix` from top-level keys."""
+        self._data = data
+        self._prefix = f"{strip_prefix}{sep}" if strip_prefix else ""
+
+    def __getitem__(self, key: str) -> typing.Any:
+        """Look up the raw key (with the prefix restored), wrapping nested containers."""
+        if not self._prefix:
+            return _view(self._data[key])
+        try:
+            return _view(self._data[f"{self._prefix}{key}"])
+        except KeyError:
+            if key.startswith(self._prefix):
+                raise
+        return _view(self._data[key])
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Yield the keys of the wrapped data, stripping the prefix."""
+        if not self._prefix:
+            yield from self._data
+            return
+        seen = set()
+        size = len(self._prefix)
+        for key in self._data:
+            stripped = key[size:] if key.startswith(self._prefix) else key
+            if stripped not in seen:
+                seen.add(stripped)
+                yield stripped
+
+    def __len__(self) -> int:
+        """Count the keys of the wrapped data."""
+        return len(self._data) if not self._prefix else sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Materialize the view to display it."""
+        return f"{self.__class__.__name__}({self.serialize()!r})"
+
+    def serialize(self) -> dict[str, typing.Any]:
+        """Copy the viewed data into a plain `dict`, like `NestedDict.serialize`."""
+        return {key: _serialize(value) for key, value in self.items()}
+
+
+class ReadOnlySequence(Sequence):  # type: ignore[type-arg]
+    """Provide read-only, lazy access to the data of a list-based `NestedDict`.
+
+    >>> v = NestedDict([{"A": 0}, 1]).view()
+    >>> v[0]["A"], v[-1], len(v)
+    (0, 1, 2)
+    >>> v == [{"A": 0}, 1]
+    True
+    """
+
+    __slots__ = ("_data",)
+
+    _data: list[typing.Any]
+
+    def __init__(self, data: list[typing.Any]) -> None:
+        """Wrap the internal data of a list-based `NestedDict`."""
+        self._data = data
+
+    def __eq__(self, other: object) -> bool:
+        """Compare element-wise with any other (non-string) sequence."""
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        """Retrieve the element at `index` (or a list of elements for a `slice`)."""
+        if isinstance(index, slice):
+            return [_view(value) for value in self._data[index]]
+        try:
+            return _view(self._data[index])
+        except IndexError:
+            raise IndexError(f"{self.__class__.__name__} index out of range") from None
+
+    def __len__(self) -> int:
+        """Count the elements of the wrapped data."""
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Materialize the view to display it."""
+        return f"{self.__class__.__name__}({self.serialize()!r})"
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def serialize(self) -> list[typing.Any]:
+        """Copy the viewed data into a plain `list`, like `NestedDict.serialize`."""
+        return [_serialize(_view(value)) for value in self._data]
 
 
 logger.debug("successfully imported %s", __name__)
@@ -2,9 +2,12 @@
 
 To update the settings in this module, open the default YAML file path and change the settings
 there.
+
+If the `PYSPRY_LAZY` environment variable is set, the settings are only loaded when they're first
+accessed (see `pyspry.lazy`).
 """
 # local
-from pyspry.base import SettingsContainer
+from pyspry.lazy import bootstrap
 
 # note: importlib.reload() sets __name__ to 'builtins', causing issues. so hardcode it instead.
-SettingsContainer.bootstrap("pyspry.settings")
+bootstrap("pyspry.settings")
@@ -0,0 +1,384 @@
+"""Publish loaded settings once, as a flat snapshot that forked workers share through `mmap`.
+
+Under a pre-forking server (e.g. `gunicorn` or `uwsgi`), every worker either parses the config
+files itself, or inherits a tree of Python objects whose reference counts dirty the copy-on-write
+pages they live in. A snapshot avoids both: the settings are serialized into a single file, which
+every process maps read-only, so its pages are shared through the page cache. Workers look up each
+setting in a sorted key table (by binary search), and only decode the values they read:
+
+>>> from pyspry.base import ConfigLoader
+>>> snapshot_path = getfixture("tmp_path") / "settings.pyspry"
+>>> loader = ConfigLoader(str(config_path), "APP_NAME")
+>>> publish(snapshot_path, loader) == snapshot_path
+True
+>>> shared = SharedSettings(snapshot_path)
+>>> shared.ATTR_B_K, shared.ATTR_A
+(0, [1, 2, 3])
+
+The snapshot embeds the fingerprint of its inputs (see `pyspry.compiled.fingerprint`).
+`pyspry.base.bootstrap_module` (and so `pyspry.settings`) uses it whenever the environment variable
+named by `pyspry.base.ConfigLoader.VARNAME_SHARED_PATH` is set: the first process to bootstrap the settings
+(e.g. the master process, with `preload_app`) publishes the snapshot if it's missing or stale, and
+every other process maps it. For the rest of the interpreter state, call `gc.freeze()` in the master
+process before forking.
+
+Values are stored with `marshal` (see `pyspry.cache.encode`), which can't execute code while
+loading. Like the settings they contain, snapshots are only readable by their owner, and snapshots
+owned by another user (or writable by anyone else) are never loaded. Keep them in a directory that
+only the user running the workers can write to, preferably on a memory-backed file system (e.g.
+`$XDG_RUNTIME_DIR`).
+
+The layout of the file is:
+
+1. the header (`HEADER`), followed by the metadata (JSON)
+2. the key table: one `KEY` entry per flattened key, sorted by the UTF-8 encoding of the keys
+3. the node table: one `NODE` entry per value, with the root of the settings first
+4. the data: the encoded keys, leaf values, and the children of each container
+"""  # noqa: RST301
+from __future__ import annotations
+
+# stdlib
+import importlib
+import json
+import logging
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import types
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+# local
+from pyspry.cache import decode, encode, trusted
+from pyspry.compiled import fingerprint
+from pyspry.nested_dict import NestedDict
+
+if TYPE_CHECKING:  # pragma: no cover
+    # local
+    from pyspry.base import ConfigLoader, Settings
+
+__all__ = ["SharedSettings", "load_shared", "publish", "write_snapshot"]
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PYSPRYSS"
+"""Identify snapshot files."""
+
+SNAPSHOT_VERSION = 2
+"""Bump this number to invalidate all existing snapshots when the layout changes."""
+
+HEADER = struct.Struct("<8sIQQQ")
+"""The magic bytes, the version, and the number of bytes of metadata, keys, and nodes."""
+
+KEY = struct.Struct("<QII")
+"""The offset and length of the encoded key, and the index of the node it resolves to."""
+
+NODE = struct.Struct("<QIB")
+"""The offset and length of the encoded node, and its kind (`LEAF`, `MAPPING`, or `SEQUENCE`)."""
+
+LEAF, MAPPING, SEQUENCE = range(3)
+
+_lock = threading.Lock()
+
+
+def write_snapshot(
+    output: Path | str, settings: Settings, inputs: dict[str, Any] | None = None
+) -> Path:
+    """Write `settings` to a snapshot file at `output`, replacing it atomically.
+
+    Args:
+        output (pathlib.Path | builtins.str): the path of the snapshot, in a directory that only
+            the current user can write to
+        settings (pyspry.base.Settings): the fully loaded settings
+        inputs (typing.Optional[builtins.dict[builtins.str, typing.Any]]): the fingerprint of the
+            inputs of `settings` (see `pyspry.compiled.fingerprint`), if known
+
+    Returns:
+        pathlib.Path: the path of the snapshot
+    """
+    output = Path(output)
+    root = NestedDict(settings.serialize()).freeze()
+    nodes, ids = _number_nodes(root)
+
+    data = bytearray()
+    node_table = [_append(data, *_encode_node(node, ids)) for node in nodes]
+    key_table = _encode_keys(data, root, ids)
+
+    meta = json.dumps({"prefix": settings.prefix, "inputs": inputs}).encode()
+    start = HEADER.size + len(meta) + KEY.size * len(key_table) + NODE.size * len(node_table)
+    buffer = bytearray(HEADER.pack(MAGIC, SNAPSHOT_VERSION, len(meta), len(key_table), len(nodes)))
+    buffer += meta
+    for offset, length, index in key_table:
+        buffer += KEY.pack(start + offset, length, index)
+    for offset, length, kind in node_table:
+        buffer += NODE.pack(start + offset, length, kind)
+    buffer += data
+
+    _write_private(output, buffer)
+    logger.info("published %d settings (%d bytes) to '%s'", len(key_table), len(buffer), output)
+    return output
+
+
+def _number_nodes(root: NestedDict) -> tuple[list[Any], dict[int, int]]:
+    """Number the nodes of `root` in a breadth-first walk, so the root is node 0."""
+    nodes: list[Any] = [root]
+    ids = {id(root): 0}
+    for node in nodes:
+        if isinstance(node, NestedDict):
+            for _, child in node.children():
+                ids[id(child)] = len(nodes)
+                nodes.append(child)
+    return nodes, ids
+
+
+def _encode_node(node: Any, ids: dict[int, int]) -> tuple[bytes, int]:
+    """Encode a node as a leaf value, or as the `(key, node)` pairs of its children."""
+    if isinstance(node, NestedDict):
+        children = [(key, ids[id(child)]) for key, child in node.children()]
+        return marshal.dumps(children), SEQUENCE if node.is_list else MAPPING
+    return marshal.dumps(encode(node)[0]), LEAF
+
+
+def _encode_keys(
+    data: bytearray, root: NestedDict, ids: dict[int, int]
+) -> list[tuple[int, int, int]]:
+    """Append the sorted flat keys of `root` to `data`, and return each key's table entry."""
+    key_table = []
+    for key, value in sorted(
+        ((key.encode(), value) for key, value in root.flat_items()), key=lambda item: item[0]
+    ):
+        offset, length, _ = _append(data, key, LEAF)
+        key_table.append((offset, length, ids[id(value)]))
+    return key_table
+
+
+def _append(data: bytearray, encoded: bytes, kind: int) -> tuple[int, int, int]:
+    """Append `encoded` to `data`, and return its offset, its length, and `kind`."""
+    offset = len(data)
+    data += encoded
+    return offset, len(encoded), kind
+
+
+def _write_private(output: Path, buffer: bytes | bytearray) -> None:
+    """Write `buffer` to a new file that only the current user can access, then move it to `output`.
+
+    `tempfile.mkstemp` creates the file exclusively (with `O_EXCL`), so it can't be pre-created by
+    anyone else, and its permissions are `0o600`.
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=output.parent, prefix=output.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buffer)
+        os.replace(tmp_name, output)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def publish(output: Path | str, loader: ConfigLoader | None = None) -> Path:
+    """Load the settings with `loader`, then write them to a snapshot at `output`.
+
+    Args:
+        output (pathlib.Path | builtins.str): the path of the snapshot
+        loader (typing.Optional[pyspry.base.ConfigLoader]): the loader to use; defaults to
+            `pyspry.base.ConfigLoader.create()`
+
+    Returns:
+        pathlib.Path: the path of the snapshot
+    """
+    if loader is None:
+        loader = importlib.import_module("pyspry.base").ConfigLoader.create()
+
+    # note: fingerprint the files before reading them, so a concurrent change makes it stale
+    inputs = fingerprint(loader)
+    return write_snapshot(output, loader.read_settings(), inputs)
+
+
+class SharedSettings:
+    """Read settings from a snapshot file, decoding only the values that are accessed.
+
+    Attributes are resolved like those of `pyspry.base.Settings`, with or without the prefix.
+    Containers are decoded into new `dict` and `list` objects on each access, so they can't change
+    the snapshot (or the settings of other processes).
+    """
+
+    path: Path
+    """The path of the snapshot file."""
+
+    prefix: str
+    """The prefix of the settings."""
+
+    inputs: dict[str, Any] | None
+    """The fingerprint of the inputs of the settings, if it was recorded."""
+
+    __buffer: mmap.mmap
+    __keys: int
+    __nodes: int
+    __count: int
+
+    def __init__(self, path: Path | str) -> None:
+        """Map the snapshot at `path` into memory.
+
+        Raises:
+            builtins.PermissionError: the file is owned by another user, or writable by others
+            builtins.ValueError: the file is not a snapshot, or its version is not supported
+        """  # noqa: DAR402
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            if not trusted(os.fstat(f.fileno())):
+                raise PermissionError(f"untrusted settings snapshot: {self.path}")
+            self.__buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, meta_size, self.__count, nodes = HEADER.unpack_from(self.__buffer)
+        if magic != MAGIC or version != SNAPSHOT_VERSION:
+            self.__buffer.close()
+            raise ValueError(f"unsupported settings snapshot: {self.path}")
+
+        meta = json.loads(self.__buffer[HEADER.size : HEADER.size + meta_size])
+        self.prefix, self.inputs = meta["prefix"], meta["inputs"]
+        self.__keys = HEADER.size + meta_size
+        self.__nodes = self.__keys + KEY.size * self.__count
+        logger.debug("mapped %d settings (%d nodes) from '%s'", self.__count, nodes, self.path)
+
+    def __contains__(self, obj: Any) -> bool:
+        """Check the snapshot for a setting with the given name."""
+        return isinstance(obj, str) and self._find(self.maybe_add_prefix(obj)) is not None
+
+    def __dir__(self) -> Iterator[str]:
+        """Return the names of all settings in the snapshot."""
+        return iter({NestedDict.maybe_strip(self.prefix, key) for key in self.keys()})
+
+    def __getattr__(self, name: str) -> Any:
+        """Decode the setting with the given name.
+
+        Raises:
+            builtins.AttributeError: the setting does not exist in the snapshot
+        """  # noqa: DAR402
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        attr_name = self.maybe_add_prefix(name)
+        node = self._find(attr_name)
+        if node is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{attr_name}'"
+            )
+        return self._decode(node, self.prefix)
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{self.__class__.__name__}('{self.path}', prefix='{self.prefix}')"
+
+    def _decode(self, node: int, strip_prefix: str = "") -> Any:
+        """Decode the given node, along with all of its children."""
+        offset, length, kind = NODE.unpack_from(self.__buffer, self.__nodes + NODE.size * node)
+        # note: the owner of the snapshot was checked when it was mapped
+        value = marshal.loads(self.__buffer[offset : offset + length])  # nosec B302
+        if kind == LEAF:
+            return decode(value)
+        if kind == SEQUENCE:
+            return [self._decode(child) for _, child in value]
+        return {
+            NestedDict.maybe_strip(strip_prefix, key): self._decode(child) for key, child in value
+        }
+
+    def _find(self, key: str) -> int | None:
+        """Return the node of the given flattened key, or `None` if it doesn't exist."""
+        target = key.encode()
+        buffer, keys = self.__buffer, self.__keys
+        low, high = 0, self.__count
+        while low < high:
+            middle = (low + high) // 2
+            offset, length, node = KEY.unpack_from(buffer, keys + KEY.size * middle)
+            probe = buffer[offset : offset + length]
+            if probe < target:
+                low = middle + 1
+            elif probe > target:
+                high = middle
+            else:
+                return node  # type: ignore[no-any-return]
+        return None
+
+    def close(self) -> None:
+        """Unmap the snapshot; the object can't be used afterwards."""
+        self.__buffer.close()
+
+    def keys(self) -> Iterator[str]:
+        """Iterate over the flattened keys of all settings, in sorted order."""
+        buffer, keys = self.__buffer, self.__keys
+        for index in range(self.__count):
+            offset, length, _ = KEY.unpack_from(buffer, keys + KEY.size * index)
+            yield buffer[offset : offset + length].decode()
+
+    def maybe_add_prefix(self, name: str) -> str:
+        """If the given name is missing the prefix of these settings, insert it."""
+        if not name.startswith(self.prefix):
+            return f"{self.prefix}{NestedDict.sep}{name}"
+        return name
+
+    def serialize(self) -> dict[str, Any] | list[Any]:
+        """Decode the entire snapshot."""
+        return self._decode(0)  # type: ignore[no-any-return]
+
+    def settings(self) -> Settings:
+        """Decode the entire snapshot into a new `pyspry.base.Settings` object."""
+        base = importlib.import_module("pyspry.base")
+        return base.Settings(self.serialize(), {}, self.prefix)  # type: ignore[no-any-return]
+
+
+def load_shared(
+    path: Path | str,
+    module_name: str,
+    loader: ConfigLoader,
+    spec: ModuleSpec | None = None,
+) -> types.ModuleType | None:
+    """Map the snapshot at `path` as a settings module, publishing it first if needed.
+
+    If the snapshot is missing or stale, the settings are loaded with `loader` and published to
+    `path` (see `publish`), which only one thread of this process does at a time.
+
+    Args:
+        path (pathlib.Path | builtins.str): the path of the snapshot
+        module_name (builtins.str): the name to give the module
+        loader (pyspry.base.ConfigLoader): the loader whose inputs must match the fingerprint
+        spec (typing.Optional[importlib.machinery.ModuleSpec]): the spec of the module, e.g. so
+            that `importlib.reload()` bootstraps the settings again
+
+    Returns:
+        typing.Optional[types.ModuleType]: the module, or `None` if the snapshot can't be used
+    """
+    try:
+        current = fingerprint(loader)
+        with _lock:
+            shared = _open(path)
+            if shared is None or shared.inputs != current:
+                if shared is not None:
+                    logger.info("replacing stale settings snapshot '%s'", path)
+                    shared.close()
+                write_snapshot(path, loader.read_settings(), current)
+                shared = SharedSettings(path)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning("ignoring settings snapshot '%s': %s", path, e)
+        return None
+
+    module = types.ModuleType(module_name, f"Settings shared from the snapshot '{path}'.")
+    module.__spec__ = spec
+    # note: resolve the settings with module-level `__getattr__` and `__dir__` (see PEP 562)
+    vars(module).update(__getattr__=shared.__getattr__, __dir__=shared.__dir__, shared=shared)
+    logger.debug("loaded settings snapshot '%s' as '%s'", path, module_name)
+    return module
+
+
+def _open(path: Path | str) -> SharedSettings | None:
+    """Open the snapshot at `path`, or return `None` if it's missing or unreadable."""
+    try:
+        return SharedSettings(path)
+    except (OSError, ValueError, struct.error) as e:
+        logger.info("settings snapshot '%s' not available: %s", path, e)
+        return None
+
+
+logger.debug("successfully imported %s", __name__)
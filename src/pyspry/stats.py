@@ -0,0 +1,194 @@
+"""Record the cost of each phase of loading settings.
+
+Instrumentation is off by default. Pass `stats=True` to `pyspry.base.Settings.load` (or set the
+environment variable named by `pyspry.base.ConfigLoader.VARNAME_LOAD_STATS`) to record the wall time
+and the allocations of each phase on the `load_stats` attribute of the resulting settings:
+
+>>> from pyspry.base import Settings
+>>> settings = Settings.load(config_path, "APP_NAME", stats=True)
+>>> [phase.name for phase in settings.load_stats.phases]
+['read', 'parse', 'env_scan', 'build']
+>>> settings.load_stats.keys, settings.load_stats.depth
+(5, 2)
+
+Hooks receive the `LoadStats` of every instrumented load once it completes, e.g. to export them as
+metrics. Registering a hook also enables instrumentation in `pyspry.base.ConfigLoader`:
+
+>>> reported = []
+>>> hook = register_hook(reported.append)
+>>> settings = Settings.load(config_path, "APP_NAME", stats=True)
+>>> reported == [settings.load_stats]
+True
+>>> unregister_hook(hook)
+"""  # noqa: RST301
+from __future__ import annotations
+
+# stdlib
+import contextlib
+import logging
+import sys
+import threading
+import time
+from typing import Any, Callable, ContextManager, Iterator, NamedTuple
+
+__all__ = ["Hook", "LoadStats", "Phase", "has_hooks", "register_hook", "timed", "unregister_hook"]
+
+logger = logging.getLogger(__name__)
+
+Hook = Callable[["LoadStats"], object]
+"""Receive the statistics of a completed load."""
+
+_hooks: list[Hook] = []
+
+_allocated_blocks: Callable[[], int] = getattr(sys, "getallocatedblocks", lambda: 0)
+
+
+class Phase(NamedTuple):
+    """The cost of one phase of loading settings."""
+
+    name: str
+    """One of `read`, `parse`, `prefix_filter`, `cache`, `env_scan`, `json_decode`, `build`, or
+    `merge`."""
+
+    seconds: float
+    """The wall time of the phase."""
+
+    allocations: int
+    """The net number of memory blocks allocated by the interpreter during the phase (`0` if the
+    interpreter doesn't report them)."""
+
+    source: str | None = None
+    """The config file being processed, if any."""
+
+
+class LoadStats:
+    """Collect the phases of one load, along with the size of the resulting settings.
+
+    Phases may be recorded from several threads (see `pyspry.base.ConfigLoader.workers`); the
+    allocations of concurrent phases then overlap.
+    """
+
+    phases: list[Phase]
+    """The phases, in the order they completed."""
+
+    keys: int = 0
+    """The number of leaf settings (excluding environment variables that are still deferred)."""
+
+    depth: int = 0
+    """The number of levels of nesting in the settings."""
+
+    __lock: threading.Lock
+
+    def __init__(self) -> None:  # noqa: D107
+        self.phases = []
+        self.__lock = threading.Lock()
+
+    def __repr__(self) -> str:  # noqa: D105
+        return (
+            f"{self.__class__.__name__}(seconds={self.seconds:.6f}, keys={self.keys}, "
+            f"depth={self.depth}, phases={len(self.phases)})"
+        )
+
+    @property
+    def seconds(self) -> float:
+        """Sum the wall time of all phases."""
+        return sum(phase.seconds for phase in self.phases)
+
+    @contextlib.contextmanager
+    def phase(self, name: str, source: str | None = None) -> Iterator[None]:
+        """Record the wall time and allocations of the enclosed block as a `Phase`.
+
+        >>> stats = LoadStats()
+        >>> with stats.phase("parse", "config.yml"):
+        ...     pass
+        >>> stats.phases[0].name, stats.phases[0].source
+        ('parse', 'config.yml')
+        """
+        blocks = _allocated_blocks()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            recorded = Phase(name, seconds, _allocated_blocks() - blocks, source)
+            with self.__lock:
+                self.phases.append(recorded)
+
+    def report(self) -> None:
+        """Pass these statistics to every registered hook.
+
+        Exceptions raised by hooks are logged, so that exporting metrics never breaks loading.
+        """
+        logger.debug("loaded settings: %r", self)
+        for hook in list(_hooks):
+            try:
+                hook(self)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("load statistics hook %r failed", hook)
+
+    def serialize(self) -> dict[str, Any]:
+        """Convert these statistics to plain data, e.g. for a metrics pipeline.
+
+        >>> stats = LoadStats()
+        >>> stats.serialize()
+        {'seconds': 0, 'keys': 0, 'depth': 0, 'phases': []}
+        """
+        return {
+            "seconds": self.seconds,
+            "keys": self.keys,
+            "depth": self.depth,
+            "phases": [phase._asdict() for phase in self.phases],
+        }
+
+    def totals(self) -> dict[str, float]:
+        """Sum the wall time of the phases with the same name."""
+        totals: dict[str, float] = {}
+        for phase in self.phases:
+            totals[phase.name] = totals.get(phase.name, 0.0) + phase.seconds
+        return totals
+
+
+def has_hooks() -> bool:
+    """Return `True` if any hooks are registered."""
+    return bool(_hooks)
+
+
+def register_hook(hook: Hook) -> Hook:
+    """Call `hook` with the `LoadStats` of every instrumented load; usable as a decorator.
+
+    Args:
+        hook (pyspry.stats.Hook): the function to call
+
+    Returns:
+        pyspry.stats.Hook: the same function, for `unregister_hook`
+    """
+    _hooks.append(hook)
+    return hook
+
+
+def unregister_hook(hook: Hook) -> None:
+    """Remove a hook added by `register_hook`.
+
+    Raises:
+        builtins.ValueError: the hook is not registered
+    """  # noqa: DAR402
+    _hooks.remove(hook)
+
+
+def timed(stats: LoadStats | None, name: str, source: str | None = None) -> ContextManager[None]:
+    """Record a phase in `stats`, or do nothing if `stats` is `None`.
+
+    Args:
+        stats (typing.Optional[pyspry.stats.LoadStats]): the statistics of the current load
+        name (builtins.str): the name of the phase
+        source (typing.Optional[builtins.str]): the config file being processed, if any
+
+    Returns:
+        typing.ContextManager[None]: the context manager timing the phase
+    """
+    if stats is None:
+        return contextlib.nullcontext()
+    return stats.phase(name, source)
+
+
+logger.debug("successfully imported %s", __name__)
@@ -0,0 +1,160 @@
+"""Notify subscribers when settings under a key prefix change.
+
+Subscriptions are stored in a character trie keyed by their prefixes. Dispatching a change walks
+the trie along the changed key, so the cost depends on the length of the key rather than on the
+number of subscribers:
+
+>>> index = SubscriptionIndex()
+>>> _ = index.subscribe("APP_DB_", lambda changes: print([c.key for c in changes]))
+>>> _ = index.subscribe("APP_CACHE_", lambda changes: print("not called"))
+>>> index.dispatch([NestedChange("change", ("APP_DB", "HOST"), "db.local")])
+['APP_DB_HOST']
+
+A change to a container also reaches the subscribers of the keys inside it:
+
+>>> index.dispatch([NestedChange("remove", ("APP_DB",))])
+['APP_DB']
+"""  # noqa: RST301
+from __future__ import annotations
+
+# stdlib
+import logging
+import threading
+from typing import Callable, Iterable, Iterator, List, NamedTuple
+
+# local
+from pyspry.nested_dict import NestedChange, NestedDict
+
+__all__ = ["Subscription", "SubscriptionIndex"]
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[[List[NestedChange]], object]
+"""Receive the changes under the subscribed prefix, in the order they were reported."""
+
+
+class Subscription(NamedTuple):
+    """Identify a registered callback; pass it to `SubscriptionIndex.unsubscribe` to remove it."""
+
+    prefix: str
+    callback: Callback
+
+
+class _Node:
+    """Store the subscriptions for one prefix, and the nodes for all longer prefixes."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.subscriptions: list[Subscription] = []
+
+    def walk(self) -> Iterator[Subscription]:
+        """Yield the subscriptions of this node and all of its descendants."""
+        yield from self.subscriptions
+        for child in self.children.values():
+            yield from child.walk()
+
+
+class SubscriptionIndex:
+    """Index callbacks by the key prefixes they subscribe to."""
+
+    __lock: threading.Lock
+    __root: _Node
+
+    def __init__(self) -> None:  # noqa: D107
+        self.__lock = threading.Lock()
+        self.__root = _Node()
+
+    def __bool__(self) -> bool:
+        """Return `True` if there are any subscriptions."""
+        return bool(self.__root.subscriptions or self.__root.children)
+
+    def subscribe(self, prefix: str, callback: Callback) -> Subscription:
+        """Call `callback` with the changes to all keys starting with `prefix`.
+
+        Args:
+            prefix (builtins.str): the (flattened) key prefix to watch
+            callback (pyspry.subscriptions.Callback): the function to call with the changes
+
+        Returns:
+            pyspry.subscriptions.Subscription: the handle of the new subscription
+        """
+        subscription = Subscription(prefix, callback)
+        with self.__lock:
+            node = self.__root
+            for char in prefix:
+                node = node.children.setdefault(char, _Node())
+            node.subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove the given subscription.
+
+        Raises:
+            builtins.ValueError: the subscription is not registered
+        """  # noqa: DAR402
+        with self.__lock:
+            path = self.__path(subscription)
+            path[-1].subscriptions.remove(subscription)
+
+            # prune the nodes that no longer lead to any subscription
+            for char, parent, node in zip(reversed(subscription.prefix), path[-2::-1], path[::-1]):
+                if node.subscriptions or node.children:
+                    break
+                del parent.children[char]
+
+    def __path(self, subscription: Subscription) -> list[_Node]:
+        """Return the nodes from the root to the node of the subscription's prefix."""
+        path = [self.__root]
+        for char in subscription.prefix:
+            if char not in path[-1].children:
+                raise ValueError(f"{subscription} is not registered")
+            path.append(path[-1].children[char])
+        return path
+
+    def match(self, key: str) -> Iterator[Subscription]:
+        """Yield the subscriptions affected by a change to `key`.
+
+        These are the subscriptions whose prefix is a prefix of `key`, and (because `key` may be a
+        container) those whose prefix starts with `key` followed by `NestedDict.sep`.
+
+        Args:
+            key (builtins.str): the flattened key that changed
+
+        Yields:
+            pyspry.subscriptions.Subscription: each affected subscription
+        """
+        node = self.__root
+        for position, char in enumerate(f"{key}{NestedDict.sep}"):
+            if position <= len(key):
+                yield from node.subscriptions
+            child = node.children.get(char)
+            if child is None:
+                return
+            node = child
+        yield from node.walk()
+
+    def dispatch(self, changes: Iterable[NestedChange]) -> None:
+        """Call each affected subscriber once, with the changes under its prefix.
+
+        Exceptions raised by callbacks are logged, so that one failing subscriber doesn't prevent
+        the others from being notified.
+
+        Args:
+            changes (typing.Iterable[pyspry.nested_dict.NestedChange]): the changes to report
+        """
+        grouped: dict[int, tuple[Subscription, list[NestedChange]]] = {}
+        with self.__lock:
+            for change in changes:
+                for subscription in self.match(change.key):
+                    grouped.setdefault(id(subscription), (subscription, []))[1].append(change)
+
+        for subscription, matched in grouped.values():
+            try:
+                subscription.callback(matched)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("subscriber to '%s' failed", subscription.prefix)
+
+
+logger.debug("successfully imported %s", __name__)
@@ -0,0 +1,357 @@
+"""Watch config files for changes and reload a `pyspry.base.SettingsContainer` in the background.
+
+`SettingsWatcher` runs in a daemon thread. When any of the watched files change, only those files
+are parsed again; the cached layers of the other files are reused (each file is parsed once, on the
+first reload), the layers are merged, and the resulting `pyspry.base.Settings` object replaces the
+container's settings in a single reference assignment. Threads reading settings therefore see
+either the old or the new object, never a partially merged one:
+
+>>> watcher = settings.watch(poll_interval=0.01, debounce=0)
+>>> watcher.reload()
+0
+>>> watcher.stop()
+
+Change notifications come from `inotify` on Linux, with a fallback to polling the modification
+times of the files on other platforms (see `FileMonitor.create`).
+"""  # noqa: RST301
+from __future__ import annotations
+
+# stdlib
+import abc
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable
+
+if TYPE_CHECKING:  # pragma: no cover
+    # local
+    from pyspry.base import ConfigLoader, Settings
+    from pyspry.nested_dict import NestedChange
+
+__all__ = ["FileMonitor", "InotifyMonitor", "PollingMonitor", "SettingsWatcher"]
+
+logger = logging.getLogger(__name__)
+
+
+class FileMonitor(abc.ABC):
+    """Report which of a fixed set of files changed since the last check."""
+
+    paths: frozenset[str]
+    """The absolute paths of the watched files."""
+
+    def __init__(self, paths: Iterable[Path | str]) -> None:  # noqa: D107
+        self.paths = frozenset(os.path.abspath(path) for path in paths)
+
+    @classmethod
+    def create(cls, paths: Iterable[Path | str], poll_interval: float = 1.0) -> FileMonitor:
+        """Use `inotify` if it's available, or else poll the files' modification times.
+
+        Args:
+            paths (typing.Iterable[pathlib.Path | builtins.str]): the files to watch
+            poll_interval (builtins.float): the number of seconds between checks when polling
+
+        Returns:
+            pyspry.watch.FileMonitor: the monitor for the given files
+        """
+        paths = list(paths)
+        try:
+            return InotifyMonitor(paths)
+        except OSError as e:
+            logger.debug("falling back to polling for file changes: %s", e)
+        return PollingMonitor(paths, poll_interval)
+
+    def close(self) -> None:
+        """Release any resources held by this monitor."""
+
+    @abc.abstractmethod
+    def wait(self, timeout: float) -> set[str]:
+        """Block for up to `timeout` seconds, then return the paths of the changed files."""
+
+
+class PollingMonitor(FileMonitor):
+    """Detect changes by comparing the size, modification time, and inode of each file."""
+
+    poll_interval: float
+    """The number of seconds between checks."""
+
+    __stats: dict[str, tuple[int, int, int] | None]
+
+    def __init__(self, paths: Iterable[Path | str], poll_interval: float = 1.0) -> None:
+        """Record the current state of each file."""
+        super().__init__(paths)
+        self.poll_interval = poll_interval
+        self.__stats = {path: self._stat(path) for path in self.paths}
+
+    @staticmethod
+    def _stat(path: str) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def wait(self, timeout: float) -> set[str]:
+        """Sleep for the poll interval (at most `timeout`), then compare each file's state."""
+        time.sleep(min(self.poll_interval, timeout))
+        changed: set[str] = set()
+        for path, previous in self.__stats.items():
+            current = self._stat(path)
+            if current != previous:
+                self.__stats[path] = current
+                changed.add(path)
+        return changed
+
+
+class InotifyMonitor(FileMonitor):
+    """Receive change notifications from the Linux `inotify` API.
+
+    The parent directories are watched rather than the files themselves, so files that are
+    replaced (e.g. by editors that write a temporary file and rename it) are still reported.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+    MASK |= IN_DELETE
+    """The events that indicate a change to a watched file."""
+
+    EVENT = struct.Struct("iIII")
+    """The header of each `struct inotify_event`: `wd`, `mask`, `cookie`, and `len`."""
+
+    __fd: int
+    __dirs: dict[int, str]
+
+    def __init__(self, paths: Iterable[Path | str]) -> None:
+        """Open an `inotify` instance and watch the parent directory of each file.
+
+        Raises:
+            builtins.OSError: `inotify` is not supported on this platform
+        """
+        super().__init__(paths)
+        libc = self._libc()
+        self.__fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1() failed")
+        self.__dirs = {}
+        for directory in {os.path.dirname(path) for path in self.paths}:
+            self.__add_watch(libc, directory)
+
+    @staticmethod
+    def _libc() -> ctypes.CDLL:
+        """Load the C library, checking that it provides the `inotify` API.
+
+        Raises:
+            builtins.OSError: `inotify` is not supported on this platform
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError(f"inotify is not available on {sys.platform}")
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "inotify_init1") or not hasattr(libc, "inotify_add_watch"):
+            raise OSError("inotify is not available in the C library")
+        return libc
+
+    def __add_watch(self, libc: ctypes.CDLL, directory: str) -> None:
+        """Watch `directory`, closing the `inotify` instance if that fails."""
+        wd = libc.inotify_add_watch(self.__fd, os.fsencode(directory), self.MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            self.close()
+            raise OSError(errno, f"inotify_add_watch() failed for '{directory}'")
+        self.__dirs[wd] = directory
+
+    def close(self) -> None:
+        """Close the `inotify` file descriptor, removing all watches."""
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+
+    def wait(self, timeout: float) -> set[str]:
+        """Wait for up to `timeout` seconds for events, then return the changed files."""
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        try:
+            buffer = os.read(self.__fd, 64 * 1024)
+        except BlockingIOError:  # pragma: no cover
+            return set()
+        return self.__changed(buffer)
+
+    def __changed(self, buffer: bytes) -> set[str]:
+        """Collect the watched files named by the events in `buffer`."""
+        changed: set[str] = set()
+        offset = 0
+        while offset < len(buffer):
+            wd, _, _, length = self.EVENT.unpack_from(buffer, offset)
+            offset += self.EVENT.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if wd in self.__dirs and name:
+                path = os.path.join(self.__dirs[wd], os.fsdecode(name))
+                if path in self.paths:
+                    changed.add(path)
+        return changed
+
+
+class SettingsWatcher(threading.Thread):
+    """Reload settings in a background thread whenever their config files change.
+
+    Bursts of changes (e.g. several files written by one deployment) are combined: after a change
+    is detected, the watcher keeps collecting changes until none have arrived for `debounce`
+    seconds. Additionally, reloads are never started less than `min_interval` seconds apart.
+    """
+
+    debounce: float
+    """Wait until the files have been quiet for this many seconds before reloading."""
+
+    min_interval: float
+    """The minimum number of seconds between the start of two reloads."""
+
+    poll_interval: float
+    """The number of seconds between checks of the stop flag (and of the files, when polling)."""
+
+    __layers: dict[str, Settings]
+    __last_reload: float
+    __loader: ConfigLoader
+    __monitor: FileMonitor
+    __paths: list[str]
+    __publish: Callable[[Settings], list[NestedChange]]
+    __stopped: threading.Event
+
+    def __init__(
+        self,
+        loader: ConfigLoader,
+        publish: Callable[[Settings], list[NestedChange]],
+        poll_interval: float = 1.0,
+        debounce: float = 0.1,
+        min_interval: float = 1.0,
+        monitor: FileMonitor | None = None,
+    ) -> None:
+        """Start monitoring the config files, without parsing them.
+
+        Args:
+            loader (pyspry.base.ConfigLoader): read the config files and environment variables with
+                this object
+            publish (typing.Callable): publish the reloaded settings by calling this function,
+                which returns the changes from the settings it replaced, e.g.
+                `pyspry.base.SettingsContainer.publish`
+            poll_interval (builtins.float): see `SettingsWatcher.poll_interval`
+            debounce (builtins.float): see `SettingsWatcher.debounce`
+            min_interval (builtins.float): see `SettingsWatcher.min_interval`
+            monitor (typing.Optional[pyspry.watch.FileMonitor]): if provided, use this object to
+                detect changes instead of `FileMonitor.create`
+        """
+        super().__init__(name="pyspry-settings-watcher", daemon=True)
+        self.debounce = debounce
+        self.min_interval = min_interval
+        self.poll_interval = poll_interval
+        self.__loader = loader
+        self.__publish = publish
+        self.__stopped = threading.Event()
+        self.__last_reload = float("-inf")
+
+        self.__paths = [os.path.abspath(path) for path in loader.paths]
+        self.__monitor = monitor or FileMonitor.create(self.__paths, poll_interval)
+        self.__layers = {}
+
+    def reload(self, changed: Iterable[str] = ()) -> int:
+        """Parse the changed files again, merge all layers, and swap in the new settings.
+
+        The files without a cached layer (i.e. all of them, on the first reload) are parsed too. The
+        new settings are compared with the ones they replace when they're published, so changes
+        made in the meantime through e.g. `pyspry.base.SettingsContainer.update` are accounted for.
+        If nothing changed, the current settings (and their attribute caches) are kept.
+
+        Args:
+            changed (typing.Iterable[builtins.str]): the absolute paths of the changed files
+
+        Returns:
+            builtins.int: the number of changed config files that were parsed again
+        """
+        self.__last_reload = time.monotonic()
+        changed = [path for path in changed if path in self.__paths]
+        changes = self.__publish(self.__merge_changed(changed))
+        if not changes:
+            logger.debug("no settings changed in %d config file(s)", len(changed))
+            return len(changed)
+
+        logger.info(
+            "reloaded settings after changes to %d config file(s): %s",
+            len(changed),
+            ", ".join(f"{change.op} {change.key}" for change in changes),
+        )
+        return len(changed)
+
+    def __merge_changed(self, changed: list[str]) -> Settings:
+        """Parse the changed (and uncached) files again, and merge the layers of all files."""
+        layers = dict(self.__layers)
+        for path in self.__paths:
+            if path in changed or path not in layers:
+                layers[path] = self.__loader.read_layer(path)
+        settings = self.__loader.merge_layers(layers[path] for path in self.__paths)
+        self.__layers = layers
+        return settings
+
+    def run(self) -> None:
+        """Wait for changes and reload the settings until `SettingsWatcher.stop` is called."""
+        try:
+            while not self.__stopped.is_set():
+                changed = self.__monitor.wait(self.poll_interval)
+                if not changed:
+                    continue
+                changed |= self._settle()
+                if self.__stopped.is_set():
+                    break
+                try:
+                    self.reload(changed)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("keeping the current settings; failed to reload")
+        finally:
+            self.__monitor.close()
+
+    def _settle(self) -> set[str]:
+        """Collect further changes until the debounce period and the rate limit have passed."""
+        changed: set[str] = set()
+        quiet_since = time.monotonic()
+        while not self.__stopped.is_set():
+            now = time.monotonic()
+            remaining = max(
+                quiet_since + self.debounce - now, self.__last_reload + self.min_interval - now
+            )
+            if remaining <= 0:
+                break
+            more = self.__monitor.wait(min(remaining, self.poll_interval))
+            if more:
+                changed |= more
+                quiet_since = time.monotonic()
+        return changed
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop watching and wait for the background thread to exit.
+
+        Args:
+            timeout (typing.Optional[builtins.float]): the maximum number of seconds to wait
+        """
+        self.__stopped.set()
+        if self.is_alive():
+            self.join(timeout)
+        else:
+            self.__monitor.close()
+
+
+logger.debug("successfully imported %s", __name__)
@@ -0,0 +1 @@
+"""Measure the performance of the `pyspry` package."""
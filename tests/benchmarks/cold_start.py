@@ -0,0 +1,199 @@
+"""Measure the cold-start cost of `pyspry` in fresh subprocesses.
+
+Each scenario runs in a new interpreter, so module imports and file parsing are measured cold:
+
+- `import-pyspry`: `import pyspry`
+- `import-settings`: `import pyspry.settings`, with `ConfigLoader` driven by environment variables
+- `settings-load`: the phases of `Settings.load` on a synthetic config of the given size
+
+Run it from the repository root; the results are written as JSON to stdout (or `--output`):
+
+    python -m tests.benchmarks.cold_start --sizes 100 10000 --repeat 5 --output startup.json
+
+Each result reports the phases in seconds (`min`, `median`, `max` across the repetitions), plus the
+wall time of the whole subprocess (`process`).
+
+Note: this module must not import `pyspry` (or `yaml`) at the top level, because it is also the
+entry point of the measured subprocesses.
+"""
+from __future__ import annotations
+
+# stdlib
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+__all__ = ["SCENARIOS", "main", "run_scenario", "write_config"]
+
+PREFIX = "BENCH"
+"""The variable prefix used for the synthetic configs."""
+
+SCENARIOS = ("import-pyspry", "import-settings", "settings-load")
+"""The names of the scenarios, in the order they're run."""
+
+
+def write_config(path: Path, size: int, depth: int = 3) -> dict[str, str]:
+    """Write a synthetic YAML config with about `size` leaf settings under `PREFIX`.
+
+    Half of the top-level entries use another prefix, so the prefix filter has work to do. Each
+    selected section nests `depth` levels deep.
+
+    Args:
+        path (pathlib.Path): the file to write
+        size (builtins.int): the number of leaf settings under `PREFIX`
+        depth (builtins.int): the levels of nesting within each section
+
+    Returns:
+        builtins.dict[builtins.str, builtins.str]: environment variables overriding some settings,
+            mixing JSON and plain strings
+    """
+    # third party
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    leaves_per_section = 10
+    sections = max(1, size // leaves_per_section)
+
+    def section(i: int) -> Any:
+        node: Any = {f"KEY{j}": f"value-{i}-{j}" for j in range(leaves_per_section)}
+        for level in range(depth - 1):
+            node = {f"LEVEL{level}": node}
+        return node
+
+    config: dict[str, Any] = {}
+    for i in range(sections):
+        config[f"{PREFIX}_SECTION{i}"] = section(i)
+        config[f"OTHER_SECTION{i}"] = section(i)
+    path.write_text(yaml.dump(config, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper)))
+
+    environ = {}
+    for i in range(min(sections, 200)):
+        environ[f"{PREFIX}_ENV{i}"] = json.dumps({"A": [i, i + 1]}) if i % 2 else f"host-{i}.local"
+    return environ
+
+
+def _timed(phases: dict[str, float], name: str, func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = func()
+    phases[name] = time.perf_counter() - start
+    return result
+
+
+def _worker(scenario: str, config_path: str | None) -> dict[str, float]:
+    """Run one scenario in this (fresh) process, and return the duration of each phase."""
+    # pylint: disable=import-outside-toplevel
+    phases: dict[str, float] = {}
+    if scenario == "import-pyspry":
+        _timed(phases, "imports", lambda: __import__("pyspry"))
+        return phases
+
+    _timed(phases, "imports", lambda: __import__("pyspry.base"))
+    if scenario == "import-settings":
+        _timed(phases, "bootstrap", lambda: __import__("pyspry.settings"))
+        return phases
+
+    # local
+    from pyspry.base import decode_env, load_env, stream_yaml
+    from pyspry.nested_dict import NestedDict
+
+    assert config_path is not None
+    raw = _timed(phases, "read", lambda: Path(config_path).read_bytes())
+    config = _timed(phases, "parse", lambda: stream_yaml(raw, PREFIX))
+    environ = _timed(phases, "env_decode", lambda: decode_env(load_env(PREFIX)))
+    nested = _timed(phases, "build", lambda: NestedDict(config))
+    env_layer = NestedDict(environ)
+    _timed(phases, "merge", lambda: NestedDict.merge(nested, env_layer))
+    return phases
+
+
+def run_scenario(
+    scenario: str, config_path: Path | None, environ: dict[str, str], repeat: int
+) -> dict[str, dict[str, float]]:
+    """Run a scenario `repeat` times in fresh subprocesses and summarize each phase.
+
+    Args:
+        scenario (builtins.str): one of `SCENARIOS`
+        config_path (typing.Optional[pathlib.Path]): the synthetic config file, if any
+        environ (builtins.dict[builtins.str, builtins.str]): extra environment variables
+        repeat (builtins.int): the number of subprocesses to run
+
+    Returns:
+        builtins.dict[builtins.str, builtins.dict[builtins.str, builtins.float]]: map each phase to
+            the `min`, `median`, and `max` of its durations
+    """
+    env = {**os.environ, **environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    command = [sys.executable, "-m", __spec__.name, "--worker", scenario]
+    if config_path is not None:
+        command += ["--config", str(config_path)]
+
+    samples: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run(  # nosec B603
+            command, check=True, capture_output=True, env=env, text=True
+        ).stdout
+        process = time.perf_counter() - start
+        for phase, duration in {**json.loads(output), "process": process}.items():
+            samples.setdefault(phase, []).append(duration)
+
+    return {
+        phase: {"min": min(values), "median": statistics.median(values), "max": max(values)}
+        for phase, values in samples.items()
+    }
+
+
+def _benchmark(sizes: list[int], repeat: int) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="pyspry-bench-") as tmp:
+        for size in sizes:
+            config_path = Path(tmp) / f"config-{size}.yml"
+            environ = write_config(config_path, size)
+            environ["PYSPRY_CONFIG_PATH"] = str(config_path)
+            environ["PYSPRY_VAR_PREFIX"] = PREFIX
+            for scenario in SCENARIOS:
+                if scenario == "import-pyspry" and size != sizes[0]:
+                    continue  # independent of the config size
+                phases = run_scenario(scenario, config_path, environ, repeat)
+                results.append({"scenario": scenario, "size": size, "phases": phases})
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line, then run the benchmarks (or a single worker)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write the JSON results to this file")
+    parser.add_argument("--worker", choices=SCENARIOS, help=argparse.SUPPRESS)
+    parser.add_argument("--config", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(_worker(args.worker, args.config)))
+        return 0
+
+    report = json.dumps(_benchmark(args.sizes, args.repeat), indent=2)
+    if args.output:
+        args.output.write_text(report)
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""Measure the memory retained by `NestedDict` trees built from generated configs.
+
+Configs with `size` leaf settings are generated at each `depth`, in two shapes: `mapping` (nested
+dictionaries, as `tests.benchmarks.scaling.generate` creates them) and `sequence` (the same, with
+lists as the innermost containers). For each config, the report includes the bytes retained by the
+tree itself (`tree`), by its flat-key index (`index`), and per leaf setting:
+
+    python -m tests.benchmarks.memory --sizes 1000 100000 --depths 1 3 6
+
+The results are written as JSON to stdout (or `--output`). Compare the reports of two revisions to
+measure the effect of a change to the node representation.
+"""
+from __future__ import annotations
+
+# stdlib
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+# local
+from pyspry.nested_dict import NestedDict
+from tests.benchmarks.scaling import generate
+
+__all__ = ["SHAPES", "generate_shape", "main", "measure"]
+
+SHAPES = ("mapping", "sequence")
+"""The shapes of the generated configs."""
+
+
+def generate_shape(shape: str, size: int, depth: int) -> dict[str, Any]:
+    """Generate a config with about `size` leaf settings, nested `depth` levels deep.
+
+    >>> generate_shape("sequence", 4, 2)
+    {'BENCH_K0': [0, 1], 'BENCH_K1': [2, 3]}
+
+    Args:
+        shape (builtins.str): one of `SHAPES`
+        size (builtins.int): the number of leaf settings
+        depth (builtins.int): the number of levels of nesting
+
+    Returns:
+        builtins.dict[builtins.str, typing.Any]: the generated config
+    """
+    config = generate(size, depth)
+    if shape == "mapping" or depth < 2:
+        return config
+
+    def convert(node: Any) -> Any:
+        if not isinstance(node, dict):
+            return node
+        if not any(isinstance(value, dict) for value in node.values()):
+            return list(node.values())
+        return {key: convert(value) for key, value in node.items()}
+
+    return {key: convert(value) for key, value in config.items()}
+
+
+def _retained() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def measure(shape: str, size: int, depth: int) -> dict[str, Any]:
+    """Measure the bytes retained by a `NestedDict` built from a generated config.
+
+    The keys and values of the config are included, since the tree keeps them alive.
+
+    Returns:
+        builtins.dict[builtins.str, typing.Any]: the bytes retained by the tree and by its index
+    """
+    tracemalloc.start()
+    try:
+        baseline = _retained()
+        # note: like a parsed config file, the generated config is discarded once it's converted
+        nested = NestedDict(generate_shape(shape, size, depth))
+        tree = _retained() - baseline
+        _ = "" in nested  # note: build the flat-key index
+        index = _retained() - baseline - tree
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "shape": shape,
+        "size": size,
+        "depth": depth,
+        "tree": tree,
+        "index": index,
+        "tree_per_leaf": tree / size,
+        "total_per_leaf": (tree + index) / size,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1_000, 10_000, 100_000])
+    parser.add_argument("--depths", nargs="+", type=int, default=[1, 3, 6])
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=SHAPES)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    report = json.dumps(
+        {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "results": [
+                measure(shape, size, depth)
+                for shape in args.shapes
+                for depth in args.depths
+                for size in args.sizes
+            ],
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as f:
+            f.write(report)
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+"""Measure how `NestedDict` and `Settings` operations scale with the size and depth of the config.
+
+Configs with `size` leaf settings are generated at each `depth`, and every operation in
+`OPERATIONS` is timed against them. For each operation and depth, the report includes the scaling
+curve (seconds per call, for each size) and the exponent `k` of the best fit `time ~ size ** k`,
+so a complexity regression (e.g. a quadratic construction path) shows up as `k` close to 2:
+
+    python -m tests.benchmarks.scaling --sizes 100 1000 10000 100000 1000000 --depths 1 3 6
+
+The results are written as JSON to stdout (or `--output`).
+"""
+from __future__ import annotations
+
+# stdlib
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, NamedTuple
+
+# local
+from pyspry.base import Settings
+from pyspry.nested_dict import NestedDict
+
+__all__ = ["OPERATIONS", "Case", "generate", "main", "measure", "scaling_exponent"]
+
+PREFIX = "BENCH"
+"""The variable prefix used for the generated configs."""
+
+LOOKUPS = 1_000
+"""The number of keys used by the per-key operations (`__getitem__`, etc.)."""
+
+
+class Case(NamedTuple):
+    """The inputs shared by the operations for one size and depth."""
+
+    config: dict[str, Any]
+    nested: NestedDict
+    keys: list[str]
+
+
+def generate(size: int, depth: int) -> dict[str, Any]:
+    """Generate a config with about `size` leaf settings, nested `depth` levels deep.
+
+    >>> generate(4, 2)
+    {'BENCH_K0': {'K0': 0, 'K1': 1}, 'BENCH_K1': {'K0': 2, 'K1': 3}}
+
+    Args:
+        size (builtins.int): the number of leaf settings
+        depth (builtins.int): the number of levels of nesting
+
+    Returns:
+        builtins.dict[builtins.str, typing.Any]: the generated config
+    """
+    fanout = max(2, math.ceil(size ** (1 / depth)))
+    counter = iter(range(size))
+
+    def level(remaining: int, budget: int) -> Any:
+        if remaining == 0:
+            return next(counter)
+        node: dict[str, Any] = {}
+        for i in range(fanout):
+            share = budget // fanout + (i < budget % fanout)
+            if share:
+                node[f"K{i}"] = level(remaining - 1, share)
+        return node
+
+    root = level(depth, size)
+    return {f"{PREFIX}_{key}": value for key, value in root.items()}
+
+
+def _flat_keys(config: dict[str, Any], count: int) -> list[str]:
+    """Sample `count` flattened keys of leaf settings (with repetition)."""
+    leaves = []
+
+    def walk(prefix: str, value: Any) -> None:
+        if isinstance(value, dict):
+            for key, child in value.items():
+                walk(f"{prefix}{NestedDict.sep}{key}", child)
+        else:
+            leaves.append(prefix)
+
+    for key, value in config.items():
+        walk(key, value)
+    rng = random.Random(0)
+    return [rng.choice(leaves) for _ in range(count)]
+
+
+def _getitem(case: Case) -> Callable[[], Any]:
+    nested, keys = case.nested, case.keys
+    return lambda: [nested[key] for key in keys]
+
+
+def _contains(case: Case) -> Callable[[], Any]:
+    nested, keys = case.nested, case.keys
+    return lambda: [key in nested for key in keys]
+
+
+def _setitem(case: Case) -> Callable[[], Any]:
+    nested, keys = NestedDict(case.config), case.keys
+
+    def run() -> None:
+        for key in keys:
+            nested[key] = 0
+
+    return run
+
+
+def _squash(case: Case) -> Callable[[], Any]:
+    nested = NestedDict(case.config)
+    return nested.squash
+
+
+def _or(case: Case) -> Callable[[], Any]:
+    nested, other = case.nested, NestedDict({key: 1 for key in case.keys})
+    return lambda: nested | other
+
+
+def _ior(case: Case) -> Callable[[], Any]:
+    nested, other = NestedDict(case.config), NestedDict({key: 1 for key in case.keys})
+
+    def run() -> None:
+        nonlocal nested
+        nested |= other
+
+    return run
+
+
+def _keys(case: Case) -> Callable[[], Any]:
+    nested = case.nested
+    return lambda: sum(1 for _ in nested.keys())
+
+
+def _getattr(case: Case) -> Callable[[], Any]:
+    settings = Settings(case.config, {}, PREFIX, cache_size=0)
+    names = [key[len(PREFIX) + len(NestedDict.sep) :] for key in case.keys]
+    return lambda: [getattr(settings, name) for name in names]
+
+
+def _get_many(case: Case) -> Callable[[], Any]:
+    settings = Settings(case.config, {}, PREFIX, cache_size=0)
+    names = [key[len(PREFIX) + len(NestedDict.sep) :] for key in case.keys]
+    return lambda: settings.get_many(names)
+
+
+OPERATIONS: dict[str, Callable[[Case], Callable[[], Any]]] = {
+    "build": lambda case: lambda: NestedDict(case.config),
+    "__getitem__": _getitem,
+    "__contains__": _contains,
+    "__setitem__": _setitem,
+    "squash": _squash,
+    "__or__": _or,
+    "__ior__": _ior,
+    "serialize": lambda case: case.nested.serialize,
+    "keys": _keys,
+    "Settings.__getattr__": _getattr,
+    "Settings.get_many": _get_many,
+}
+"""Map the name of each operation to a function preparing it for a `Case`.
+
+The per-key operations (`__getitem__`, `__contains__`, `__setitem__`, `Settings.__getattr__`, and
+`Settings.get_many`) each use `LOOKUPS` keys, so their time per call should stay flat as the config
+grows."""
+
+
+def measure(operation: str, case: Case, repeat: int) -> float:
+    """Return the best time (in seconds) of `repeat` calls, each prepared from scratch.
+
+    Args:
+        operation (builtins.str): the name of the operation in `OPERATIONS`
+        case (tests.benchmarks.scaling.Case): the inputs of the operation
+        repeat (builtins.int): the number of calls to time
+
+    Returns:
+        builtins.float: the fastest call
+    """
+    best = math.inf
+    for _ in range(repeat):
+        run = OPERATIONS[operation](case)
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scaling_exponent(sizes: list[int], durations: list[float]) -> float | None:
+    """Fit `duration ~ size ** k` by least squares on a log-log scale, and return `k`.
+
+    >>> round(scaling_exponent([10, 100, 1000], [1e-3, 1e-1, 1e1]), 3)
+    2.0
+
+    Returns:
+        typing.Optional[builtins.float]: the exponent, or `None` with fewer than two sizes
+    """
+    points = [(math.log(s), math.log(d)) for s, d in zip(sizes, durations) if d > 0]
+    if len(points) < 2:
+        return None
+    xs, ys = zip(*points)
+    return _slope(xs, ys)
+
+
+def _slope(xs: tuple[float, ...], ys: tuple[float, ...]) -> float | None:
+    """Return the least-squares slope of `ys` over `xs`, or `None` if `xs` are all equal."""
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    return numerator / denominator if denominator else None
+
+
+def run(
+    sizes: list[int], depths: list[int], operations: list[str], repeat: int
+) -> list[dict[str, Any]]:
+    """Measure each operation at every size and depth.
+
+    Returns:
+        builtins.list[builtins.dict[builtins.str, typing.Any]]: one scaling curve per operation and
+            depth
+    """
+    curves: dict[tuple[str, int], list[float]] = {}
+    for depth in depths:
+        for size in sizes:
+            config = generate(size, depth)
+            case = Case(config, NestedDict(config), _flat_keys(config, LOOKUPS))
+            for operation in operations:
+                curves.setdefault((operation, depth), []).append(measure(operation, case, repeat))
+
+    return [
+        {
+            "operation": operation,
+            "depth": depth,
+            "sizes": sizes,
+            "seconds": durations,
+            "exponent": scaling_exponent(sizes, durations),
+        }
+        for (operation, depth), durations in curves.items()
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--depths", nargs="+", type=int, default=[1, 3, 6])
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATIONS), default=OPERATIONS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    report = json.dumps(
+        {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "repeat": args.repeat,
+            "results": run(args.sizes, args.depths, list(args.operations), args.repeat),
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as f:
+            f.write(report)
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
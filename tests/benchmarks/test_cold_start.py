@@ -0,0 +1,21 @@
+"""Smoke-test the cold-start benchmark harness."""
+from __future__ import annotations
+
+# stdlib
+from pathlib import Path
+
+# local
+from tests.benchmarks import cold_start
+
+
+def test_settings_load_phases(tmp_path: Path) -> None:
+    """A worker subprocess reports every phase of loading the settings."""
+    config_path = tmp_path / "config.yml"
+    environ = cold_start.write_config(config_path, 20)
+    environ["PYSPRY_VAR_PREFIX"] = cold_start.PREFIX
+
+    phases = cold_start.run_scenario("settings-load", config_path, environ, repeat=1)
+
+    expected = {"imports", "read", "parse", "env_decode", "build", "merge", "process"}
+    assert set(phases) == expected
+    assert all(0 <= summary["min"] <= summary["max"] for summary in phases.values())
@@ -0,0 +1,21 @@
+"""Smoke-test the memory benchmark."""
+from __future__ import annotations
+
+# local
+from pyspry.nested_dict import NestedDict
+from tests.benchmarks import memory
+
+
+def test_shapes_have_the_same_leaves() -> None:
+    """Both shapes of a generated config have the same leaves, so their memory is comparable."""
+    mapping, sequence = (memory.generate_shape(shape, 100, 3) for shape in memory.SHAPES)
+
+    assert NestedDict(mapping).shape() == NestedDict(sequence).shape() == (100, 3)
+
+
+def test_measure_reports_memory() -> None:
+    """The tree and its index both retain memory."""
+    result = memory.measure("sequence", 100, 3)
+
+    assert result["tree"] > 0 and result["index"] > 0
+    assert result["total_per_leaf"] > result["tree_per_leaf"]
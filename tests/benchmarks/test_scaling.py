@@ -0,0 +1,25 @@
+"""Smoke-test the scaling benchmark suite."""
+from __future__ import annotations
+
+# local
+from pyspry.nested_dict import NestedDict
+from tests.benchmarks import scaling
+
+
+def test_generate_size() -> None:
+    """The generated config has the requested number of leaves, at the requested depth."""
+    nested = NestedDict(scaling.generate(1_000, 3))
+
+    keys = [key for key in nested.keys() if not isinstance(nested[key], NestedDict)]
+    assert len(keys) == 1_000
+    assert all(key.count(NestedDict.sep) == 3 for key in keys)
+
+
+def test_every_operation_reports_a_curve() -> None:
+    """Each operation is measured at every size, and its scaling exponent is fitted."""
+    results = scaling.run([10, 100], [2], list(scaling.OPERATIONS), repeat=1)
+
+    assert [result["operation"] for result in results] == list(scaling.OPERATIONS)
+    for result in results:
+        assert len(result["seconds"]) == 2
+        assert result["exponent"] is not None
@@ -2,17 +2,30 @@
 from __future__ import annotations
 
 # stdlib
+import asyncio
+import importlib.util
 import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
+from pathlib import Path
 from typing import Any
 
 # third party
 import pytest
+import yaml
 from _pytest.monkeypatch import MonkeyPatch
 
 # local
-from pyspry import conftest
-from pyspry.base import ConfigLoader, Settings, SettingsContainer
+from pyspry import base, conftest
+from pyspry.base import (
+    ConfigLoader,
+    Settings,
+    SettingsContainer,
+    filter_prefix,
+    stream_yaml,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,3 +63,294 @@ def test_infra_486(bootstrapped_settings: SettingsContainer) -> None:
         == bootstrapped_settings.AUTH_PASSWORD_VALIDATORS
     )
     assert "AUTH_PASSWORD_VALIDATORS" in dir(bootstrapped_settings)
+
+
+def test_cache_survives_merge() -> None:
+    """Settings are immutable snapshots, so merging them neither changes nor evicts cached values."""
+    settings = Settings({"A": {"B": 1, "C": 2}}, {}, "", read_only=True)
+    assert settings.A == {"B": 1, "C": 2}
+    assert settings.A is settings.A
+
+    merged = settings | Settings({"A": {"B": 3}}, {}, "")
+
+    assert (merged.A, settings.A) == ({"B": 3, "C": 2}, {"B": 1, "C": 2})
+    assert settings.cache_info().misses == 1
+
+
+def test_cached_containers_not_shared() -> None:
+    """Modifying a nested setting doesn't change later reads, since each read gets a new copy."""
+    settings = Settings({"APP_A": {"B": [1, 2]}}, {}, "APP")
+    settings.A["B"].append(3)
+    assert settings.A == settings.config["APP_A"] == {"B": [1, 2]}
+    settings.get_many(["A"])[0]["A"]["B"].append(3)
+    assert settings.A is not settings.A
+    assert settings.A == {"B": [1, 2]}
+    assert settings.cache_info() == (5, 1, None, 1)
+
+
+def test_merge_leaves_layers_unchanged() -> None:
+    """Flattened keys merged into a container of a later layer don't leak into that layer."""
+    first, second = Settings({"A_B": 1}, {}, ""), Settings({"A": {"C": 2}}, {}, "")
+
+    merged = Settings.merge(first, second)
+
+    assert merged.A == {"B": 1, "C": 2}
+    assert second.serialize() == {"A": {"C": 2}}
+
+
+def test_container_snapshots_consistent() -> None:
+    """Readers of a snapshot never observe a partially applied update."""
+    container = SettingsContainer("module", None, Settings({"A": 0, "B": 0}, {}, ""))
+    done = threading.Event()
+    torn: list[tuple[int, int]] = []
+
+    def read() -> None:
+        while not done.is_set():
+            snapshot = container.snapshot()
+            if snapshot.A != snapshot.B:
+                torn.append((snapshot.A, snapshot.B))
+
+    with ThreadPoolExecutor(4) as executor:
+        for _ in range(4):
+            executor.submit(read)
+        for i in range(1, 200):
+            container.update(Settings({"A": i, "B": i}, {}, ""))
+        done.set()
+
+    assert not torn
+    assert (container.A, container.B) == (199, 199)
+
+
+def test_container_assignment_replaces() -> None:
+    """Assigning a setting replaces its value, and assigning an option changes the option."""
+    container = SettingsContainer("module", None, Settings({"APP_A": {"B": 1, "C": 2}}, {}, "APP"))
+    container.A = {"B": 3}
+    container.prefix = ""
+
+    assert container.APP_A == {"B": 3}
+    assert container.snapshot().prefix == ""
+    assert "prefix" not in container.snapshot().config
+
+
+def test_container_dispatch_unlocked() -> None:
+    """Subscribers are notified after the lock is released, so other writers aren't blocked."""
+    container = SettingsContainer("module", None, Settings({"A": 0, "B": 0}, {}, ""))
+
+    def write(changes: list[Any]) -> None:
+        writer = threading.Thread(target=container.update, args=[Settings({"B": 1}, {}, "")])
+        writer.start()
+        writer.join(5)
+        assert not writer.is_alive()
+
+    container.subscribe("A", write)
+    assert [change.key for change in container.update(Settings({"A": 1}, {}, ""))] == ["A"]
+    assert (container.A, container.B) == (1, 1)
+
+
+@pytest.mark.parametrize("cache_size", [None, 2])
+def test_cache_concurrent_reads(cache_size: int | None) -> None:
+    """Concurrent reads are all counted, and never corrupt a bounded cache."""
+    settings = Settings({"A": 0, "B": 1, "C": 2}, {}, "", cache_size=cache_size)
+
+    def read() -> None:
+        for _ in range(1000):
+            assert (settings.A, settings.B, settings.C) == (0, 1, 2)
+            settings.get_many(["A", "C"])
+
+    with ThreadPoolExecutor(4) as executor:
+        for future in [executor.submit(read) for _ in range(4)]:
+            future.result()
+
+    info = settings.cache_info()
+    assert info.hits + info.misses == 4 * 1000 * 5
+    assert info.currsize == 3 if cache_size is None else 2
+
+
+@pytest.mark.parametrize(
+    ("suffix", "content"),
+    [
+        (".yml", "APP_A: {B: [1, 2]}\nAPP_C: 3\n"),
+        (".json", '{"APP_A": {"B": [1, 2]}, "APP_C": 3}'),
+        pytest.param(
+            ".toml",
+            "APP_C = 3\n[APP_A]\nB = [1, 2]\n",
+            marks=pytest.mark.skipif(
+                not importlib.util.find_spec("tomllib") and not importlib.util.find_spec("tomli"),
+                reason="requires tomllib or tomli",
+            ),
+        ),
+    ],
+)
+def test_parser_by_extension(suffix: str, content: str, tmp_path: Path) -> None:
+    """Config files are parsed according to their file extension."""
+    path = tmp_path / f"config{suffix}"
+    path.write_text(content)
+    settings = Settings.load(path, "APP")
+    assert settings.A_B == [1, 2]
+    assert settings.C == 3
+
+
+def test_toml_requires_tomli(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """TOML files are never parsed as YAML, even if no TOML library is available."""
+    path = tmp_path / "config.toml"
+    path.write_text("APP_C = 3\n")
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+
+    with pytest.raises(ImportError, match="requires the 'tomli' package"):
+        Settings.load(path, "APP")
+
+
+def test_loader_parser_env_var(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """`ConfigLoader` overrides the parser with the environment variable."""
+    path = tmp_path / "config.cfg"
+    path.write_text('{"APP_A": 1}')
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str(path))
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "APP")
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PARSER, "json")
+
+    assert ConfigLoader.create().read_settings().A == 1
+
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PARSER, "ini")
+    with pytest.raises(ValueError, match="unknown config parser 'ini'"):
+        ConfigLoader.create().read_settings()
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        "",
+        "APP_A: 1\nOTHER: {B: [1, {C: 2}]}\nAPP_B: {C: [3]}\n",
+        "OTHER: &x [1, 2]\nAPP_A: *x\n",
+        "APP_X: &x {K: V}\nOTHER: *x\nAPP_Y: *x\n",
+        "<<: {APP_A: 1}\nAPP_B: 2\n",
+        "!!map {APP_A: 1, OTHER: 2}",
+        "? [complex, key]\n: 1\nAPP_A: 2\n",
+        "APP_A: 1\nAPP_A: 2\n",
+        "- APP_A\n- APP_B\n",
+    ],
+)
+def test_stream_yaml_matches_full_parse(document: str) -> None:
+    """Streaming, prefix-filtered loading gives the same result as parsing the full document."""
+    try:
+        expected = filter_prefix(yaml.safe_load(document) or {}, "APP")
+    except Exception as e:  # pylint: disable=broad-except
+        with pytest.raises(type(e)):
+            stream_yaml(document, "APP")
+    else:
+        assert stream_yaml(document, "APP") == expected
+
+
+def test_loader_concurrent_matches_sequential(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Loading config files in a thread pool merges them in the declared order."""
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"config-{i}.yml"
+        path.write_text(f"APP_A: {{B: {i}, C{i}: [{i}]}}\nAPP_D: {i}\n")
+        paths.append(str(path))
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str(paths))
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "APP")
+
+    sequential = ConfigLoader.create().read_settings()
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_WORKERS, "4")
+    loader = ConfigLoader.create()
+    assert loader.workers == 4
+
+    concurrent = loader.read_settings()
+    assert concurrent.serialize() == sequential.serialize()
+    assert concurrent.D == 5
+
+
+def test_loader_async_matches_sync(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Loading config files on an event loop gives the same settings as the synchronous path."""
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"config-{i}.yml"
+        path.write_text(f"APP_A: {{B: {i}, C{i}: [{i}]}}\nAPP_D: {i}\n")
+        paths.append(str(path))
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str(paths))
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "APP")
+    monkeypatch.setenv("APP_A_B", "[7]")
+    loader = ConfigLoader.create()
+
+    async def load() -> Settings:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        with ThreadPoolExecutor(2) as executor:
+            settings = await loader.aread_settings(executor)
+        ticker.cancel()
+        assert ticks > 0
+        return settings
+
+    settings = asyncio.run(load())
+    assert settings.serialize() == loader.read_settings().serialize()
+    assert settings.A["B"] == [7]
+    assert settings.D == 5
+
+
+def test_loader_env_applied_once(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Environment overrides are decoded once and applied after the config files are merged."""
+    paths = [tmp_path / "base.yml", tmp_path / "override.yml"]
+    paths[0].write_text("APP_A: {B: 1}\n")
+    paths[1].write_text("APP_A: 5\n")
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str([str(path) for path in paths]))
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "APP")
+    monkeypatch.setenv("APP_A", '{"C": 2}')
+    base._decode_env.cache_clear()  # pylint: disable=protected-access
+
+    for _ in range(2):
+        assert ConfigLoader.create().read_settings().A == {"C": 2}
+    assert base._decode_env.cache_info().misses == 1  # pylint: disable=protected-access
+
+
+def test_env_decoded_lazily(monkeypatch: MonkeyPatch) -> None:
+    """Large JSON values are decoded on first access; plain strings never reach the decoder."""
+    decoded: list[str] = []
+    loads = base.json.loads
+
+    def spy(value: str) -> Any:
+        decoded.append(value)
+        return loads(value)
+
+    monkeypatch.setattr(base.json, "loads", spy)
+    base._decode_env.cache_clear()  # pylint: disable=protected-access
+    environ = {"APP_A": '{"B": [1, 2]}', "APP_HOST": "localhost", "APP_C": "[3]"}
+
+    settings = Settings({"APP_A": {"D": 0}}, environ, "APP", lazy_decode_size=8)
+    assert decoded == ["[3]"]
+    assert settings.HOST == "localhost"
+    assert settings.A == {"B": [1, 2], "D": 0}
+    assert decoded == ["[3]", '{"B": [1, 2]}']
+
+
+def test_env_decoded_lazily_matches_eager() -> None:
+    """Deferring the large JSON values doesn't change the merged settings."""
+    environ = {"APP_A": '{"B": [1, 2]}', "APP_HOST": "localhost", "APP_C": "[3]"}
+    lazy = Settings({"APP_A": {"D": 0}}, environ, "APP", lazy_decode_size=8)
+    eager = Settings({"APP_A": {"D": 0}}, environ, "APP", lazy_decode_size=None)
+    assert eager.serialize() == lazy.serialize()
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_get_many_matches_getattr(read_only: bool) -> None:
+    """Batch lookups agree with `getattr()`, decode pending env vars, and share the cache."""
+    environ = {"APP_A": '{"B": [1, 2]}', "APP_HOST": "localhost"}
+    settings = Settings(
+        {"APP_A": {"D": 0}, "APP_C": 3}, environ, "APP", read_only=read_only, lazy_decode_size=8
+    )
+    names = ["A", "A_B_1", "APP_C", "HOST", "MISSING"]
+
+    found, missing = settings.get_many(names)
+    assert (found["A"], missing) == ({"B": [1, 2], "D": 0}, {"MISSING"})
+    assert found == {name: getattr(settings, name) for name in names[:-1]}
+
+    info = settings.cache_info()
+    assert settings.get_many(names[:-1])[0] == found
+    assert settings.cache_info().hits == info.hits + 4
@@ -0,0 +1,76 @@
+"""Verify the on-disk cache of parsed config files."""
+from __future__ import annotations
+
+# stdlib
+import datetime
+import os
+from pathlib import Path
+
+# third party
+import pytest
+import yaml
+from _pytest.monkeypatch import MonkeyPatch
+
+# local
+from pyspry.base import ConfigLoader, Settings
+from pyspry.cache import cache_path_for, load_cached
+
+
+def test_cache_invalidated_on_change(tmp_path: Path) -> None:
+    """A changed source file is parsed again, even if its size and mtime are unchanged."""
+    source = tmp_path / "config.yml"
+    source.write_text("A: 1\n")
+    stat = source.stat()
+    assert load_cached(source, yaml.safe_load) == {"A": 1}
+    assert cache_path_for(source).exists()
+
+    source.write_text("A: 2\n")
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_cached(source, yaml.safe_load) == {"A": 2}
+
+
+def test_cache_keyed_by_parser(tmp_path: Path) -> None:
+    """Parsing the same file with different parsers never returns the other parser's result."""
+    source = tmp_path / "config.json"
+    source.write_text('{"A": 1e3}')
+
+    for _ in range(2):
+        assert Settings.load(source, None, cache=True).A == 1000.0
+        assert Settings.load(source, None, cache=True, parser="yaml").A == "1e3"
+    assert load_cached(source, pytest.fail, parser="json") == {"A": 1000.0}
+
+
+def test_corrupt_cache_ignored(tmp_path: Path) -> None:
+    """Unreadable cache files are replaced instead of raising."""
+    source = tmp_path / "config.yml"
+    source.write_text("A: 1\n")
+    cache_path_for(source).write_bytes(b"not marshal data")
+
+    assert load_cached(source, yaml.safe_load) == {"A": 1}
+    assert load_cached(source, pytest.fail) == {"A": 1}
+
+
+def test_cached_values_round_trip(tmp_path: Path) -> None:
+    """Dates and times survive the cache, which is only reused if nobody else can modify it."""
+    source = tmp_path / "config.yml"
+    source.write_text("A: 2024-02-29\nB: {C: 2024-02-29 12:30:00+01:00}\n2: [1.5, null]\n")
+    parsed = load_cached(source, yaml.safe_load)
+    assert parsed["A"] == datetime.date(2024, 2, 29) and 2 in parsed
+    assert load_cached(source, pytest.fail) == parsed
+
+    cache_path_for(source).chmod(0o666)
+    assert load_cached(source, yaml.safe_load) == parsed
+    assert cache_path_for(source).stat().st_mode & 0o777 == 0o600
+
+
+def test_loader_cache_env_var(config_path: Path, monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """`ConfigLoader` writes cache files to the directory named by the environment variable."""
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str(config_path))
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "APP_NAME")
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_CACHE, str(tmp_path))
+
+    uncached = ConfigLoader(str(config_path), "APP_NAME").read_settings()
+    for _ in range(2):
+        settings = ConfigLoader.create().read_settings()
+        assert settings.serialize() == uncached.serialize()
+    assert cache_path_for(config_path, tmp_path, "yaml").exists()
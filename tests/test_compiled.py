@@ -0,0 +1,137 @@
+"""Verify the compiled settings modules of `pyspry.compiled`."""
+from __future__ import annotations
+
+# stdlib
+import datetime
+import logging
+import os
+import shutil
+import sys
+import types
+from pathlib import Path
+
+# third party
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+# local
+from pyspry import compiled
+from pyspry.base import ConfigLoader, Settings, SettingsContainer, bootstrap_module
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture()
+def loader(monkeypatch: MonkeyPatch) -> ConfigLoader:
+    """Configure the loader for `sample-config.yml` with environment variables."""
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, "sample-config.yml")
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "PYSPRY")
+    monkeypatch.setenv("PYSPRY_LOGGING_version", "2")
+    return ConfigLoader.create()
+
+
+@pytest.fixture()
+def module(loader: ConfigLoader, tmp_path: Path) -> types.ModuleType:
+    """Compile the settings of `loader`, then load the compiled module."""
+    path = compiled.compile_settings(tmp_path / "compiled_settings.py", loader)
+    module = compiled.load_compiled(path, "__compiled_settings", loader)
+    assert module is not None
+    return module
+
+
+def test_compiled_matches_settings(loader: ConfigLoader, module: types.ModuleType) -> None:
+    """The compiled module resolves the same names to the same values as the settings."""
+    settings = loader.read_settings()
+    for name in dir(settings):
+        assert getattr(module, name) == getattr(settings, name), name
+    assert module.PYSPRY_TEST_RUNNER == settings.TEST_RUNNER
+    assert module.LOGGING["version"] == module.LOGGING_version == 2
+
+
+def test_compiled_bytecode(module: types.ModuleType, tmp_path: Path) -> None:
+    """The module is compiled ahead of time, and only exposes the settings as constants."""
+    assert list(tmp_path.glob("__pycache__/compiled_settings.*.pyc"))
+    assert "_pyspry_config" not in [name for name in dir(module) if name.isupper()]
+
+
+def test_stale_files(
+    loader: ConfigLoader,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A change to a config file makes the compiled module stale, without executing it."""
+    config_path = tmp_path / "config.yml"
+    config_path.write_text("PYSPRY_A: 1\n")
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str(config_path))
+    loader = ConfigLoader.create()
+    path = compiled.compile_settings(tmp_path / "compiled_settings.py", loader)
+
+    with path.open("a", encoding="UTF-8") as f:
+        f.write("\nraise RuntimeError('stale module executed')\n")
+    config_path.write_text("PYSPRY_A: 2\n")
+    caplog.set_level(logging.DEBUG, compiled.__name__)
+    assert compiled.load_compiled(path, "__compiled_settings", loader) is None
+    assert "stale module executed" not in caplog.text
+    assert compiled.load_compiled(tmp_path / "missing.py", "__compiled_settings", loader) is None
+
+
+def test_fingerprint_ignores_location(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Copied or touched config files with the same contents keep the compiled module valid."""
+    original, copy = tmp_path / "original.yml", tmp_path / "copy" / "config.yml"
+    original.write_text("APP_A: 1\n")
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str(original))
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "APP")
+    path = compiled.compile_settings(tmp_path / "compiled_settings.py")
+
+    copy.parent.mkdir()
+    shutil.copyfile(original, copy)
+    os.utime(copy, (0, 0))
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str(copy))
+
+    assert compiled.load_compiled(path, "__compiled_settings", ConfigLoader.create()) is not None
+
+
+def test_literals(tmp_path: Path) -> None:
+    """Values that `repr()` can't round-trip on its own are written as valid Python."""
+    config = {
+        "APP_DATE": datetime.date(2024, 2, 29),
+        "APP_TIME": datetime.datetime(2024, 2, 29, 12, tzinfo=datetime.timezone.utc),
+        "APP_FLOATS": [float("inf"), -float("inf"), 0.5],
+        "APP_SET": {1},
+        "APP_class": "a keyword",
+        "APP_0": "not an identifier",
+    }
+    inputs = {"prefix": "APP"}
+    path = compiled.write_module(tmp_path / "literals.py", Settings(config, {}, "APP"), inputs)
+
+    namespace: dict[str, object] = {}
+    exec(compile(path.read_text(), str(path), "exec"), namespace)  # nosec B102
+    assert namespace["_pyspry_config"] == Settings(config, {}, "APP").serialize()
+    assert namespace["DATE"] == datetime.date(2024, 2, 29)
+    assert "class" not in namespace and "0" not in namespace
+
+    with pytest.raises(TypeError, match="cannot compile"):
+        compiled.write_module(tmp_path / "bad.py", Settings({"APP_A": object()}, {}, "APP"), inputs)
+
+
+def test_bootstrap_prefers_compiled(
+    loader: ConfigLoader, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """`bootstrap_module` imports an up-to-date compiled module instead of loading."""
+    path = compiled.compile_settings(tmp_path / "compiled_settings.py", loader)
+    monkeypatch.setenv(ConfigLoader.VARNAME_COMPILED_PATH, str(path))
+    monkeypatch.setattr(ConfigLoader, "read_settings", pytest.fail)
+    monkeypatch.delitem(sys.modules, "__bootstrapped_compiled", raising=False)
+
+    module = bootstrap_module("__bootstrapped_compiled")
+    assert not isinstance(module, SettingsContainer)
+    assert sys.modules["__bootstrapped_compiled"] is module
+    assert module.LOGGING_version == 2
+
+    monkeypatch.undo()
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, "sample-config.yml")
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "PYSPRY")
+    monkeypatch.setenv(ConfigLoader.VARNAME_COMPILED_PATH, str(path))
+    assert isinstance(bootstrap_module("__bootstrapped_compiled"), SettingsContainer)
+    del sys.modules["__bootstrapped_compiled"]
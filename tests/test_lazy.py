@@ -0,0 +1,73 @@
+"""Verify the lazy bootstrap mode of `pyspry.settings`."""
+from __future__ import annotations
+
+# stdlib
+import os
+import subprocess  # nosec B404
+import sys
+import threading
+from pathlib import Path
+
+# third party
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+# local
+from pyspry import compiled, lazy
+from pyspry.base import ConfigLoader, SettingsContainer
+
+
+def test_import_defers_yaml() -> None:
+    """Importing `pyspry.settings` lazily doesn't import `yaml` or `pyspry.base`."""
+    code = (
+        "import sys, pyspry.settings as s\n"
+        "assert 'yaml' not in sys.modules and 'pyspry.base' not in sys.modules\n"
+        "assert s.TEST_RUNNER\n"
+        "assert 'yaml' in sys.modules\n"
+    )
+    env = {**os.environ, lazy.VARNAME_LAZY: "1", "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)  # nosec B603
+
+
+@pytest.mark.setenv(PYSPRY_LAZY="true")
+def test_reload_lazy(pyspry_settings: SettingsContainer) -> None:
+    """Reloading `pyspry.settings` installs a new, unloaded container."""
+    assert isinstance(pyspry_settings, lazy.LazySettingsContainer)
+    assert "loaded=False" in repr(pyspry_settings)
+    assert "TEST_RUNNER" in pyspry_settings
+    assert "loaded=True" in repr(pyspry_settings)
+
+
+def test_loaded_once(monkeypatch: MonkeyPatch) -> None:
+    """Concurrent first accesses create a single container."""
+    created: list[str] = []
+    create = SettingsContainer.create
+
+    def spy(module_name: str, spec: None, loader: ConfigLoader | None = None) -> SettingsContainer:
+        created.append(module_name)
+        return create(module_name, spec, loader)
+
+    monkeypatch.setattr(SettingsContainer, "create", spy)
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, "sample-config.yml")
+    container = lazy.LazySettingsContainer("__lazy_settings", None)
+
+    threads = [threading.Thread(target=lambda: container.TEST_RUNNER) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert created == ["__lazy_settings"]
+
+
+def test_lazy_prefers_compiled(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """On first use, the lazy container loads compiled settings, as `bootstrap_module` would."""
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, "sample-config.yml")
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "PYSPRY")
+    path = compiled.compile_settings(tmp_path / "compiled_settings.py", ConfigLoader.create())
+    monkeypatch.setenv(ConfigLoader.VARNAME_COMPILED_PATH, str(path))
+    monkeypatch.setattr(ConfigLoader, "read_settings", pytest.fail)
+    container = lazy.LazySettingsContainer("__lazy_compiled", None)
+
+    assert container.TEST_RUNNER == "django.test.runner.DiscoverRunner"
+    assert "TEST_RUNNER" in container
+    assert "loaded=True" in repr(container)
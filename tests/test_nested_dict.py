@@ -2,10 +2,16 @@
 from __future__ import annotations
 
 # stdlib
+import random
+import sys
 from typing import Any
 
+# third party
+import pytest
+
 # local
-from pyspry.nested_dict import NestedDict
+from pyspry.keysview.flatten import flatten
+from pyspry.nested_dict import NestedChange, NestedDict
 
 
 def test_nested_dict_keys(configuration: dict[str, Any]) -> None:
@@ -13,3 +19,297 @@ def test_nested_dict_keys(configuration: dict[str, Any]) -> None:
     nested_dict = NestedDict(configuration)
     assert "APP_NAME_ATTR_B_K" in list(nested_dict.keys())
     assert "APP_NAME" not in list(nested_dict.keys())
+
+
+def test_keys_view_consistent(configuration: dict[str, Any]) -> None:
+    """`len()` and `in` agree with iterating over the flattened keys."""
+    nested_dict = NestedDict(configuration)
+    keys = nested_dict.keys()
+    assert len(keys) == len(list(keys)) == len(set(keys))
+    assert all(key in keys for key in list(keys))
+    assert "APP_NAME_ATTR_B" in keys and "APP_NAME_ATTR_B_" not in keys
+
+
+def test_keys_view_follows_mutations(configuration: dict[str, Any]) -> None:
+    """`len()` and `in` reflect keys added after the view was created."""
+    nested_dict = NestedDict(configuration)
+    keys = nested_dict.keys()
+    size = len(keys)
+    nested_dict["APP_NAME_ATTR_B_NEW"] = {"X": 1}
+    assert "APP_NAME_ATTR_B_NEW_X" in keys
+    assert len(keys) == len(list(keys)) == size + 2
+
+
+def test_index_scoped_to_tree() -> None:
+    """Writes to unrelated objects keep the flat-key index, but writes to shared nodes don't."""
+    nested_dict = NestedDict({"A": {"B": 0}, "C": {"D": 1}})
+    merged = NestedDict.merge(nested_dict, {"A_B": 2})
+    keys = nested_dict.flat_keys()
+
+    NestedDict({})["X"] = 1
+    assert nested_dict.flat_keys() is keys
+
+    nested_dict["C"]["E"] = 2
+    assert "C_E" in nested_dict.flat_keys() and "C_E" in merged
+    assert merged["C_E"] == nested_dict["C_E"] == 2
+
+
+def test_flatten_deep_nesting() -> None:
+    """Flattening doesn't recurse, so it isn't limited by the depth of the nesting."""
+    depth = sys.getrecursionlimit() * 2
+    nested: dict[str, Any] = {"K": 0}
+    for _ in range(depth):
+        nested = {"K": nested}
+
+    *_, last = flatten(nested)
+    assert last == NestedDict.sep.join(["K"] * (depth + 1))
+
+
+def test_index_matches_scan(configuration: dict[str, Any]) -> None:
+    """Verify the flat-key index resolves every key the same way as `get_first_match`."""
+    nested_dict = NestedDict(configuration)
+    for key in nested_dict.keys():
+        assert nested_dict[key] is nested_dict.get_first_match(key)
+
+
+def test_index_ambiguous_keys() -> None:
+    """Overlapping keys resolve to the shortest matching parent, as `get_first_match` does."""
+    nested_dict = NestedDict({"A": {"AB": 1, "B": 2}, "C": {"D": 3}})
+
+    assert nested_dict["AB"] == nested_dict.get_first_match("AB") == 1
+    assert nested_dict["A_B"] == 2
+    assert "A_AB" in nested_dict
+    assert "C_E" not in nested_dict
+
+
+def test_index_repeated_key() -> None:
+    """A name that repeats a key resolves to that key's value, as `get_first_match` does."""
+    nested_dict = NestedDict({"A": {"1_B": 1}})
+
+    assert nested_dict["A_A"] is nested_dict.get_first_match("A_A") is nested_dict["A"]
+    with pytest.raises(KeyError):
+        nested_dict["B_B"]
+
+
+def test_index_invalidated_on_mutation() -> None:
+    """Verify mutations of nested objects are reflected in the parent's index."""
+    nested_dict = NestedDict({"A": {"B": 0}})
+    assert "A_C" not in nested_dict
+
+    nested_dict["A"]["C"] = 1
+    assert nested_dict["A_C"] == 1
+
+    del nested_dict["A"]
+    assert "A_B" not in nested_dict
+
+
+def test_frozen_rejects_mutation() -> None:
+    """Verify a frozen `NestedDict` (and each nested one) rejects every kind of mutation."""
+    nested_dict = NestedDict({"A": {"B": 0}}).freeze()
+    assert nested_dict["A"].frozen
+
+    for mutate in (
+        lambda: nested_dict.__setitem__("A_C", 1),
+        lambda: nested_dict["A"].__setitem__("C", 1),
+        lambda: nested_dict.__delitem__("A"),
+        lambda: nested_dict.__ior__(NestedDict({"D": 1})),
+    ):
+        with pytest.raises(TypeError):
+            mutate()
+    assert nested_dict.serialize() == {"A": {"B": 0}}
+    assert (nested_dict | {"A_C": 1}).serialize() == {"A": {"B": 0, "C": 1}}
+
+
+def test_list_nodes() -> None:
+    """List-based nodes store their items in a `list`, but accept `str` indices like mappings."""
+    nested_dict = NestedDict({"A": [1, {"B": 2}, [3]]})
+    assert not hasattr(nested_dict, "__dict__")
+    assert list(nested_dict["A"]) == ["0", "1", "2"]
+    assert nested_dict["A_1_B"] == 2 and nested_dict["A_2_0"] == 3
+    assert "A_3" not in nested_dict and "A_01" not in nested_dict
+
+
+def test_list_nodes_assignment() -> None:
+    """Items are set by index, merging a list replaces it, and flattened keys extend it."""
+    nested_dict = NestedDict({"A": [1, {"B": 2}, [3]]})
+    nested_dict["A_1_C"] = 4
+    nested_dict["A_3"] = 5
+    assert nested_dict["A"].serialize() == [1, {"B": 2, "C": 4}, [3], 5]
+
+    nested_dict |= {"A": [0]}
+    assert nested_dict.serialize() == {"A": [0]}
+    assert NestedDict({"B_C": 0, "B": [[]]}).serialize() == {"B": [[], 0]}
+
+
+def test_list_nodes_keep_keys() -> None:
+    """After a deletion, the other items keep their keys, as do keys that aren't the next index."""
+    nested_dict = NestedDict({"A": [1, {"B": 2, "C": 4}, [3], 5]})
+    del nested_dict["A"]["0"]
+    nested_dict["A_X"] = 6
+    nested_dict["A_X"] = 7
+    nested_dict["A_9"] = 8
+    assert nested_dict.serialize() == {"A": [{"B": 2, "C": 4}, [3], 5, 7, 8]}
+    assert nested_dict["A_3"] == 5 and nested_dict["A_X"] == 7 and nested_dict["A_9"] == 8
+    assert "A_0" not in nested_dict
+
+
+def test_patch_shrinks_list() -> None:
+    """Removing several items of a list doesn't shift the indices of the other removals."""
+    old, new = NestedDict({"A": [1, 2, 3, 4]}), NestedDict({"A": [1]})
+    old.apply_patch(old.diff(new))
+    assert old.serialize() == {"A": [1]}
+
+
+def test_view_matches_serialize(configuration: dict[str, Any]) -> None:
+    """Verify read-only views present the same data as `NestedDict.serialize`."""
+    nested_dict = NestedDict(configuration)
+    for prefix in ("", "APP_NAME"):
+        view = nested_dict.view(strip_prefix=prefix)
+        serialized = nested_dict.serialize(strip_prefix=prefix)
+
+        assert view == serialized
+        assert view.serialize() == serialized
+        assert len(view) == len(serialized)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"A_B_X": 1, "A_B": {"Y": 2}, "A": {"Z": 3}},
+        {"A": {"Z": 3}, "A_B": {"Y": 2}, "A_B_X": 1},
+    ],
+)
+def test_squash_nested_containers(data: dict[str, Any]) -> None:
+    """Flattened keys are collapsed into the containers they extend."""
+    assert NestedDict(data).serialize() == {"A": {"Z": 3, "B": {"Y": 2, "X": 1}}}
+
+
+def _unsquashed(data: Any, squash: Any = None) -> Any:
+    """Wrap `data` in `NestedDict` objects, calling `squash` on each of them once it's built."""
+    if not isinstance(data, (dict, list)):
+        return data
+    items = dict(enumerate(data)) if isinstance(data, list) else data
+    nested = {str(key): _unsquashed(value, squash) for key, value in items.items()}
+    node = NestedDict._from_data(nested, isinstance(data, list))
+    if squash:
+        squash(node)
+    return node
+
+
+def _old_squash(nested: NestedDict) -> None:
+    """Squash `nested` as `NestedDict.squash` did before the single-pass builder.
+
+    Each value is squashed, popped, and set again, so it goes into the first key (in the current
+    order) that it equals or extends.
+    """
+    for key, value in list(nested._items()):
+        if isinstance(value, NestedDict):
+            _old_squash(value)
+        data = nested._as_dict()
+        if data is not nested._as_dict():
+            continue  # note: the items of a `list` are keyed by index, so they stay in place
+        data.pop(key)
+        nested[key] = value
+
+
+def _random_tree(rng: random.Random, depth: int = 2) -> dict[str, Any]:
+    """Generate a small tree with overlapping flattened keys."""
+    leaves: list[Any] = [True, [], [1, 2], {}]
+    tree: dict[str, Any] = {}
+    for _ in range(rng.randint(1, 4)):
+        key = "_".join(rng.choice("AB") for _ in range(rng.randint(1, 3)))
+        tree[key] = _random_tree(rng, depth - 1) if depth and rng.random() < 0.5 else leaves[
+            rng.randrange(len(leaves))
+        ]
+    return tree
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"B": {"A_B_A": True}, "B_A": {}},
+        {"B_A": {}, "B": {"A_B_A": True}},
+        {"A": {"A_B": []}, "A_A": [1, 2]},
+        {"A_A": [1, 2], "A": {"A_B": []}},
+        {"A_B_X": 1, "A": {"Z": 3}, "A_B": {"Y": 2}},
+        *(_random_tree(random.Random(seed)) for seed in range(300)),
+    ],
+)
+def test_squash_matches_recursive_squash(data: dict[str, Any]) -> None:
+    """The single-pass squash builds the same tree as the recursive squash it replaced."""
+    try:
+        built, squashed = _unsquashed(data, _old_squash), _unsquashed(data)
+        _old_squash(squashed)
+    except TypeError:
+        pytest.skip("flattened keys extend a scalar, which the recursive squash rejected")
+
+    assert NestedDict(data).serialize() == built.serialize()
+    nested = _unsquashed(data)
+    nested.squash()
+    assert nested.serialize() == squashed.serialize()
+
+
+def test_merge_matches_chained_or(configuration: dict[str, Any]) -> None:
+    """A k-way merge produces the same tree as chaining `|`, without mutating any layer."""
+    layers = [
+        NestedDict(configuration),
+        NestedDict({"APP_NAME_ATTR_B_K": 1, "APP_NAME_ATTR_C": {"NEW": True}}),
+        NestedDict({"APP_NAME_ATTR_A": [9], "APP_NAME": {"ATTR_B": {"L": 2}}}),
+    ]
+    snapshots = [layer.serialize() for layer in layers]
+
+    chained = layers[0] | layers[1] | layers[2]
+    assert NestedDict.merge(*layers).serialize() == chained.serialize()
+    assert [layer.serialize() for layer in layers] == snapshots
+
+
+def test_merge_list_mismatch() -> None:
+    """Lists and mappings cannot be merged."""
+    with pytest.raises(TypeError):
+        NestedDict.merge({"A": 1}, [1, 2])
+
+
+@pytest.mark.parametrize(
+    "new",
+    [
+        {"APP_NAME_ATTR_A": [1, 2], "APP_NAME_ATTR_B": {"K": "V", "L": [True]}},
+        {"APP_NAME_ATTR_A": {"0": 1}, "APP_NAME_EXAMPLE_PARAM": 1.0, "APP_NAME_ATTR_B_K": True},
+        {},
+    ],
+)
+def test_patch_reproduces_diff(configuration: dict[str, Any], new: dict[str, Any]) -> None:
+    """Applying the diff between two trees turns the first into the second."""
+    old, target = NestedDict(configuration), NestedDict(new)
+    old.apply_patch(old.diff(target))
+    assert old.serialize() == target.serialize()
+    assert not old.diff(target)
+
+
+@pytest.mark.parametrize(
+    ("old", "new"), [({"A": {}}, {"A": []}), ({"A": {"0": 1}}, {"A": [1]}), ({"A": [1]}, {"A": {}})]
+)
+def test_diff_container_kind(old: dict[str, Any], new: dict[str, Any]) -> None:
+    """Replacing a mapping with a list (or vice versa) is a change, even if they compare equal."""
+    nested_dict = NestedDict(old)
+    changes = nested_dict.diff(NestedDict(new))
+    assert [(change.op, change.key) for change in changes] == [("change", "A")]
+
+    nested_dict.apply_patch(changes)
+    assert nested_dict.serialize() == new
+
+
+def test_patch_missing_path() -> None:
+    """Patches must refer to existing containers."""
+    with pytest.raises(KeyError):
+        NestedDict({"A": 1}).apply_patch([NestedChange("add", ("A", "B"), 2)])
+
+
+def test_get_many_matches_getitem(configuration: dict[str, Any]) -> None:
+    """Batch lookups return the same values as `__getitem__`, and report the missing keys."""
+    nested_dict = NestedDict(configuration)
+    keys = list(nested_dict.keys())
+    found, missing = nested_dict.get_many([*keys, "APP_NAME_MISSING", "APP_NAME_ATTR_B_"])
+
+    assert found == {key: nested_dict[key] for key in keys}
+    assert missing == {"APP_NAME_MISSING", "APP_NAME_ATTR_B_"}
+    assert nested_dict.get_many([]) == ({}, set())
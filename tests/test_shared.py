@@ -0,0 +1,124 @@
+"""Verify the settings snapshots of `pyspry.shared`."""
+from __future__ import annotations
+
+# stdlib
+import datetime
+import os
+import sys
+from pathlib import Path
+
+# third party
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+# local
+from pyspry import shared
+from pyspry.base import ConfigLoader, Settings, SettingsContainer, bootstrap_module
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture()
+def loader(monkeypatch: MonkeyPatch) -> ConfigLoader:
+    """Configure the loader for `sample-config.yml` with environment variables."""
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, "sample-config.yml")
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "PYSPRY")
+    monkeypatch.setenv("PYSPRY_LOGGING_version", "2")
+    return ConfigLoader.create()
+
+
+@pytest.fixture()
+def snapshot(loader: ConfigLoader, tmp_path: Path) -> shared.SharedSettings:
+    """Publish the settings of `loader`, then map the snapshot."""
+    return shared.SharedSettings(shared.publish(tmp_path / "settings.pyspry", loader))
+
+
+def test_snapshot_matches_settings(loader: ConfigLoader, snapshot: shared.SharedSettings) -> None:
+    """The snapshot resolves the same names to the same values as the settings."""
+    settings = loader.read_settings()
+
+    assert set(dir(snapshot)) == set(dir(settings))
+    for name in dir(settings):
+        assert getattr(snapshot, name) == getattr(settings, name), name
+        assert name in snapshot
+
+
+def test_snapshot_serialize(loader: ConfigLoader, snapshot: shared.SharedSettings) -> None:
+    """The snapshot serializes like the settings, and rejects missing names."""
+    settings = loader.read_settings()
+
+    assert snapshot.PYSPRY_TEST_RUNNER == settings.TEST_RUNNER
+    assert snapshot.serialize() == settings.serialize()
+    assert snapshot.settings().serialize() == settings.serialize()
+    assert "MISSING" not in snapshot
+    with pytest.raises(AttributeError, match="PYSPRY_MISSING"):
+        _ = snapshot.MISSING
+
+
+def test_snapshot_values(tmp_path: Path) -> None:
+    """Leaves keep their types, and containers are decoded into new objects on every access."""
+    config = {
+        "APP_DATE": datetime.date(2024, 2, 29),
+        "APP_A": {"B": [1, {"C": None}], "D_E": 2.5},
+        "APP_A_F": "flattened",
+    }
+    settings = Settings(config, {}, "APP")
+    snapshot = shared.SharedSettings(shared.write_snapshot(tmp_path / "values.pyspry", settings))
+
+    assert snapshot.DATE == datetime.date(2024, 2, 29)
+    assert snapshot.A == settings.A
+    assert snapshot.A_B_1_C is None and snapshot.A_D_E == 2.5
+    snapshot.A["B"].append(3)
+    assert snapshot.A_B == [1, {"C": None}]
+
+    (tmp_path / "invalid.pyspry").write_bytes(b"not a snapshot" * 4)
+    with pytest.raises(ValueError, match="unsupported"):
+        shared.SharedSettings(tmp_path / "invalid.pyspry")
+
+
+def test_untrusted_snapshot_replaced(loader: ConfigLoader, tmp_path: Path) -> None:
+    """Snapshots that others can modify are never mapped, but published again."""
+    path = shared.publish(tmp_path / "settings.pyspry", loader)
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    path.chmod(0o666)
+    with pytest.raises(PermissionError, match="untrusted"):
+        shared.SharedSettings(path)
+    module = shared.load_shared(path, "__shared_settings", loader)
+    assert module is not None and module.LOGGING_version == 2
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_stale_snapshot_republished(
+    loader: ConfigLoader, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """A change to the environment makes the snapshot stale, so it is published again."""
+    path = tmp_path / "settings.pyspry"
+    module = shared.load_shared(path, "__shared_settings", loader)
+    assert module is not None and module.LOGGING_version == 2
+
+    monkeypatch.setenv("PYSPRY_LOGGING_version", "3")
+    module = shared.load_shared(path, "__shared_settings", loader)
+    assert module is not None and module.LOGGING_version == 3
+    assert "LOGGING_version" in dir(module)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+def test_bootstrap_shared_across_fork(
+    loader: ConfigLoader, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Forked processes read the snapshot that the parent mapped, without loading the config."""
+    path = tmp_path / "settings.pyspry"
+    monkeypatch.setenv(ConfigLoader.VARNAME_SHARED_PATH, str(path))
+    monkeypatch.delitem(sys.modules, "__bootstrapped_shared", raising=False)
+
+    module = bootstrap_module("__bootstrapped_shared")
+    assert not isinstance(module, SettingsContainer)
+    assert sys.modules["__bootstrapped_shared"] is module and path.is_file()
+
+    monkeypatch.setattr(ConfigLoader, "read_settings", pytest.fail)
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os._exit(int(module.LOGGING_version != 2))
+    assert os.waitpid(pid, 0)[1] == 0
+    del sys.modules["__bootstrapped_shared"]
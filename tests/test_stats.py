@@ -0,0 +1,113 @@
+"""Test the load instrumentation in `pyspry.stats`."""
+from __future__ import annotations
+
+# stdlib
+from pathlib import Path
+from typing import Iterator
+
+# third party
+import pytest
+from _pytest.logging import LogCaptureFixture
+from _pytest.monkeypatch import MonkeyPatch
+
+# local
+from pyspry import stats
+from pyspry.base import ConfigLoader
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture()
+def reported() -> Iterator[list[stats.LoadStats]]:
+    """Collect the statistics reported to a registered hook."""
+    collected: list[stats.LoadStats] = []
+    hook = stats.register_hook(collected.append)
+    yield collected
+    stats.unregister_hook(hook)
+
+
+@pytest.fixture()
+def paths(monkeypatch: MonkeyPatch, tmp_path: Path) -> list[Path]:
+    """Configure the loader to read a YAML and a JSON file, and an environment variable."""
+    paths = [tmp_path / "base.yml", tmp_path / "override.json"]
+    paths[0].write_text("APP_A: {B: 1, C: [1, 2]}\nOTHER: 0\n")
+    paths[1].write_text('{"APP_D": 2}')
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str([str(path) for path in paths]))
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "APP")
+    monkeypatch.setenv("APP_E", '{"F": {"G": 3}}')
+    return paths
+
+
+def _phase_names(load_stats: stats.LoadStats, source: Path) -> list[str]:
+    return [phase.name for phase in load_stats.phases if phase.source == str(source)]
+
+
+def test_loader_phases(paths: list[Path], reported: list[stats.LoadStats]) -> None:
+    """Each config file is recorded, and the statistics are reported."""
+    settings = ConfigLoader.create().read_settings()
+
+    assert reported == [settings.load_stats]
+    assert _phase_names(reported[0], paths[0]) == ["read", "parse"]
+    assert _phase_names(reported[0], paths[1]) == ["read", "parse", "prefix_filter"]
+
+
+@pytest.mark.usefixtures("paths")
+def test_loader_merge_phases(reported: list[stats.LoadStats]) -> None:
+    """The environment and the final merge are recorded after the config files."""
+    ConfigLoader.create().read_settings()
+    load_stats = reported[0]
+
+    # the environment layer is decoded and merged, then merged with the files
+    assert [phase.name for phase in load_stats.phases[-6:]] == [
+        "env_scan",
+        "build",
+        "json_decode",
+        "merge",
+        "merge",
+        "build",
+    ]
+    assert (load_stats.keys, load_stats.depth) == (5, 3)
+    assert load_stats.serialize()["seconds"] == pytest.approx(sum(load_stats.totals().values()))
+
+
+def test_merge_layers_phases(
+    monkeypatch: MonkeyPatch, tmp_path: Path, reported: list[stats.LoadStats]
+) -> None:
+    """Merging reloaded layers records the environment and merge phases, like a full load."""
+    path = tmp_path / "config.yml"
+    path.write_text("APP_A: 1\n")
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str(path))
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "APP")
+    loader = ConfigLoader.create()
+
+    settings = loader.merge_layers([loader.read_layer(path)])
+
+    assert settings.A == 1
+    assert reported == [settings.load_stats]
+    assert [phase.name for phase in reported[0].phases][-2:] == ["merge", "build"]
+    assert "env_scan" in [phase.name for phase in reported[0].phases]
+
+
+def test_loader_disabled_by_default(monkeypatch: MonkeyPatch) -> None:
+    """Without the environment variable or any hooks, nothing is recorded."""
+    monkeypatch.delenv(ConfigLoader.VARNAME_LOAD_STATS, raising=False)
+    assert ConfigLoader.create().read_settings().load_stats is None
+
+    monkeypatch.setenv(ConfigLoader.VARNAME_LOAD_STATS, "true")
+    assert ConfigLoader.create().read_settings().load_stats is not None
+
+
+def test_failing_hook(caplog: LogCaptureFixture, reported: list[stats.LoadStats]) -> None:
+    """A failing hook is logged, and the other hooks are still called."""
+
+    @stats.register_hook
+    def fail(_: stats.LoadStats) -> None:
+        raise RuntimeError("metrics pipeline is down")
+
+    try:
+        settings = ConfigLoader.create().read_settings()
+    finally:
+        stats.unregister_hook(fail)
+
+    assert reported == [settings.load_stats]
+    assert "metrics pipeline is down" in caplog.text
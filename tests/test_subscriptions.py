@@ -0,0 +1,63 @@
+"""Verify the dispatch of setting changes to subscribers."""
+from __future__ import annotations
+
+# stdlib
+import logging
+
+# third party
+import pytest
+
+# local
+from pyspry.nested_dict import NestedChange
+from pyspry.subscriptions import SubscriptionIndex
+
+
+def _change(*path: str) -> NestedChange:
+    return NestedChange("change", path, 0)
+
+
+_PREFIXES = ["", "APP_DB", "APP_DB_", "APP_DBX"]
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("APP_DB_HOST", {"", "APP_DB", "APP_DB_"}),
+        ("APP_DB", {"", "APP_DB", "APP_DB_"}),
+        ("APP", {"", "APP_DB", "APP_DB_", "APP_DBX"}),
+        ("APP_CACHE", {""}),
+    ],
+)
+def test_match_by_prefix(key: str, expected: set[str]) -> None:
+    """Subscribers are matched by their prefix, and by the containers above their prefix."""
+    index = SubscriptionIndex()
+    for prefix in _PREFIXES:
+        index.subscribe(prefix, print)
+
+    assert {subscription.prefix for subscription in index.match(key)} == expected
+
+
+def test_unsubscribe() -> None:
+    """Removing every subscription empties the index; removing one twice is an error."""
+    index = SubscriptionIndex()
+    subscriptions = [index.subscribe(prefix, print) for prefix in _PREFIXES]
+
+    for subscription in subscriptions:
+        index.unsubscribe(subscription)
+    assert not index
+    with pytest.raises(ValueError):
+        index.unsubscribe(subscriptions[1])
+
+
+def test_dispatch_groups_changes(caplog: pytest.LogCaptureFixture) -> None:
+    """Each subscriber is called once with its changes, even if another subscriber fails."""
+    index = SubscriptionIndex()
+    received: list[list[str]] = []
+    index.subscribe("APP_A", lambda changes: 1 / 0)
+    index.subscribe("APP_A", lambda changes: received.append([c.key for c in changes]))
+
+    with caplog.at_level(logging.ERROR):
+        index.dispatch([_change("APP_A", "B"), _change("APP_C"), _change("APP_A_D")])
+
+    assert received == [["APP_A_B", "APP_A_D"]]
+    assert "subscriber to 'APP_A' failed" in caplog.text
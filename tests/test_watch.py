@@ -0,0 +1,136 @@
+"""Verify hot reloads of settings when their config files change."""
+from __future__ import annotations
+
+# stdlib
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+# third party
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+# local
+from pyspry.base import ConfigLoader, Settings, SettingsContainer
+from pyspry.nested_dict import NestedChange
+from pyspry.watch import FileMonitor, InotifyMonitor, PollingMonitor, SettingsWatcher
+
+# pylint: disable=redefined-outer-name
+
+
+def _inotify() -> Callable[[list[Path]], FileMonitor]:
+    try:
+        InotifyMonitor([]).close()
+    except OSError:
+        pytest.skip("inotify is not available")
+    return InotifyMonitor
+
+
+def _polling() -> Callable[[list[Path]], FileMonitor]:
+    return lambda paths: PollingMonitor(paths, poll_interval=0.01)
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture()
+def config_files(monkeypatch: MonkeyPatch, tmp_path: Path) -> list[Path]:
+    """Write two layered config files and point `ConfigLoader` at them."""
+    paths = [tmp_path / "base.yml", tmp_path / "override.yml"]
+    paths[0].write_text("APP_A: {B: 1, C: 2}\n")
+    paths[1].write_text("APP_A: {B: 3}\n")
+    monkeypatch.setenv(ConfigLoader.VARNAME_CONFIG_PATH, str([str(path) for path in paths]))
+    monkeypatch.setenv(ConfigLoader.VARNAME_VAR_PREFIX, "APP")
+    return paths
+
+
+def test_monitor_abstract() -> None:
+    """Monitors must implement `FileMonitor.wait`."""
+    with pytest.raises(TypeError):
+        FileMonitor([])  # type: ignore[abstract]
+
+
+@pytest.mark.parametrize("factory", [_inotify, _polling])
+def test_monitor_reports_changes(
+    factory: Callable[[], Callable[[list[Path]], FileMonitor]], tmp_path: Path
+) -> None:
+    """Monitors report modified and replaced files, but not unrelated files."""
+    watched, other = tmp_path / "watched.yml", tmp_path / "other.yml"
+    watched.write_text("A: 1\n")
+    monitor = factory()([watched])
+    try:
+        other.write_text("A: 2\n")
+        assert not monitor.wait(0.05)
+
+        replacement = tmp_path / "watched.yml.tmp"
+        replacement.write_text("A: 3\n")
+        os.replace(replacement, watched)
+        assert monitor.wait(1.0) == {str(watched)}
+    finally:
+        monitor.close()
+
+
+def test_container_reloads_changed_files(config_files: list[Path]) -> None:
+    """The container's settings are swapped, matching a full reload of all files."""
+    container = SettingsContainer("__watched_settings", None, ConfigLoader.create().read_settings())
+    watcher = container.watch(poll_interval=0.01, debounce=0.05, min_interval=0)
+    try:
+        assert container.A == {"B": 3, "C": 2}
+        config_files[1].write_text("APP_A: {B: 4}\n")
+        _wait_for(lambda: container.A_B == 4)
+    finally:
+        watcher.stop()
+
+    assert container.A == ConfigLoader.create().read_settings().A == {"B": 4, "C": 2}
+
+
+def test_reload_counts_changed_layers(config_files: list[Path]) -> None:
+    """`SettingsWatcher.reload` parses only the files it's given."""
+    container = SettingsContainer("__watched_settings", None, ConfigLoader.create().read_settings())
+    watcher = container.watch(poll_interval=0.01)
+    watcher.stop()
+
+    config_files[0].write_text("APP_A: {B: 1, C: 5}\n")
+    assert watcher.reload([str(config_files[0]), "/not/watched.yml"]) == 1
+    assert container.A == {"B": 3, "C": 5}
+
+
+def test_unchanged_reload_keeps_settings(config_files: list[Path]) -> None:
+    """Reloads that don't change any setting don't swap the settings."""
+    container = SettingsContainer("__watched_settings", None, ConfigLoader.create().read_settings())
+    swapped = [container.snapshot()]
+
+    def publish(settings: Settings) -> list[NestedChange]:
+        changes = container.publish(settings)
+        if changes:
+            swapped.append(container.snapshot())
+        return changes
+
+    watcher = SettingsWatcher(ConfigLoader.create(), publish, monitor=PollingMonitor([]))
+
+    config_files[1].write_text("APP_A:\n  B: 3\n")
+    assert watcher.reload([str(config_files[1])]) == 1
+    assert len(swapped) == 1
+
+    config_files[1].write_text("APP_A: {B: 4}\n")
+    watcher.reload([str(config_files[1])])
+    assert [settings.A_B for settings in swapped] == [3, 4]
+
+
+def test_reload_compares_with_container(config_files: list[Path]) -> None:
+    """Reloads are compared with the container's settings, including updates since the watch."""
+    container = SettingsContainer("__watched_settings", None, ConfigLoader.create().read_settings())
+    watcher = container.watch(poll_interval=0.01)
+    watcher.stop()
+    container.update(Settings({"APP_A": {"C": 5}}, {}, "APP"))
+    changes: list[NestedChange] = []
+    container.subscribe("A", changes.extend)
+
+    assert watcher.reload() == 0
+    assert container.A == {"B": 3, "C": 2}
+    assert changes == [NestedChange("change", ("APP_A", "C"), 2)]